@@ -0,0 +1,6 @@
+# =========================================
+# File: __init__.py
+# Description:
+#   Benchmark suite with JSON regression
+#   baselines; run with python -m benchmarks
+# =========================================
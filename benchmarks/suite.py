@@ -0,0 +1,273 @@
+# =========================================
+# File: suite.py
+# Description:
+#   Timing benchmarks for the conversion,
+#   arithmetic, rendering and circuit code,
+#   compared against saved JSON baselines
+# =========================================
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Slowdowns beyond this fraction of the baseline are reported as regressions
+DEFAULT_THRESHOLD = 0.20
+
+# Used by --save and --compare when no file is given
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+class Benchmark(NamedTuple):
+    """A named zero-argument callable to time."""
+    name: str
+    func: Callable[[], object]
+
+class Regression(NamedTuple):
+    """A benchmark that got slower than its baseline allows."""
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+def _quiet(func: Callable, *args) -> Callable[[], object]:
+    """Wrap a printing function so its output is discarded while timed."""
+    def run():
+        with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+            return func(*args)
+    return run
+
+def _call(func: Callable, *args) -> Callable[[], object]:
+    return lambda: func(*args)
+
+def _number_conversion_benchmarks() -> List[Benchmark]:
+    from core import number_conversion as nc
+
+    huge_int = (1 << 4000) - 1
+    huge_binary = '1' * 4096
+    # binary_to_decimal_float returns a float, which tops out near 2**1024
+    huge_fixed_point = '1' * 1000 + '.' + '1' * 64
+    sizes = {
+        'small': (5.75, 8, 4, '1011', '101.11', 8),
+        'medium': (123456.789, 32, 16, '1' * 32, '1' * 32 + '.' + '01' * 8, 64),
+        'huge': (huge_int, 4096, 0, huge_binary, huge_fixed_point, 4096),
+    }
+    benchmarks = []
+    for size, (value, int_bits, frac_bits, binary, fixed_point, width) in sizes.items():
+        bits = ('1101' * width)[:width]
+        benchmarks += [
+            Benchmark(f'decimal_to_binary_float/{size}', _call(nc.decimal_to_binary_float, value, int_bits, frac_bits)),
+            Benchmark(f'decimal_to_binary_exact/{size}',
+                      _call(nc.decimal_to_binary_exact, value, int_bits, frac_bits, nc.ROUND_HALF_EVEN)),
+            Benchmark(f'binary_to_decimal/{size}', _call(nc.binary_to_decimal, binary)),
+            Benchmark(f'binary_to_decimal_float/{size}', _call(nc.binary_to_decimal_float, fixed_point)),
+            Benchmark(f'group_bits/{size}', _call(nc.group_bits, bits)),
+            Benchmark(f'color_binary_groups/{size}', _call(nc.color_binary_groups, bits)),
+            Benchmark(f'format_bits/{size}', _call(nc.format_bits, int(bits, 2), width, 4, True)),
+            Benchmark(f'to_base32/{size}', _call(nc.to_base32, value)),
+            Benchmark(f'parse_number/{size}', _call(nc.parse_number, '0b' + binary, 2)),
+        ]
+    for fmt in ('binary16', 'binary32', 'binary64', 'binary128'):
+        benchmarks.append(Benchmark(f'to_ieee754/{fmt}', _call(nc.to_ieee754, 0.1, fmt)))
+    return benchmarks
+
+def _arithmetic_benchmarks() -> List[Benchmark]:
+    from python.number_conversion_interactive import perform_binary_arithmetic
+
+    benchmarks = []
+    for length in (4, 16, 64):
+        a = ('1101' * length)[:length]
+        b = ('1' + '0' * (length - 1))[:length // 2 or 1]
+        for operation in ('add', 'subtract', 'multiply', 'divide'):
+            benchmarks.append(Benchmark(f'perform_binary_arithmetic/{operation}/{length}',
+                                        _call(perform_binary_arithmetic, a, b, operation)))
+    return benchmarks
+
+def _renderer_benchmarks() -> List[Benchmark]:
+    import main
+    from python import signed_representations as signed
+
+    return [
+        Benchmark('show_decimal_to_binary_steps', _quiet(main.show_decimal_to_binary_steps, 1234.5625, 32)),
+        Benchmark('show_binary_to_decimal_steps', _quiet(main.show_binary_to_decimal_steps, '1101.101')),
+        Benchmark('show_ieee754_visualization/binary32', _quiet(main.show_ieee754_visualization, -6.75)),
+        Benchmark('show_ieee754_visualization/binary64', _quiet(main.show_ieee754_visualization, -6.75, 'binary64')),
+        Benchmark('show_multi_base_layout', _quiet(main.show_multi_base_layout, 1234.5625)),
+        Benchmark('show_number_representations', _quiet(signed.show_number_representations, -42, 8)),
+        Benchmark('show_carry_chain/add', _quiet(signed.show_carry_chain, '10110110', '01101101', 'add')),
+        Benchmark('show_carry_chain/subtract', _quiet(signed.show_carry_chain, '10110110', '01101101', 'subtract')),
+        Benchmark('show_overflow_cases', _quiet(signed.show_overflow_cases, 8)),
+    ]
+
+def _circuit_benchmarks() -> List[Benchmark]:
+    from core.bitvector import BitVector
+    from visualization import circuit_visualization as circuits
+    from visualization.adder_models import analyze_adder
+    from visualization.multipliers import analyze_multiplier, verify_multiplier
+    from visualization.timing import simulate_adder
+    from visualization.netlist import exhaustive_lanes
+    from visualization.verification import verify_adder
+
+    benchmarks = [
+        Benchmark('show_half_adder', _quiet(circuits.show_half_adder, 1, 1)),
+        Benchmark('show_full_adder', _quiet(circuits.show_full_adder, 1, 0, 1)),
+    ]
+    for width in (8, 64):
+        a = ('10' * width)[:width]
+        b = ('11' * width)[:width]
+        benchmarks.append(Benchmark(f'show_ripple_carry_adder/{width}',
+                                    _quiet(circuits.show_ripple_carry_adder, a, b)))
+    for width in (64, 100000):
+        a = BitVector(int('10' * (width // 2), 2), width)
+        b = BitVector((1 << width) - 1, width)
+        benchmarks.append(Benchmark(f'show_wide_ripple_carry_adder/{width}',
+                                    _quiet(circuits.show_wide_ripple_carry_adder, a, b, (0, 15))))
+    pairs = list(range(4096))
+    benchmarks.append(Benchmark('ripple_carry_adder_batch/16x4096',
+                                _call(circuits.ripple_carry_adder_batch, pairs, pairs[::-1], 16)))
+    words, mask = exhaustive_lanes(17)
+    benchmarks.append(Benchmark('ripple_carry_netlist/8/exhaustive',
+                                _call(circuits.ripple_carry_circuit(8).compile(), *words, mask)))
+    benchmarks.append(Benchmark('verify_adder/10', _call(verify_adder, 10)))
+    for design in ('carry-lookahead', 'kogge-stone'):
+        benchmarks.append(Benchmark(f'analyze_adder/{design}/1024', _call(analyze_adder, design, 1024)))
+    benchmarks.append(Benchmark('simulate_adder/ripple/256x200', _call(simulate_adder, 256, 'ripple', 200, 1)))
+    incremental = circuits.IncrementalRippleAdder(BitVector(int('10' * 2048, 2), 4096), BitVector(12345, 4096))
+    benchmarks.append(Benchmark('IncrementalRippleAdder.toggle/4096',
+                                _call(incremental.toggle, 'b', 1000)))
+    benchmarks.append(Benchmark('verify_multiplier/dadda/8', _call(verify_multiplier, 'dadda', 8)))
+    benchmarks.append(Benchmark('analyze_multiplier/wallace/32',
+                                _call(analyze_multiplier, 'wallace', 32, 'kogge-stone', None, False)))
+    return benchmarks
+
+def collect_benchmarks() -> List[Benchmark]:
+    """Build every benchmark in the suite."""
+    return (_number_conversion_benchmarks() + _arithmetic_benchmarks()
+            + _renderer_benchmarks() + _circuit_benchmarks())
+
+def time_benchmark(benchmark: Benchmark, repeat: int = 5, min_time: float = 0.05) -> float:
+    """Return the best time per call in seconds over repeat runs."""
+    timer = timeit.Timer(benchmark.func)
+    number = 1
+    while True:
+        # Grow the loop count until one run takes at least min_time
+        if timer.timeit(number) >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    return min(timer.repeat(repeat, number)) / number
+
+def run_benchmarks(pattern: str = '', repeat: int = 5, min_time: float = 0.05,
+                   progress: Optional[Callable[[str, float], None]] = None) -> Dict[str, float]:
+    """Time every benchmark whose name contains pattern."""
+    from core.cache import disable_cache, get_cache, set_cache
+    from core.terminal import RenderContext, get_render_context, set_render_context
+
+    # Measure the uncached, colored code paths wherever the output goes, then
+    # put back whatever cache and render context the caller had
+    saved_cache, saved_context = get_cache(), get_render_context()
+    disable_cache()
+    set_render_context(RenderContext(color=True))
+    try:
+        results = {}
+        for benchmark in collect_benchmarks():
+            if pattern not in benchmark.name:
+                continue
+            results[benchmark.name] = time_benchmark(benchmark, repeat, min_time)
+            if progress:
+                progress(benchmark.name, results[benchmark.name])
+        return results
+    finally:
+        set_cache(saved_cache)
+        set_render_context(saved_context)
+
+def save_baseline(results: Dict[str, float], path: str) -> None:
+    """Write results and the interpreter they were measured on as JSON."""
+    data = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def load_baseline(path: str) -> Dict[str, float]:
+    """Read the results of a baseline written by save_baseline."""
+    with open(path, encoding='utf-8') as f:
+        results = json.load(f)['results']
+    if not isinstance(results, dict):
+        raise ValueError("'results' is not a mapping of benchmark names to seconds")
+    return results
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """List benchmarks more than threshold slower than the baseline, worst first."""
+    regressions = [
+        Regression(name, baseline[name], current)
+        for name, current in results.items()
+        if isinstance(baseline.get(name), (int, float)) and baseline[name] > 0
+        and current > baseline[name] * (1 + threshold)
+    ]
+    return sorted(regressions, key=lambda r: r.ratio, reverse=True)
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+def main(argv=None) -> int:
+    """Run the suite; returns 1 if --compare finds regressions and 2 if its baseline is unusable."""
+    parser = argparse.ArgumentParser(description="BNSET benchmark suite")
+    parser.add_argument('-k', '--filter', default='', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=5, help="timing runs per benchmark (best is kept)")
+    parser.add_argument('--save', nargs='?', const=DEFAULT_BASELINE, metavar='FILE',
+                        help="write the results as a JSON baseline (default: benchmarks/baseline.json)")
+    parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE, metavar='FILE',
+                        help="compare against a JSON baseline and exit with status 1 on regressions")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown before flagging (default: {DEFAULT_THRESHOLD * 100:.0f}%%)")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except FileNotFoundError:
+            print(f"No baseline at {args.compare}: run `python -m benchmarks --save` first", file=sys.stderr)
+            return 2
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Cannot read baseline {args.compare}: {e}", file=sys.stderr)
+            return 2
+
+    def report(name: str, seconds: float) -> None:
+        line = f"{name:<50} {_format_time(seconds)}"
+        # Entries that are missing, zero or not numbers give no ratio
+        reference = baseline.get(name)
+        if isinstance(reference, (int, float)) and reference > 0:
+            line += f"  ({seconds / reference:5.2f}x baseline)"
+        print(line)
+
+    results = run_benchmarks(args.filter, args.repeat, progress=report)
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"\nBaseline written to {args.save}")
+    if args.compare:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression.name}: {_format_time(regression.baseline)} -> "
+                      f"{_format_time(regression.current)} ({regression.ratio:.2f}x)")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+# =========================================
+# File: batch_conversion.py
+# Description:
+#   NumPy-backed batch versions of the core
+#   number system conversions
+# =========================================
+
+import numpy as np
+from core.number_conversion import BinaryParseError
+
+MAX_INT_BITS = 64
+MAX_FRAC_BITS = 64
+
+IEEE754_FIELDS = np.dtype([
+    ('sign_value', np.uint8),
+    ('exponent_raw', np.uint8),
+    ('exponent_bias', np.int16),
+    ('mantissa_bits', np.uint32),
+    ('mantissa_value', np.float64),
+])
+
+_ZERO = ord('0')
+_ONE = ord('1')
+_DOT = ord('.')
+
+def _bit_matrix(words: np.ndarray, nbits: int) -> np.ndarray:
+    """Expand uint64 words into an (n, nbits) uint8 matrix, MSB first."""
+    shifts = np.arange(nbits - 1, -1, -1, dtype=np.uint64)
+    return ((words[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+
+def _split_fixed_point(values: np.ndarray, int_bits: int, frac_bits: int):
+    """Split values into wrapped integer words, fraction words and a has-fraction mask."""
+    int_mask = np.uint64((1 << int_bits) - 1)
+
+    if values.dtype.kind in 'iu':
+        positive = values > 0
+        if np.any(values[positive].astype(np.uint64) > int_mask):
+            raise ValueError(f"Value does not fit in {int_bits} integer bits")
+        # Two's complement wrapping falls out of the int64 -> uint64 cast
+        int_words = values.astype(np.uint64) & int_mask
+        frac_words = np.zeros(values.shape, dtype=np.uint64)
+        has_frac = np.zeros(values.shape, dtype=bool)
+        return int_words, frac_words, has_frac
+
+    values = values.astype(np.float64, copy=False)
+    if not np.all(np.isfinite(values)):
+        raise ValueError("Cannot convert NaN or infinity to binary")
+
+    # modf is exact: the fraction keeps the sign of the value
+    frac, whole = np.modf(values)
+    if np.any(whole >= 2.0 ** int_bits) or np.any(whole <= -2.0 ** 64):
+        raise ValueError(f"Value does not fit in {int_bits} integer bits")
+
+    negative = whole < 0
+    magnitude = np.abs(whole).astype(np.uint64)
+    int_words = np.where(negative, ~magnitude + np.uint64(1), magnitude) & int_mask
+
+    frac = np.abs(frac)
+    has_frac = frac != 0
+    # Doubling a float and subtracting 1 is exact, so the scalar bit loop
+    # is equivalent to floor(frac * 2**frac_bits)
+    frac_words = np.floor(np.ldexp(frac, frac_bits)).astype(np.uint64)
+    return int_words, frac_words, has_frac
+
+def decimal_to_binary_array(values, int_bits: int = 32, frac_bits: int = 4,
+                            packed: bool = False) -> np.ndarray:
+    """Convert an array of numbers to binary, matching decimal_to_binary_float.
+
+    Returns a fixed-width bytes array (dtype 'S') whose entries equal the
+    ASCII-encoded output of the scalar function. Entries without a fractional
+    part are shorter and padded with NUL bytes, exactly like NumPy pads any
+    other short 'S' value.
+
+    With packed=True, returns the bits (integer bits followed by fraction
+    bits, MSB first) as a np.packbits uint8 matrix with one row per value.
+    """
+    if not 1 <= int_bits <= MAX_INT_BITS:
+        raise ValueError(f"int_bits must be between 1 and {MAX_INT_BITS}")
+    if not 0 <= frac_bits <= MAX_FRAC_BITS:
+        raise ValueError(f"frac_bits must be between 0 and {MAX_FRAC_BITS}")
+
+    values = np.asarray(values)
+    shape = values.shape
+    int_words, frac_words, has_frac = _split_fixed_point(values.ravel(), int_bits, frac_bits)
+
+    bits = _bit_matrix(int_words, int_bits)
+    frac_matrix = _bit_matrix(frac_words, frac_bits)
+
+    if packed:
+        packed_bits = np.packbits(np.concatenate([bits, frac_matrix], axis=1), axis=1)
+        return packed_bits.reshape(shape + packed_bits.shape[-1:])
+
+    width = int_bits + 1 + frac_bits
+    chars = np.zeros((len(int_words), width), dtype=np.uint8)
+    chars[:, :int_bits] = bits + _ZERO
+    chars[:, int_bits] = _DOT
+    chars[:, int_bits + 1:] = frac_matrix + _ZERO
+    # The scalar function only appends ".fraction" when there is a fraction
+    chars[~has_frac, int_bits:] = 0
+
+    return chars.view(f'S{width}').reshape(shape)
+
+def _char_codes(data) -> np.ndarray:
+    """View binary literals as an (n, width) matrix of character codes."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = np.array(bytes(data).splitlines(), dtype='S')
+    else:
+        data = np.asarray(data)
+        if data.dtype.kind not in 'SU':
+            data = data.astype('U')
+    data = data.ravel()
+    if data.dtype.kind == 'S':
+        code_type = np.uint8
+    else:
+        code_type = np.uint32  # 'U' arrays are stored as UCS-4
+    width = data.dtype.itemsize // np.dtype(code_type).itemsize
+    if width == 0:
+        return np.zeros((len(data), 0), dtype=code_type)
+    return np.ascontiguousarray(data).view(code_type).reshape(len(data), width)
+
+def binary_to_decimal_array(data) -> np.ndarray:
+    """Parse many binary literals (optionally with a radix point) into float64.
+
+    Accepts a list of strings, a NumPy 'S' or 'U' array, or a bytes buffer
+    with one literal per line. Raises BinaryParseError pointing at the index
+    and offset of the first bad character.
+    """
+    codes = _char_codes(data)
+    count, width = codes.shape
+    if count == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    # NumPy pads short entries with NUL, so trailing zeros mark the length
+    present = codes != 0
+    lengths = np.where(present.any(axis=1), width - np.argmax(present[:, ::-1], axis=1), 0)
+    columns = np.arange(width)
+    in_literal = columns < lengths[:, None]
+
+    is_one = codes == _ONE
+    is_dot = codes == _DOT
+    bad = in_literal & ~(is_one | is_dot | (codes == _ZERO))
+    extra_dot = np.zeros_like(is_dot)
+    multiple = np.count_nonzero(is_dot, axis=1) > 1
+    if multiple.any():
+        extra_dot[multiple] = is_dot[multiple] & (np.cumsum(is_dot[multiple], axis=1) > 1)
+
+    errors = bad | extra_dot
+    empty = lengths == 0
+    if errors.any() or empty.any():
+        error_row = np.argmax(errors.any(axis=1)) if errors.any() else count
+        empty_row = np.argmax(empty) if empty.any() else count
+        if empty_row < error_row:
+            raise BinaryParseError(f"Empty binary literal at index {empty_row}",
+                                   index=int(empty_row), offset=0)
+        offset = int(np.argmax(errors[error_row]))
+        if extra_dot[error_row, offset]:
+            raise BinaryParseError(
+                f"Invalid binary format: multiple decimal points at index {error_row}, offset {offset}",
+                index=int(error_row), offset=offset)
+        char = chr(codes[error_row, offset])
+        raise BinaryParseError(
+            f"Invalid binary digit {char!r} at index {error_row}, offset {offset}",
+            index=int(error_row), offset=offset)
+
+    # Horner's rule one column at a time, vectorized over all literals;
+    # the radix point and NUL padding leave the accumulator untouched
+    digit_columns = np.ascontiguousarray((in_literal & ~is_dot).T)
+    one_columns = np.ascontiguousarray(is_one.T)
+    total = np.zeros(count, dtype=np.float64)
+    for digit, one in zip(digit_columns, one_columns):
+        total = np.where(digit, total * 2 + one, total)
+
+    point = np.where(is_dot.any(axis=1), np.argmax(is_dot, axis=1), lengths)
+    frac_digits = lengths - point - 1
+    return np.ldexp(total, -np.maximum(frac_digits, 0))
+
+def to_ieee754_array(values) -> np.ndarray:
+    """Decompose float32 values into IEEE-754 fields as a structured array.
+
+    A float32 input buffer is reinterpreted as uint32 without copying. Fields
+    match the numeric entries of to_ieee754; use ieee754_record to render the
+    string fields of a single element on demand.
+    """
+    bits = np.asarray(values, dtype=np.float32).view(np.uint32)
+
+    fields = np.empty(bits.shape, dtype=IEEE754_FIELDS)
+    fields['sign_value'] = bits >> 31
+    fields['exponent_raw'] = (bits >> 23) & 0xFF
+    fields['exponent_bias'] = fields['exponent_raw'].astype(np.int16) - 127
+    fields['mantissa_bits'] = bits & 0x7FFFFF
+    # 23 mantissa bits fit exactly in a float64
+    fields['mantissa_value'] = 1 + np.ldexp(fields['mantissa_bits'].astype(np.float64), -23)
+    return fields
+
+def ieee754_record(fields: np.ndarray, index=()) -> dict:
+    """Render one element of to_ieee754_array as a to_ieee754 dictionary."""
+    field = fields[index]
+    sign = format(int(field['sign_value']), '01b')
+    exponent = format(int(field['exponent_raw']), '08b')
+    mantissa = format(int(field['mantissa_bits']), '023b')
+    return {
+        'binary': sign + exponent + mantissa,
+        'sign': sign,
+        'exponent': exponent,
+        'mantissa': mantissa,
+        'sign_value': int(field['sign_value']),
+        'exponent_raw': int(field['exponent_raw']),
+        'exponent_bias': int(field['exponent_bias']),
+        'mantissa_value': float(field['mantissa_value'])
+    }
@@ -0,0 +1,129 @@
+# =========================================
+# File: bitvector.py
+# Description:
+#   Fixed-width bit pattern stored as a single
+#   Python int, with optional two's complement
+#   signedness
+# =========================================
+
+from typing import Iterator, Union
+
+class BitVector:
+    """A width-bit pattern backed by one int.
+
+    Bits are indexed LSB-first like hardware signals: bv[0] is the least
+    significant bit and bv[3:0]-style ranges are written bv[0:4]. The
+    pattern is always stored unsigned; signed only changes how int()
+    interprets the top bit. Instances are immutable and hashable; the
+    binary string is rendered on first use and cached.
+    """
+    __slots__ = ('value', 'width', 'signed', '_text')
+
+    def __init__(self, value: int = 0, width: int = None, signed: bool = False):
+        value = int(value)
+        if width is None:
+            if value < 0:
+                raise ValueError("A width is required for negative values")
+            width = max(1, value.bit_length() + signed)
+        if width <= 0:
+            raise ValueError("width must be positive")
+        # Immutable like int: the fields are set once, past __setattr__
+        object.__setattr__(self, 'value', value & ((1 << width) - 1))
+        object.__setattr__(self, 'width', width)
+        object.__setattr__(self, 'signed', signed)
+        object.__setattr__(self, '_text', None)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"BitVector is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"BitVector is immutable; cannot delete {name!r}")
+
+    def __reduce__(self):
+        # Rebuild through __init__ so pickle and copy never set slots directly
+        return (type(self), (self.value, self.width, self.signed))
+
+    @classmethod
+    def from_string(cls, text: str, signed: bool = False) -> 'BitVector':
+        """Parse a binary string (MSB first, optional 0b prefix and '_' separators)."""
+        digits = text[2:] if text.startswith(('0b', '0B')) else text
+        digits = digits.replace('_', '')
+        if not digits or digits.strip('01'):
+            raise ValueError(f"Invalid binary string: {text!r}")
+        # Base-2 parsing is linear and exempt from int()'s digit limit
+        return cls(int(digits, 2), len(digits), signed)
+
+    def to_int(self) -> int:
+        """Numeric value: two's complement if signed, otherwise unsigned."""
+        if self.signed and self.value >> (self.width - 1):
+            return self.value - (1 << self.width)
+        return self.value
+
+    __int__ = to_int
+    __index__ = to_int
+
+    def as_integer_ratio(self):
+        return self.to_int(), 1
+
+    def as_signed(self) -> 'BitVector':
+        """Reinterpret the same bits as two's complement."""
+        return BitVector(self.value, self.width, True)
+
+    def as_unsigned(self) -> 'BitVector':
+        """Reinterpret the same bits as unsigned."""
+        return BitVector(self.value, self.width, False)
+
+    def resize(self, width: int) -> 'BitVector':
+        """Truncate, or extend with zeros (unsigned) or copies of the sign bit (signed)."""
+        return BitVector(self.to_int(), width, self.signed)
+
+    def concat(self, *lower: 'BitVector') -> 'BitVector':
+        """Append vectors below this one: self becomes the most significant part."""
+        value, width = self.value, self.width
+        for part in lower:
+            value = (value << part.width) | part.value
+            width += part.width
+        return BitVector(value, width, self.signed)
+
+    def bit_count(self) -> int:
+        """Number of set bits."""
+        return bin(self.value).count('1')
+
+    def __len__(self) -> int:
+        return self.width
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, 'BitVector']:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.width)
+            if step != 1:
+                raise ValueError("BitVector slices must have step 1")
+            if stop <= start:
+                raise ValueError("BitVector slices must be non-empty")
+            return BitVector(self.value >> start, stop - start)
+        if key < 0:
+            key += self.width
+        if not 0 <= key < self.width:
+            raise IndexError("bit index out of range")
+        return (self.value >> key) & 1
+
+    def __iter__(self) -> Iterator[int]:
+        """Bits from least to most significant."""
+        # Walking the cached string keeps this linear for very wide vectors
+        return map(int, reversed(str(self)))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BitVector):
+            return NotImplemented
+        return (self.value, self.width, self.signed) == (other.value, other.width, other.signed)
+
+    def __hash__(self) -> int:
+        return hash((BitVector, self.value, self.width, self.signed))
+
+    def __str__(self) -> str:
+        if self._text is None:
+            object.__setattr__(self, '_text', format(self.value, f'0{self.width}b'))
+        return self._text
+
+    def __repr__(self) -> str:
+        digits = f"0b{self}" if self.width <= 64 else f"0x{self.value:x}"
+        return f"BitVector({digits}, width={self.width}{', signed=True' if self.signed else ''})"
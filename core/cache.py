@@ -0,0 +1,125 @@
+# =========================================
+# File: cache.py
+# Description:
+#   Opt-in bounded LRU cache for the core
+#   conversion functions, with hit, miss and
+#   eviction counters
+# =========================================
+
+import functools
+import struct
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional
+
+class CacheStats(NamedTuple):
+    """Counters for sizing the conversion cache."""
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry when full."""
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        # Imported here so that the disabled cache adds nothing to startup
+        import threading
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+# Shared by every memoized function; None means caching is off
+_cache: Optional[LRUCache] = None
+
+_MISSING = object()
+
+def enable_cache(maxsize: int = 1024) -> LRUCache:
+    """Turn on memoization of the core conversions with a fresh cache."""
+    global _cache
+    _cache = LRUCache(maxsize)
+    return _cache
+
+def disable_cache() -> None:
+    """Turn memoization off and drop all cached results."""
+    global _cache
+    _cache = None
+
+def get_cache() -> Optional[LRUCache]:
+    """Return the active cache, or None when caching is off."""
+    return _cache
+
+def set_cache(cache: Optional[LRUCache]) -> None:
+    """Install a cache returned by get_cache (None turns caching off)."""
+    global _cache
+    _cache = cache
+
+def cache_stats() -> Optional[CacheStats]:
+    """Return the current counters, or None when caching is off."""
+    return _cache.stats() if _cache is not None else None
+
+def _value_key(value) -> tuple:
+    # 1 == 1.0 == True and 0.0 == -0.0 hash alike but convert differently, and
+    # NaN never equals itself: floats are keyed by their bit pattern instead
+    if isinstance(value, float):
+        return (float, struct.pack('<d', value))
+    return (type(value), value)
+
+def memoize(func: Callable) -> Callable:
+    """Cache results of func(value, *args) in the shared LRU cache when enabled.
+
+    The key is the function, the value (with its type and the sign of zero)
+    and the remaining width/format arguments. Exceptions are not cached and
+    unhashable arguments bypass the cache. Dict results are copied so callers
+    cannot modify the cached entry.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(value, *args, **kwargs):
+        cache = _cache
+        if cache is None:
+            return func(value, *args, **kwargs)
+        key = (name, _value_key(value), args, tuple(sorted(kwargs.items())))
+        try:
+            result = cache.get(key, _MISSING)
+        except TypeError:
+            return func(value, *args, **kwargs)
+        if result is _MISSING:
+            result = func(value, *args, **kwargs)
+            cache.put(key, result)
+        return dict(result) if isinstance(result, dict) else result
+    return wrapper
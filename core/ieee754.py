@@ -0,0 +1,286 @@
+# =========================================
+# File: ieee754.py
+# Description:
+#   Parameterised IEEE-754 encode/decode for
+#   binary16, bfloat16, binary32, binary64
+#   and binary128
+# =========================================
+
+import math
+import struct
+from typing import NamedTuple, Union
+
+class FloatFormat(NamedTuple):
+    """Binary interchange format described by its field widths."""
+    name: str
+    title: str
+    exponent_bits: int
+    mantissa_bits: int
+
+    @property
+    def width(self) -> int:
+        return 1 + self.exponent_bits + self.mantissa_bits
+
+    @property
+    def bias(self) -> int:
+        return (1 << (self.exponent_bits - 1)) - 1
+
+    @property
+    def exponent_max(self) -> int:
+        """Raw exponent reserved for infinities and NaNs."""
+        return (1 << self.exponent_bits) - 1
+
+BINARY16 = FloatFormat('binary16', 'Half Precision', 5, 10)
+BFLOAT16 = FloatFormat('bfloat16', 'bfloat16', 8, 7)
+BINARY32 = FloatFormat('binary32', 'Single Precision', 8, 23)
+BINARY64 = FloatFormat('binary64', 'Double Precision', 11, 52)
+BINARY128 = FloatFormat('binary128', 'Quadruple Precision', 15, 112)
+
+FORMATS = {fmt.name: fmt for fmt in (BINARY16, BFLOAT16, BINARY32, BINARY64, BINARY128)}
+
+_DOUBLE_MANTISSA_BITS = 52
+
+def get_format(fmt: Union[str, FloatFormat]) -> FloatFormat:
+    """Look up a format by name, passing FloatFormat instances through."""
+    if isinstance(fmt, FloatFormat):
+        return fmt
+    try:
+        return FORMATS[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown IEEE-754 format: {fmt} (choose from {', '.join(FORMATS)})")
+
+def _double_bits(value: float) -> int:
+    return struct.unpack('!Q', struct.pack('!d', value))[0]
+
+def _convert_payload(payload: int, from_bits: int, to_bits: int) -> int:
+    """Move a NaN payload between mantissa widths, keeping its top (quiet) bits."""
+    if to_bits >= from_bits:
+        payload <<= to_bits - from_bits
+    else:
+        payload >>= from_bits - to_bits
+    # A payload of zero would turn the NaN into an infinity
+    return payload or 1 << (to_bits - 1)
+
+def encode(value, fmt: Union[str, FloatFormat] = 'binary32') -> int:
+    """Encode a number as the bit pattern of an IEEE-754 format.
+
+    Accepts int, float, Fraction and Decimal. Rounds to nearest, ties to
+    even, producing subnormals and infinities as needed. All arithmetic is
+    done on Python ints, so the result is exact for every format.
+    """
+    fmt = get_format(fmt)
+    mb = fmt.mantissa_bits
+
+    if isinstance(value, float):
+        negative = math.copysign(1.0, value) < 0
+        if math.isnan(value):
+            payload = _double_bits(value) & ((1 << _DOUBLE_MANTISSA_BITS) - 1)
+            mantissa = _convert_payload(payload, _DOUBLE_MANTISSA_BITS, mb)
+            return (negative << (fmt.width - 1)) | (fmt.exponent_max << mb) | mantissa
+        if math.isinf(value):
+            return (negative << (fmt.width - 1)) | (fmt.exponent_max << mb)
+    elif hasattr(value, 'is_nan'):  # Decimal
+        negative = value.is_signed()
+        if value.is_nan():
+            return (negative << (fmt.width - 1)) | (fmt.exponent_max << mb) | (1 << (mb - 1))
+        if value.is_infinite():
+            return (negative << (fmt.width - 1)) | (fmt.exponent_max << mb)
+    else:
+        negative = value < 0
+
+    sign = negative << (fmt.width - 1)
+    numerator, denominator = value.as_integer_ratio()
+    numerator = abs(numerator)
+    if numerator == 0:
+        return sign
+
+    # Find e with 2**e <= numerator/denominator < 2**(e+1)
+    exponent = numerator.bit_length() - denominator.bit_length()
+    if exponent >= 0:
+        if numerator < denominator << exponent:
+            exponent -= 1
+    elif numerator << -exponent < denominator:
+        exponent -= 1
+    # Below the normal range the exponent is pinned and precision drops
+    exponent = max(exponent, 1 - fmt.bias)
+
+    # One shift and one divide produce the rounded significand
+    shift = mb - exponent
+    if shift >= 0:
+        significand, remainder = divmod(numerator << shift, denominator)
+        divisor = denominator
+    else:
+        divisor = denominator << -shift
+        significand, remainder = divmod(numerator, divisor)
+    if 2 * remainder > divisor or (2 * remainder == divisor and significand & 1):
+        significand += 1
+        if significand == 1 << (mb + 1):
+            significand >>= 1
+            exponent += 1
+
+    if significand >> mb:
+        raw_exponent = exponent + fmt.bias
+        if raw_exponent >= fmt.exponent_max:
+            return sign | (fmt.exponent_max << mb)
+        return sign | (raw_exponent << mb) | (significand - (1 << mb))
+    return sign | significand
+
+def decode(bits: int, fmt: Union[str, FloatFormat] = 'binary32', exact: bool = False):
+    """Decode an IEEE-754 bit pattern.
+
+    Returns a float (rounded to double precision if needed), or with
+    exact=True a Fraction for finite values. NaN payloads are carried over
+    into the returned float.
+    """
+    fmt = get_format(fmt)
+    mb = fmt.mantissa_bits
+    negative = (bits >> (fmt.width - 1)) & 1
+    raw_exponent = (bits >> mb) & fmt.exponent_max
+    mantissa = bits & ((1 << mb) - 1)
+
+    if raw_exponent == fmt.exponent_max:
+        if mantissa == 0:
+            return -math.inf if negative else math.inf
+        payload = _convert_payload(mantissa, mb, _DOUBLE_MANTISSA_BITS)
+        double = (negative << 63) | (0x7FF << _DOUBLE_MANTISSA_BITS) | payload
+        return struct.unpack('!d', struct.pack('!Q', double))[0]
+
+    if raw_exponent == 0:
+        significand, exponent = mantissa, 1 - fmt.bias - mb
+    else:
+        significand, exponent = mantissa | (1 << mb), raw_exponent - fmt.bias - mb
+    if negative:
+        significand = -significand
+
+    if exact:
+        from fractions import Fraction
+        return Fraction(significand) * Fraction(2) ** exponent
+    if significand == 0:
+        return -0.0 if negative else 0.0
+    if mb <= _DOUBLE_MANTISSA_BITS:
+        # Exact: the significand fits in a double and the scale is a power of two
+        return math.ldexp(significand, exponent)
+    from fractions import Fraction
+    return float(Fraction(significand) * Fraction(2) ** exponent)
+
+def classify(bits: int, fmt: Union[str, FloatFormat] = 'binary32') -> str:
+    """Name the class of a bit pattern: zero, subnormal, normal, infinity or nan."""
+    fmt = get_format(fmt)
+    raw_exponent = (bits >> fmt.mantissa_bits) & fmt.exponent_max
+    mantissa = bits & ((1 << fmt.mantissa_bits) - 1)
+    if raw_exponent == fmt.exponent_max:
+        return 'nan' if mantissa else 'infinity'
+    if raw_exponent == 0:
+        return 'subnormal' if mantissa else 'zero'
+    return 'normal'
+
+def decompose(value, fmt: Union[str, FloatFormat] = 'binary32') -> dict:
+    """Split a number into IEEE-754 fields, using the keys of to_ieee754.
+
+    Adds 'format', 'bias' and 'category'. The hidden bit of mantissa_value is
+    0 for zeros and subnormals; formats wider than a double report it as an
+    exact Fraction.
+    """
+    fmt = get_format(fmt)
+    bits = encode(value, fmt)
+    binary = format(bits, f'0{fmt.width}b')
+    sign = binary[0]
+    exponent = binary[1:1 + fmt.exponent_bits]
+    mantissa = binary[1 + fmt.exponent_bits:]
+    category = classify(bits, fmt)
+
+    hidden = 0 if category in ('zero', 'subnormal') else 1
+    if fmt.mantissa_bits <= _DOUBLE_MANTISSA_BITS:
+        # Exact: the mantissa fits in a double and the divisor is a power of two
+        mantissa_value = hidden + int(mantissa, 2) / (1 << fmt.mantissa_bits)
+    else:
+        from fractions import Fraction
+        mantissa_value = hidden + Fraction(int(mantissa, 2), 1 << fmt.mantissa_bits)
+
+    return {
+        'binary': binary,
+        'sign': sign,
+        'exponent': exponent,
+        'mantissa': mantissa,
+        'sign_value': int(sign),
+        'exponent_raw': int(exponent, 2),
+        'exponent_bias': int(exponent, 2) - fmt.bias,
+        'mantissa_value': mantissa_value,
+        'format': fmt.name,
+        'bias': fmt.bias,
+        'category': category
+    }
+
+def _numpy_dtypes():
+    import numpy as np
+    return np, {
+        'binary16': (np.float16, np.uint16),
+        'binary32': (np.float32, np.uint32),
+        'binary64': (np.float64, np.uint64),
+    }
+
+def _nan_bits_array(np, doubles, fmt: FloatFormat, uint_type):
+    """Vectorized version of the NaN payload rule used by encode."""
+    raw = doubles.view(np.uint64)
+    payload = raw & np.uint64((1 << _DOUBLE_MANTISSA_BITS) - 1)
+    mb = fmt.mantissa_bits
+    payload = payload >> np.uint64(_DOUBLE_MANTISSA_BITS - mb)
+    payload = np.where(payload == 0, np.uint64(1 << (mb - 1)), payload)
+    sign = (raw >> np.uint64(63)) << np.uint64(fmt.width - 1)
+    return (sign | np.uint64(fmt.exponent_max << mb) | payload).astype(uint_type)
+
+def encode_array(values, fmt: Union[str, FloatFormat] = 'binary32'):
+    """Batch version of encode.
+
+    binary16, bfloat16, binary32 and binary64 run through NumPy and return
+    an unsigned integer array of matching width. Other formats (binary128)
+    fall back to the exact Python-int encoder and return an object array.
+    """
+    fmt = get_format(fmt)
+    np, dtypes = _numpy_dtypes()
+    if fmt.name not in dtypes and fmt is not BFLOAT16:
+        values = np.asarray(values, dtype=object)
+        return np.frompyfunc(lambda v: encode(v, fmt), 1, 1)(values)
+
+    doubles = np.asarray(values, dtype=np.float64)
+    nans = np.isnan(doubles)
+    with np.errstate(over='ignore'):
+        if fmt is BFLOAT16:
+            # Round to float32 with round-to-odd, then to bfloat16 with ties
+            # to even; the sticky odd bit stops double rounding errors
+            singles = doubles.astype(np.float32)
+            words = singles.view(np.uint32).copy()
+            back = singles.astype(np.float64)
+            adjust = (back != doubles) & ~nans & ((words & 1) == 0)
+            step = np.where(np.abs(back) > np.abs(doubles), np.uint32(0xFFFFFFFF), np.uint32(1))
+            words[adjust] += step[adjust]
+            words = words + np.uint32(0x7FFF) + ((words >> 16) & 1)
+            bits = (words >> 16).astype(np.uint16)
+            uint_type = np.uint16
+        else:
+            float_type, uint_type = dtypes[fmt.name]
+            bits = doubles.astype(float_type).view(uint_type)
+    if nans.any():
+        bits = bits.copy()
+        bits[nans] = _nan_bits_array(np, doubles[nans], fmt, uint_type)
+    return bits
+
+def decode_array(bits, fmt: Union[str, FloatFormat] = 'binary32', exact: bool = False):
+    """Batch version of decode.
+
+    Returns a float64 array; formats without a NumPy fast path (binary128)
+    are decoded exactly with Python ints, and exact=True returns an object
+    array of Fractions for them.
+    """
+    fmt = get_format(fmt)
+    np, dtypes = _numpy_dtypes()
+    if fmt is BFLOAT16:
+        words = np.asarray(bits, dtype=np.uint32) << 16
+        return words.view(np.float32).astype(np.float64)
+    if fmt.name in dtypes and not exact:
+        float_type, uint_type = dtypes[fmt.name]
+        return np.asarray(bits, dtype=uint_type).view(float_type).astype(np.float64)
+
+    patterns = np.asarray(bits, dtype=object)
+    decoded = np.frompyfunc(lambda b: decode(int(b), fmt, exact), 1, 1)(patterns)
+    return decoded if exact else decoded.astype(np.float64)
@@ -0,0 +1,146 @@
+# =========================================
+# File: instrumentation.py
+# Description:
+#   Opt-in registry of call counts, latency
+#   percentiles and input sizes for the
+#   public conversion and circuit functions
+# =========================================
+
+import functools
+import os
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+# Set to 1 before starting the tool to instrument functions as they are defined
+ENABLE_ENV = 'BNSET_INSTRUMENT'
+# Path the collected statistics are written to as JSON on exit
+DUMP_ENV = 'BNSET_STATS_FILE'
+
+# Latency percentiles are computed over this many most recent calls
+SAMPLE_SIZE = 1024
+
+def _input_size(args: tuple) -> Optional[int]:
+    """Size of the first argument: length of a string, bits of an integer."""
+    if not args:
+        return None
+    value = args[0]
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, int):
+        return value.bit_length()
+    return None
+
+def _percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class FunctionStats:
+    """Counters for one instrumented function."""
+    __slots__ = ('calls', 'total', 'samples', 'size_total', 'size_count', 'size_max')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+        self.size_total = 0
+        self.size_count = 0
+        self.size_max = 0
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        return {
+            'calls': self.calls,
+            'total_ms': self.total * 1e3,
+            'mean_us': self.total / self.calls * 1e6,
+            'p50_us': _percentile(ordered, 0.50) * 1e6,
+            'p90_us': _percentile(ordered, 0.90) * 1e6,
+            'p99_us': _percentile(ordered, 0.99) * 1e6,
+            'max_us': ordered[-1] * 1e6,
+            'mean_input_size': self.size_total / self.size_count if self.size_count else None,
+            'max_input_size': self.size_max if self.size_count else None,
+        }
+
+class InstrumentationRegistry:
+    """Thread-safe collection of FunctionStats keyed by qualified function name."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._stats: Dict[str, FunctionStats] = {}
+        # threading is only imported once statistics can be recorded
+        self._lock = self._new_lock() if enabled else None
+
+    @staticmethod
+    def _new_lock():
+        import threading
+        return threading.Lock()
+
+    def _guard(self):
+        if self._lock is None:
+            self._lock = self._new_lock()
+        return self._lock
+
+    def record(self, name: str, elapsed: float, size: Optional[int] = None) -> None:
+        with self._guard():
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = FunctionStats()
+            stats.calls += 1
+            stats.total += elapsed
+            stats.samples.append(elapsed)
+            if size is not None:
+                stats.size_total += size
+                stats.size_count += 1
+                stats.size_max = max(stats.size_max, size)
+
+    def reset(self) -> None:
+        with self._guard():
+            self._stats.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Summaries of every function called so far, slowest in total first."""
+        with self._guard():
+            summaries = {name: stats.summary() for name, stats in self._stats.items()}
+        return dict(sorted(summaries.items(), key=lambda item: item[1]['total_ms'], reverse=True))
+
+    def format_table(self) -> str:
+        """Render the snapshot as a text table."""
+        rows = [f"{'Function':<58} {'Calls':>7} {'Total ms':>10} {'p50 us':>9} {'p99 us':>9} {'Size':>7}"]
+        for name, s in self.snapshot().items():
+            size = f"{s['mean_input_size']:.0f}" if s['mean_input_size'] is not None else '-'
+            rows.append(f"{name:<58} {s['calls']:>7} {s['total_ms']:>10.3f} "
+                        f"{s['p50_us']:>9.1f} {s['p99_us']:>9.1f} {size:>7}")
+        return '\n'.join(rows)
+
+    def dump_json(self, path: str) -> None:
+        import json
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+            f.write('\n')
+
+REGISTRY = InstrumentationRegistry(enabled=os.environ.get(ENABLE_ENV, '') not in ('', '0'))
+
+def instrument(func: Callable) -> Callable:
+    """Time func in REGISTRY when instrumentation is enabled.
+
+    When it is disabled the function is returned unchanged, so there is no
+    per-call cost at all. Enabling therefore has to happen before the
+    instrumented modules are imported (normally via BNSET_INSTRUMENT=1).
+    """
+    if not REGISTRY.enabled:
+        return func
+    name = f"{func.__module__}.{func.__qualname__}"
+    record = REGISTRY.record
+    clock = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(name, clock() - start, _input_size(args))
+    return wrapper
+
+if REGISTRY.enabled and os.environ.get(DUMP_ENV):
+    import atexit
+    atexit.register(REGISTRY.dump_json, os.environ[DUMP_ENV])
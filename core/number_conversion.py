@@ -4,58 +4,103 @@
 #   Core functionality for number system conversions
 # =========================================
 
+import math
 import struct
-from typing import Tuple, List, Dict
-
-class Colors:
-    """ANSI color codes for terminal output."""
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    CYAN = '\033[96m'
-    MAGENTA = '\033[95m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+from typing import Tuple, List, Dict, Union
+from core.bitvector import BitVector
+from core.cache import memoize
+from core.instrumentation import instrument
+from core.terminal import Colors, get_render_context
 
+class BinaryParseError(ValueError):
+    """Invalid binary literal, with the location of the first bad character.
+
+    index is the position of the literal within a batch (None for a single
+    string) and offset is the character position within that literal.
+    """
+    def __init__(self, message: str, index: int = None, offset: int = None):
+        super().__init__(message)
+        self.index = index
+        self.offset = offset
+
+# The decimal module's rounding constants are these same strings; spelling them
+# out keeps decimal from being imported at startup
+ROUND_DOWN = 'ROUND_DOWN'
+ROUND_HALF_EVEN = 'ROUND_HALF_EVEN'
+ROUND_CEILING = 'ROUND_CEILING'
+ROUND_FLOOR = 'ROUND_FLOOR'
+ROUNDING_MODES = (ROUND_DOWN, ROUND_HALF_EVEN, ROUND_CEILING, ROUND_FLOOR)
+
+@instrument
+@memoize
 def decimal_to_binary_float(decimal_value: float, int_bits: int = 32, frac_bits: int = 4) -> str:
     """Convert decimal (including fractional) to binary string."""
-    int_part = int(decimal_value)
-    frac_part = abs(decimal_value - int_part)
-    
-    # Convert integer part
+    return decimal_to_binary_exact(decimal_value, int_bits, frac_bits)
+
+@instrument
+def decimal_to_binary_exact(value, int_bits: int = 32, frac_bits: int = 4,
+                            rounding: str = ROUND_DOWN) -> str:
+    """Convert a number to a fixed-point binary string using exact integer arithmetic.
+
+    Accepts int, float, Fraction and Decimal. All fraction bits come from one
+    big-integer shift and divide, so any frac_bits is exact. rounding is one of
+    the decimal module constants ROUND_DOWN (truncate), ROUND_HALF_EVEN,
+    ROUND_CEILING or ROUND_FLOOR; with ROUND_DOWN the output matches the
+    original bit-by-bit doubling loop.
+    """
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unsupported rounding mode: {rounding}")
+
+    numerator, denominator = value.as_integer_ratio()
+    negative = numerator < 0
+    scaled, remainder = divmod(abs(numerator) << frac_bits, denominator)
+
+    if remainder:
+        if rounding == ROUND_HALF_EVEN:
+            round_up = 2 * remainder > denominator or (2 * remainder == denominator and scaled & 1)
+        elif rounding == ROUND_CEILING:
+            round_up = not negative
+        elif rounding == ROUND_FLOOR:
+            round_up = negative
+        else:
+            round_up = False
+        scaled += round_up
+
+    # Integer part keeps its sign (two's complement); fraction bits are the magnitude
+    int_part = scaled >> frac_bits
+    if negative:
+        int_part = -int_part
     if int_part >= 0:
         int_str = format(int_part, f'0{int_bits}b')
     else:
-        # Handle negative numbers using two's complement
         max_val = (1 << int_bits)
         int_str = format((max_val + int_part) & (max_val - 1), f'0{int_bits}b')
-    
-    # Convert fractional part
-    if frac_part == 0:
+
+    if numerator % denominator == 0:
         return int_str
-    
-    frac_str = ""
-    for _ in range(frac_bits):
-        frac_part *= 2
-        if frac_part >= 1:
-            frac_str += "1"
-            frac_part -= 1
-        else:
-            frac_str += "0"
-    
+
+    frac_str = format(scaled & ((1 << frac_bits) - 1), f'0{frac_bits}b') if frac_bits else ''
     return f"{int_str}.{frac_str}"
 
-def binary_to_decimal(binary_str: str) -> int:
-    """Convert binary string to decimal, handling unsigned numbers."""
+@instrument
+def binary_to_decimal(binary_str: Union[str, BitVector]) -> int:
+    """Convert binary string to decimal, handling unsigned numbers.
+
+    A BitVector is read directly (two's complement if it is signed).
+    """
+    if isinstance(binary_str, BitVector):
+        return binary_str.to_int()
     return int(binary_str, 2)
 
-def binary_to_decimal_float(binary_str: str) -> float:
+@instrument
+def binary_to_decimal_float(binary_str: Union[str, BitVector]) -> float:
     """Convert binary string to decimal, handling fractional parts."""
+    if isinstance(binary_str, BitVector):
+        return float(binary_str.to_int())
     # Validate binary string
-    for c in binary_str.replace('.', ''):
-        if c not in '01':
-            raise ValueError("Invalid binary digit")
+    for offset, c in enumerate(binary_str):
+        if c not in '01.':
+            raise BinaryParseError(f"Invalid binary digit {c!r} at offset {offset}", offset=offset)
             
     if '.' not in binary_str:
         return float(binary_to_decimal(binary_str))
@@ -79,8 +124,19 @@ def binary_to_decimal_float(binary_str: str) -> float:
             
     return float(int_value) + frac_value
 
-def to_ieee754(value: float) -> dict:
-    """Convert a float to IEEE-754 single precision format."""
+@instrument
+@memoize
+def to_ieee754(value: float, fmt: str = 'binary32') -> dict:
+    """Convert a float to IEEE-754 format (single precision by default).
+
+    Other formats (binary16, bfloat16, binary64, binary128) are handled by
+    core.ieee754.decompose, which also reports the bias and value category.
+    """
+    if fmt != 'binary32':
+        # The format engine (and fractions) load on first use, not at startup
+        from core.ieee754 import decompose
+        return decompose(value, fmt)
+
     # Convert float to IEEE-754 binary representation
     binary = format(struct.unpack('!I', struct.pack('!f', value))[0], '032b')
     
@@ -93,7 +149,7 @@ def to_ieee754(value: float) -> dict:
     sign_value = int(sign)
     exponent_raw = int(exponent, 2)
     exponent_bias = exponent_raw - 127
-    mantissa_value = 1 + sum(int(b) * 2**-i for i, b in enumerate(mantissa, 1))
+    mantissa_value = 1 + int(mantissa, 2) / (1 << 23)  # Exact: 23 bits fit in a double
     
     return {
         'binary': binary,
@@ -106,81 +162,121 @@ def to_ieee754(value: float) -> dict:
         'mantissa_value': mantissa_value
     }
 
-def group_bits(binary: str, group_size: int = 4) -> str:
+_GROUP_COLORS = [Colors.BLUE, Colors.GREEN, Colors.YELLOW, Colors.MAGENTA]
+
+# (group_size, colored, first color, color stride) -> 256 pre-rendered byte strings
+_BYTE_TABLES: Dict[Tuple[int, bool, int, int], List[str]] = {}
+
+def _byte_table(group_size: int, colored: bool, first_color: int, stride: int) -> List[str]:
+    """Build (once) the grouped, optionally colored rendering of every byte value."""
+    key = (group_size, colored, first_color, stride)
+    table = _BYTE_TABLES.get(key)
+    if table is None:
+        table = []
+        for byte in range(256):
+            bits = format(byte, '08b')
+            groups = [bits[i:i+group_size] for i in range(0, 8, group_size)]
+            if colored:
+                groups = [f"{_GROUP_COLORS[(first_color + i * stride) % len(_GROUP_COLORS)]}{group}{Colors.ENDC}"
+                          for i, group in enumerate(groups)]
+            table.append(' '.join(groups))
+        _BYTE_TABLES[key] = table
+    return table
+
+def _format_bits(value: int, width: int, group_size: int, colored: bool, stride: int) -> str:
+    """Table-driven grouping; group n gets color n * stride (mod the palette size)."""
+    data = (value & ((1 << width) - 1)).to_bytes(width // 8, 'big')
+    if not colored:
+        table = _byte_table(group_size, False, 0, 0)
+        return ' '.join([table[byte] for byte in data])
+    # Consecutive bytes may start at different colors; the pattern repeats every period bytes
+    step = (8 // group_size) * stride
+    period = len(_GROUP_COLORS) // math.gcd(len(_GROUP_COLORS), step)
+    tables = [_byte_table(group_size, True, (k * step) % len(_GROUP_COLORS), stride) for k in range(period)]
+    return ' '.join([tables[k % period][byte] for k, byte in enumerate(data)])
+
+@instrument
+def format_bits(value: int, width: int, group_size: int = 4, colored: bool = False, stride: int = 1) -> str:
+    """Render the low width bits of an integer grouped (and colored) like group_bits.
+
+    width must be a multiple of 8 and group_size must divide 8; each byte is
+    then looked up in a precomputed 256-entry table and joined once. Group n
+    gets color n * stride, so stride=group_size colors by digit offset the way
+    color_binary_groups does for a number without a radix point.
+    """
+    if width % 8 or 8 % group_size:
+        raise ValueError("format_bits needs a width that is a multiple of 8 and a group size dividing 8")
+    return _format_bits(value, width, group_size, colored, stride)
+
+def _group_part(bits: str, group_size: int, colored: bool, stride: int = 1) -> str:
+    """Group one run of digits, taking the byte-table path when the shape allows it."""
+    if bits and len(bits) % 8 == 0 and 8 % group_size == 0 and not bits.strip('01'):
+        return _format_bits(int(bits, 2), len(bits), group_size, colored, stride)
+    if colored:
+        return ' '.join(f"{_GROUP_COLORS[(i * stride) % len(_GROUP_COLORS)]}{bits[chunk:chunk+group_size]}{Colors.ENDC}"
+                        for i, chunk in enumerate(range(0, len(bits), group_size))).strip()
+    return ' '.join(bits[i:i+group_size] for i in range(0, len(bits), group_size)).strip()
+
+def _group_vector(bits: BitVector, group_size: int, colored: bool, stride: int) -> str:
+    """Group a BitVector, going straight from its int to the byte tables when possible."""
+    if bits.width % 8 == 0 and 8 % group_size == 0:
+        return _format_bits(bits.value, bits.width, group_size, colored, stride)
+    return _group_part(str(bits), group_size, colored, stride)
+
+@instrument
+def group_bits(binary: Union[str, BitVector], group_size: int = 4) -> str:
     """Group binary digits for easier reading."""
+    if isinstance(binary, BitVector):
+        return _group_vector(binary, group_size, False, 1)
     if '.' in binary:
         int_part, frac_part = binary.split('.')
-        grouped_int = ' '.join(int_part[i:i+group_size] for i in range(0, len(int_part), group_size)).strip()
-        grouped_frac = ' '.join(frac_part[i:i+group_size] for i in range(0, len(frac_part), group_size)).strip()
-        return f"{grouped_int}.{grouped_frac}"
-    return ' '.join(binary[i:i+group_size] for i in range(0, len(binary), group_size)).strip()
-
-def color_binary_groups(binary: str, group_size: int = 4) -> str:
-    """Group binary digits with alternating colors."""
-    colors = [Colors.BLUE, Colors.GREEN, Colors.YELLOW, Colors.MAGENTA]
+        return f"{_group_part(int_part, group_size, False)}.{_group_part(frac_part, group_size, False)}"
+    return _group_part(binary, group_size, False)
+
+@instrument
+def color_binary_groups(binary: Union[str, BitVector], group_size: int = 4) -> str:
+    """Group binary digits with alternating colors.
+
+    When the render context has color off (not a TTY, NO_COLOR, TERM=dumb)
+    this is group_bits, so no escape codes are built at all.
+    """
+    if not get_render_context().color:
+        return group_bits(binary, group_size)
+    if isinstance(binary, BitVector):
+        return _group_vector(binary, group_size, True, group_size)
     if '.' in binary:
         int_part, frac_part = binary.split('.')
-        # Color integer part
-        grouped_int = ''
-        for i, chunk in enumerate(range(0, len(int_part), group_size)):
-            group = int_part[chunk:chunk+group_size]
-            color = colors[i % len(colors)]
-            grouped_int += f"{color}{group}{Colors.ENDC} "
-        # Color fractional part
-        grouped_frac = ''
-        for i, chunk in enumerate(range(0, len(frac_part), group_size)):
-            group = frac_part[chunk:chunk+group_size]
-            color = colors[i % len(colors)]
-            grouped_frac += f"{color}{group}{Colors.ENDC} "
-        return f"{grouped_int.strip()}.{grouped_frac.strip()}"
-    return ' '.join(f"{colors[i % len(colors)]}{binary[i:i+group_size]}{Colors.ENDC}" 
-                   for i in range(0, len(binary), group_size)).strip()
-
-def to_base32(value: float) -> str:
+        return f"{_group_part(int_part, group_size, True)}.{_group_part(frac_part, group_size, True)}"
+    # Without a radix point the color follows the digit offset, not the group number
+    return _group_part(binary, group_size, True, stride=group_size)
+
+@instrument
+@memoize
+def to_base32(value: Union[float, BitVector]) -> str:
     """Convert a number to base32 representation using standard alphabet (0-9, A-V).
     
     For values 0-9, uses decimal digits.
     For values 10-31, uses letters A-V.
+    A BitVector is converted from its numeric value.
     """
+    if isinstance(value, BitVector):
+        value = value.to_int()
     if value < 0:
         raise ValueError("Negative numbers not supported in base32 conversion")
     
-    def digit_to_base32(n: int) -> str:
-        if n < 0 or n >= 32:
-            raise ValueError(f"Invalid base32 digit: {n}")
-        if n < 10:
-            return str(n)
-        return chr(ord('A') + (n - 10))
-    
-    int_part = int(value)
-    frac_part = value - int_part
-    
-    # Convert integer part
-    if int_part == 0:
-        base32_int = "0"
-    else:
-        base32_int = ""
-        while int_part > 0:
-            base32_int = digit_to_base32(int_part % 32) + base32_int
-            int_part //= 32
-    
-    # Convert fractional part (up to 6 base32 digits)
-    if frac_part == 0:
-        return base32_int
-        
-    base32_frac = ""
-    for _ in range(6):
-        frac_part *= 32
-        digit = int(frac_part)
-        base32_frac += digit_to_base32(digit)
-        frac_part -= digit
-        if frac_part == 0:
-            break
-    
-    return f"{base32_int}.{base32_frac}"
+    from core.radix import get_codec
+    # Integer part plus up to 6 fractional base32 digits
+    return get_codec('base32').encode(value, frac_digits=6)
 
-def parse_number(value: str, base: int = 10) -> int:
-    """Parse a number string in given base, handling binary format."""
+@instrument
+def parse_number(value: Union[str, BitVector], base: int = 10) -> int:
+    """Parse a number string in given base, handling binary format.
+
+    A BitVector already holds its value and is returned as an int
+    (two's complement if it is signed); base is ignored for it.
+    """
+    if isinstance(value, BitVector):
+        return value.to_int()
     # Remove prefix if present
     if base == 2 and value.startswith(('0b', '0B')):
         value = value[2:]
@@ -0,0 +1,336 @@
+# =========================================
+# File: radix.py
+# Description:
+#   Divide-and-conquer conversion between
+#   big integers and digit strings in any
+#   base from 2 to 36, and base 64
+# =========================================
+
+from typing import Dict, List, Tuple
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+BASE64_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+# Digits handled by the schoolbook loop at the bottom of the recursion
+_LEAF_DIGITS = 32
+# Below this many bits the decimal module converts an int directly
+_DECIMAL_LEAF_BITS = 2048
+# Quotients shorter than this many bits use the built-in divmod
+_DIVMOD_LEAF_BITS = 4096
+
+# base -> [base**_LEAF_DIGITS, base**(2*_LEAF_DIGITS), base**(4*_LEAF_DIGITS), ...]
+_POWERS: Dict[int, List[int]] = {}
+_DECIMAL_POWERS_OF_TWO: Dict[int, 'decimal.Decimal'] = {}
+
+def default_alphabet(base: int) -> str:
+    """Return the standard digit alphabet for a base (0-9A-Z, or RFC 4648 base64)."""
+    if base == 64:
+        return BASE64_ALPHABET
+    if not 2 <= base <= 36:
+        raise ValueError(f"Unsupported base: {base} (use 2-36 or 64)")
+    return DIGITS[:base]
+
+def _power(base: int, level: int) -> int:
+    """Return base ** (_LEAF_DIGITS * 2**level), squaring cached powers as needed."""
+    powers = _POWERS.setdefault(base, [base ** _LEAF_DIGITS])
+    while len(powers) <= level:
+        powers.append(powers[-1] * powers[-1])
+    return powers[level]
+
+def _check_alphabet(base: int, alphabet: str) -> str:
+    if alphabet is None:
+        return default_alphabet(base)
+    if len(alphabet) != base or len(set(alphabet)) != base:
+        raise ValueError(f"Alphabet for base {base} must have {base} distinct characters")
+    return alphabet
+
+# (bits per digit, alphabet) -> {bit group: character}
+_BIT_TABLES: Dict[Tuple[int, str], Dict[str, str]] = {}
+_BUILTIN_FORMATS = {(2, DIGITS[:2]): 'b', (8, DIGITS[:8]): 'o', (16, DIGITS[:16]): 'X'}
+
+def _bit_table(bits_per_digit: int, alphabet: str) -> Dict[str, str]:
+    key = (bits_per_digit, alphabet)
+    table = _BIT_TABLES.get(key)
+    if table is None:
+        table = {format(d, f'0{bits_per_digit}b'): c for d, c in enumerate(alphabet)}
+        _BIT_TABLES[key] = table
+    return table
+
+def _power_of_two_to_text(value: int, bits_per_digit: int, alphabet: str) -> str:
+    """Linear-time conversion by slicing the binary string into digit-sized chunks."""
+    spec = _BUILTIN_FORMATS.get((len(alphabet), alphabet))
+    if spec is not None:
+        return format(value, spec)
+    bits = format(value, 'b')
+    bits = bits.zfill(-(-len(bits) // bits_per_digit) * bits_per_digit)
+    table = _bit_table(bits_per_digit, alphabet)
+    return ''.join([table[bits[i:i + bits_per_digit]] for i in range(0, len(bits), bits_per_digit)])
+
+def _decimal_to_text(value: int) -> str:
+    """Base 10 via the decimal module: split on bits, recombine with fast Decimal multiplies."""
+    import decimal
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+    def power_of_two(bits: int) -> decimal.Decimal:
+        if bits not in _DECIMAL_POWERS_OF_TWO:
+            _DECIMAL_POWERS_OF_TWO[bits] = context.power(decimal.Decimal(2), bits)
+        return _DECIMAL_POWERS_OF_TWO[bits]
+
+    def convert(n: int, bits: int) -> decimal.Decimal:
+        if bits <= _DECIMAL_LEAF_BITS:
+            return decimal.Decimal(n)
+        low_bits = bits >> 1
+        high = convert(n >> low_bits, bits - low_bits)
+        low = convert(n & ((1 << low_bits) - 1), low_bits)
+        return context.add(context.multiply(high, power_of_two(low_bits)), low)
+
+    return str(convert(value, value.bit_length()))
+
+def _div2n1n(a: int, b: int, n: int) -> Tuple[int, int]:
+    """Burnikel-Ziegler division of a < 2**(2n) by an n-bit b.
+
+    Recursing into half-size divisions turns the work into multiplications,
+    which CPython does with Karatsuba, instead of schoolbook long division.
+    """
+    if a.bit_length() - n <= _DIVMOD_LEAF_BITS:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a <<= 1
+        b <<= 1
+        n += 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b1, b2 = b >> half, b & mask
+    q1, r = _div3n2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+    q2, r = _div3n2n(r, a & mask, b, b1, b2, half)
+    if pad:
+        r >>= 1
+    return q1 << half | q2, r
+
+def _div3n2n(a12: int, a3: int, b: int, b1: int, b2: int, n: int) -> Tuple[int, int]:
+    """Helper for _div2n1n: divide (a12 << n | a3) by b = (b1 << n | b2)."""
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+def _split_leaves(value: int, base: int, level: int, leaves: List[int]) -> None:
+    """Append the _LEAF_DIGITS-digit chunks of value < base**(_LEAF_DIGITS * 2**level)."""
+    if level == 0:
+        leaves.append(value)
+    elif value == 0:
+        leaves.extend([0] * (1 << level))
+    else:
+        divisor = _power(base, level - 1)
+        # value < divisor**2, so one 2n-by-n division suffices
+        high, low = _div2n1n(value, divisor, divisor.bit_length())
+        _split_leaves(high, base, level - 1, leaves)
+        _split_leaves(low, base, level - 1, leaves)
+
+def int_to_base(value: int, base: int, alphabet: str = None) -> str:
+    """Convert an integer to a digit string in the given base.
+
+    Uses divide and conquer with cached powers of the base, so the digit
+    string is never rebuilt by repeated prepending. Power-of-two bases take
+    a linear bit-slicing path and base 10 goes through the decimal module.
+    """
+    return _int_to_text(value, base, _check_alphabet(base, alphabet))
+
+def _int_to_text(value: int, base: int, alphabet: str) -> str:
+    """int_to_base for an already validated alphabet."""
+    if value < 0:
+        return '-' + _int_to_text(-value, base, alphabet)
+    if value < base:
+        return alphabet[value]
+
+    if base & (base - 1) == 0:
+        return _power_of_two_to_text(value, base.bit_length() - 1, alphabet)
+    if base == 10 and value.bit_length() > _DECIMAL_LEAF_BITS:
+        return _decimal_to_text(value).translate(str.maketrans(DIGITS[:10], alphabet))
+
+    level = 0
+    while value >= _power(base, level):
+        level += 1
+    leaves: List[int] = []
+    _split_leaves(value, base, level, leaves)
+
+    chunks = []
+    for leaf in leaves:
+        digits = []
+        for _ in range(_LEAF_DIGITS):
+            leaf, digit = divmod(leaf, base)
+            digits.append(alphabet[digit])
+        chunks.append(''.join(reversed(digits)))
+    return ''.join(chunks).lstrip(alphabet[0])
+
+def _digit_table(base: int, alphabet: str) -> Dict[str, int]:
+    table = {c: d for d, c in enumerate(alphabet)}
+    if alphabet == DIGITS[:base]:
+        table.update({c.lower(): d for c, d in table.items()})
+    return table
+
+def _text_to_int(text: str, base: int) -> int:
+    """Parse default-alphabet digits, splitting at cached power boundaries."""
+    if len(text) <= _LEAF_DIGITS:
+        return int(text, base)
+    level = 0
+    while _LEAF_DIGITS << (level + 1) < len(text):
+        level += 1
+    split = _LEAF_DIGITS << level
+    return _text_to_int(text[:-split], base) * _power(base, level) + _text_to_int(text[-split:], base)
+
+def base_to_int(text: str, base: int, alphabet: str = None) -> int:
+    """Parse a digit string in the given base, the inverse of int_to_base."""
+    alphabet = _check_alphabet(base, alphabet)
+    negative = text.startswith('-')
+    digits = text[1:] if negative else text
+    if not digits:
+        raise ValueError("Empty number")
+
+    table = _digit_table(base, alphabet)
+    if not table.keys() >= set(digits):
+        for offset, c in enumerate(digits):
+            if c not in table:
+                raise ValueError(f"Invalid base-{base} digit {c!r} at offset {offset + negative}")
+
+    if base & (base - 1) == 0:
+        bits_per_digit = base.bit_length() - 1
+        bit_table = {c: format(d, f'0{bits_per_digit}b') for c, d in table.items()}
+        value = int(''.join([bit_table[c] for c in digits]), 2)
+    else:
+        canonical = digits.translate({ord(c): DIGITS[d] for c, d in table.items()})
+        value = _text_to_int(canonical, base)
+    return -value if negative else value
+
+class RadixCodec:
+    """A digit alphabet for one base with precomputed lookup tables.
+
+    encode_table maps digit values to characters and decode_table maps
+    characters back to digit values, so encoding and decoding are a single
+    table-driven pass.
+    """
+
+    def __init__(self, name: str, alphabet: str):
+        self.name = name
+        self.base = len(alphabet)
+        self.alphabet = _check_alphabet(self.base, alphabet)
+        self.encode_table = tuple(alphabet)
+        self.decode_table = _digit_table(self.base, alphabet)
+        self.bits_per_digit = None
+        self.bit_table = None
+        if self.base & (self.base - 1) == 0:
+            # Power-of-two bases also map each bit group straight to a character
+            self.bits_per_digit = self.base.bit_length() - 1
+            self.bit_table = _bit_table(self.bits_per_digit, alphabet)
+
+    def __repr__(self) -> str:
+        return f"RadixCodec({self.name!r}, base={self.base})"
+
+    def encode_int(self, value: int) -> str:
+        """Encode an integer."""
+        return _int_to_text(value, self.base, self.alphabet)
+
+    def decode_int(self, text: str) -> int:
+        """Decode an integer."""
+        return base_to_int(text, self.base, self.alphabet)
+
+    def encode_fraction(self, value, digits: int = 6) -> str:
+        """Encode the fractional part of a number, truncated to digits places.
+
+        A fraction that ends within digits places stops at its last non-zero
+        digit; a truncated one always shows all digits places, trailing
+        zeros included, so it never looks exact.
+        """
+        numerator, denominator = value.as_integer_ratio()
+        numerator = abs(numerator) % denominator
+        if numerator == 0 or digits <= 0:
+            return ''
+        scaled, remainder = divmod(numerator * self.base ** digits, denominator)
+        text = self.encode_int(scaled).rjust(digits, self.alphabet[0])
+        return text if remainder else text.rstrip(self.alphabet[0])
+
+    def decode_fraction(self, text: str) -> 'Fraction':
+        """Decode fractional digits (the part after the radix point) exactly."""
+        from fractions import Fraction
+        if not text:
+            return Fraction(0)
+        return Fraction(self.decode_int(text), self.base ** len(text))
+
+    def encode(self, value, frac_digits: int = 6) -> str:
+        """Encode an int, float, Fraction or Decimal with an optional fractional part."""
+        numerator, denominator = value.as_integer_ratio()
+        sign = '-' if numerator < 0 else ''
+        int_text = self.encode_int(abs(numerator) // denominator)
+        frac_text = self.encode_fraction(value, frac_digits)
+        return f"{sign}{int_text}.{frac_text}" if frac_text else f"{sign}{int_text}"
+
+    def decode(self, text: str):
+        """Decode text written by encode: an int, or a Fraction if it has a radix point."""
+        if '.' not in text:
+            return self.decode_int(text)
+        negative = text.startswith('-')
+        body = text[1:] if negative else text
+        if '-' in body:
+            raise ValueError(f"Invalid base-{self.base} digit '-' at offset {body.index('-') + negative}")
+        int_text, frac_text = body.split('.', 1)
+        value = (self.decode_int(int_text) if int_text else 0) + self.decode_fraction(frac_text)
+        return -value if negative else value
+
+    def encode_batch(self, values, frac_digits: int = 6) -> List[str]:
+        """Encode many values with the same tables."""
+        return [self.encode(value, frac_digits) for value in values]
+
+    def decode_batch(self, texts) -> list:
+        """Decode many digit strings with the same tables."""
+        return [self.decode(text) for text in texts]
+
+CODECS: Dict[str, RadixCodec] = {}
+
+def register_codec(codec: RadixCodec) -> RadixCodec:
+    """Add a codec to the registry under its name."""
+    CODECS[codec.name] = codec
+    return codec
+
+def get_codec(name) -> RadixCodec:
+    """Look up a codec by name, or by base for the standard 0-9A-Z alphabets."""
+    if isinstance(name, int):
+        name = {2: 'binary', 8: 'octal', 10: 'decimal', 16: 'hex', 32: 'base32', 36: 'base36', 64: 'base64'}.get(name, name)
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown radix codec: {name} (choose from {', '.join(map(str, CODECS))})")
+
+register_codec(RadixCodec('binary', DIGITS[:2]))
+register_codec(RadixCodec('octal', DIGITS[:8]))
+register_codec(RadixCodec('decimal', DIGITS[:10]))
+register_codec(RadixCodec('hex', DIGITS[:16]))
+register_codec(RadixCodec('base32', DIGITS[:32]))
+register_codec(RadixCodec('base32-rfc4648', "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"))
+register_codec(RadixCodec('base36', DIGITS))
+register_codec(RadixCodec('base64', BASE64_ALPHABET))
+
+def encode_multi(value: int, names) -> Dict[str, str]:
+    """Encode one non-negative integer in several codecs.
+
+    The binary string is produced once; every power-of-two codec is then
+    read off it through its digit table, and only the remaining codecs do
+    a separate conversion.
+    """
+    codecs = [get_codec(name) for name in names]
+    bits = format(value, 'b')
+    results = {}
+    for codec in codecs:
+        width = codec.bits_per_digit
+        if width is None:
+            results[codec.name] = codec.encode_int(value)
+            continue
+        padded = bits.zfill(-(-len(bits) // width) * width)
+        table = codec.bit_table
+        results[codec.name] = ''.join([table[padded[i:i + width]] for i in range(0, len(padded), width)])
+    return results
@@ -0,0 +1,128 @@
+# =========================================
+# File: streaming.py
+# Description:
+#   Non-interactive streaming conversion of
+#   numbers read line by line into CSV or
+#   JSONL records
+# =========================================
+
+import csv
+import io
+import json
+import re
+from typing import Callable, Dict, Iterable, Sequence, TextIO, Union
+
+from core.number_conversion import decimal_to_binary_float, to_ieee754, parse_number
+from core.radix import base_to_int, get_codec, int_to_base
+
+Number = Union[int, float]
+
+# Records are written in blocks of this many lines
+FLUSH_EVERY = 1024
+
+_DECIMAL_INT = re.compile(r'[+-]?\d+')
+_PREFIXES = {'0b': 2, '0o': 8, '0x': 16}
+
+def parse_literal(text: str) -> Number:
+    """Parse a decimal, 0b, 0o or 0x literal (with optional sign).
+
+    Prefixed literals must be integers: a radix point or a second sign is
+    rejected rather than truncated the way parse_number does.
+    """
+    text = text.strip()
+    negative = text.startswith('-')
+    body = text[1:] if text[:1] in ('+', '-') else text
+    base = _PREFIXES.get(body[:2].lower())
+    if base is not None:
+        digits = body[2:]
+        if '.' in digits:
+            raise ValueError(f"Fractional {body[:2]} literals are not supported: {text!r}")
+        if not digits or digits[0] in '+-':
+            raise ValueError(f"Invalid {body[:2]} literal: {text!r}")
+        value = parse_number(body, base)
+    elif _DECIMAL_INT.fullmatch(text):
+        # Avoids int()'s digit limit and quadratic cost on huge literals
+        return base_to_int(text.lstrip('+'), 10)
+    else:
+        return float(text)
+    return -value if negative else value
+
+def _decimal(value: Number, options: dict) -> str:
+    return int_to_base(value, 10) if isinstance(value, int) else repr(value)
+
+def _binary(value: Number, options: dict) -> str:
+    return decimal_to_binary_float(value, options['int_bits'], options['frac_bits'])
+
+def _codec(name: str) -> Callable[[Number, dict], str]:
+    def convert(value: Number, options: dict) -> str:
+        return get_codec(name).encode(value)
+    return convert
+
+def _ieee754(value: Number, options: dict) -> str:
+    return to_ieee754(float(value), options['ieee_format'])['binary']
+
+CONVERSIONS: Dict[str, Callable[[Number, dict], str]] = {
+    'decimal': _decimal,
+    'binary': _binary,
+    'hex': _codec('hex'),
+    'octal': _codec('octal'),
+    'base32': _codec('base32'),
+    'ieee754': _ieee754,
+}
+
+DEFAULT_CONVERSIONS = ('decimal', 'binary', 'hex', 'octal', 'base32', 'ieee754')
+
+def convert_record(text: str, conversions: Sequence[str], options: dict) -> Dict[str, str]:
+    """Convert one input line into a record of conversion results."""
+    record = {'input': text}
+    try:
+        value = parse_literal(text)
+        for name in conversions:
+            record[name] = CONVERSIONS[name](value, options)
+    except (ValueError, OverflowError) as e:
+        record['error'] = str(e)
+    return record
+
+def stream_conversions(lines: Iterable[str], out: TextIO, fmt: str = 'csv',
+                       conversions: Sequence[str] = DEFAULT_CONVERSIONS,
+                       int_bits: int = 32, frac_bits: int = 4,
+                       ieee_format: str = 'binary32') -> int:
+    """Convert numbers line by line and write one CSV or JSONL record per number.
+
+    Only one block of FLUSH_EVERY formatted records is held in memory at a
+    time, so input of any length streams in constant memory. Blank lines are
+    skipped; unparsable lines produce a record with an 'error' field.
+    Returns the number of records written.
+    """
+    unknown = [name for name in conversions if name not in CONVERSIONS]
+    if unknown:
+        raise ValueError(f"Unknown conversion: {', '.join(unknown)} (choose from {', '.join(CONVERSIONS)})")
+    if fmt not in ('csv', 'jsonl'):
+        raise ValueError(f"Unknown output format: {fmt} (choose from csv, jsonl)")
+
+    options = {'int_bits': int_bits, 'frac_bits': frac_bits, 'ieee_format': ieee_format}
+    fields = ['input', *conversions, 'error']
+    block = io.StringIO()
+    if fmt == 'csv':
+        writer = csv.DictWriter(block, fieldnames=fields, lineterminator='\n')
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(record: Dict[str, str]) -> None:
+            block.write(json.dumps(record))
+            block.write('\n')
+
+    count = 0
+    for line in lines:
+        text = line.strip()
+        if not text:
+            continue
+        write(convert_record(text, conversions, options))
+        count += 1
+        if count % FLUSH_EVERY == 0:
+            out.write(block.getvalue())
+            block.seek(0)
+            block.truncate()
+    out.write(block.getvalue())
+    out.flush()
+    return count
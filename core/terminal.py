@@ -0,0 +1,72 @@
+# =========================================
+# File: terminal.py
+# Description:
+#   ANSI color codes and one-time detection
+#   of whether output should be colored
+# =========================================
+
+import os
+import sys
+from typing import Mapping, NamedTuple, Optional, TextIO
+
+class Colors:
+    """ANSI color codes for terminal output."""
+    BLUE = '\033[94m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    CYAN = '\033[96m'
+    MAGENTA = '\033[95m'
+    ENDC = '\033[0m'
+    BOLD = '\033[1m'
+
+class NoColors:
+    """Drop-in replacement for Colors with every code empty."""
+    BLUE = ''
+    GREEN = ''
+    YELLOW = ''
+    RED = ''
+    CYAN = ''
+    MAGENTA = ''
+    ENDC = ''
+    BOLD = ''
+
+class RenderContext(NamedTuple):
+    """Terminal capabilities that decide how output is rendered."""
+    color: bool
+
+    @property
+    def palette(self) -> type:
+        """Colors when coloring, otherwise NoColors."""
+        return Colors if self.color else NoColors
+
+def detect_color(stream: TextIO = None, environ: Mapping[str, str] = None) -> bool:
+    """Decide whether to emit ANSI codes.
+
+    NO_COLOR (any non-empty value) turns color off and FORCE_COLOR turns it
+    on; otherwise color is used only on a TTY whose TERM is not 'dumb'.
+    """
+    environ = os.environ if environ is None else environ
+    stream = sys.stdout if stream is None else stream
+    if environ.get('NO_COLOR'):
+        return False
+    if environ.get('FORCE_COLOR', '0') not in ('', '0'):
+        return True
+    if environ.get('TERM') == 'dumb':
+        return False
+    isatty = getattr(stream, 'isatty', None)
+    return bool(isatty and isatty())
+
+_context: Optional[RenderContext] = None
+
+def get_render_context() -> RenderContext:
+    """Return the render context, detecting it on first use."""
+    global _context
+    if _context is None:
+        _context = RenderContext(color=detect_color())
+    return _context
+
+def set_render_context(context: Optional[RenderContext]) -> None:
+    """Override the detected context; None re-detects on next use."""
+    global _context
+    _context = context
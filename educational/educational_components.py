@@ -14,10 +14,11 @@ if str(root_dir) not in sys.path:
     sys.path.append(str(root_dir))
 
 from typing import List, Tuple, Dict
-from core.number_conversion import Colors
+from core.terminal import get_render_context
 
 def show_concept_map(topic: str = "binary") -> None:
     """Display a concept map for binary number system topics."""
+    colors = get_render_context().palette
     topics = {
         "binary": {
             "title": "Binary Number Systems",
@@ -52,13 +53,14 @@ def show_concept_map(topic: str = "binary") -> None:
     print("└" + "─" * 60 + "┘")
     
     for concept, subtopics in topic_data["concepts"]:
-        print(f"\n{Colors.BOLD}{concept}{Colors.ENDC}")
+        print(f"\n{colors.BOLD}{concept}{colors.ENDC}")
         print("├─" + "─" * 40)
         for subtopic in subtopics:
             print(f"│  • {subtopic}")
 
 def show_learning_path(current_level: str = "beginner") -> None:
     """Display a recommended learning path based on current level."""
+    colors = get_render_context().palette
     levels = {
         "beginner": {
             "current_topics": [
@@ -110,16 +112,16 @@ def show_learning_path(current_level: str = "beginner") -> None:
     print(f"\n=== Learning Path ({current_level.title()} Level) ===\n")
     
     if level_data["prerequisites"]:
-        print(f"{Colors.YELLOW}Prerequisites:{Colors.ENDC}")
+        print(f"{colors.YELLOW}Prerequisites:{colors.ENDC}")
         for prereq in level_data["prerequisites"]:
             print(f"• Complete {prereq.title()} level")
         print()
     
-    print(f"{Colors.GREEN}Current Topics:{Colors.ENDC}")
+    print(f"{colors.GREEN}Current Topics:{colors.ENDC}")
     for topic in level_data["current_topics"]:
         print(f"• {topic}")
     
-    print(f"\n{Colors.BLUE}Next Topics:{Colors.ENDC}")
+    print(f"\n{colors.BLUE}Next Topics:{colors.ENDC}")
     for topic in level_data["next_topics"]:
         print(f"• {topic}")
 
@@ -184,6 +186,7 @@ def show_practice_problem(topic: str = "addition", difficulty: str = "easy") ->
 
 def show_interactive_tutorial(topic: str = "binary_basics") -> None:
     """Display an interactive tutorial with explanations and examples."""
+    colors = get_render_context().palette
     tutorials = {
         "binary_basics": {
             "title": "Binary Number Basics",
@@ -228,14 +231,14 @@ def show_interactive_tutorial(topic: str = "binary_basics") -> None:
     print(f"\n=== {tutorial['title']} ===\n")
     
     for section in tutorial["sections"]:
-        print(f"{Colors.BOLD}{section['name']}{Colors.ENDC}")
+        print(f"{colors.BOLD}{section['name']}{colors.ENDC}")
         print("─" * len(section["name"]))
         
         for line in section["content"]:
             print(line)
         
         if "example" in section:
-            print(f"\n{Colors.GREEN}Example:{Colors.ENDC}")
+            print(f"\n{colors.GREEN}Example:{colors.ENDC}")
             print(f"Binary number: {section['example']['binary']}")
             print("\nSolution:")
             for step in section['example']['steps']:
@@ -357,6 +360,7 @@ def main():
 
 def show_quiz():
     """Interactive quiz module with different topics and difficulty levels."""
+    colors = get_render_context().palette
     quizzes = {
         "binary_basics": {
             "name": "Binary Number Basics",
@@ -415,10 +419,10 @@ def show_quiz():
             try:
                 answer = int(input("\nYour answer (enter number): ")) - 1
                 if answer == q['correct']:
-                    print(f"\n{Colors.GREEN}Correct!{Colors.ENDC}")
+                    print(f"\n{colors.GREEN}Correct!{colors.ENDC}")
                     score += 1
                 else:
-                    print(f"\n{Colors.RED}Incorrect.{Colors.ENDC}")
+                    print(f"\n{colors.RED}Incorrect.{colors.ENDC}")
                 print(f"Explanation: {q['explanation']}")
             except ValueError:
                 print("Invalid input. Skipping question.")
@@ -5,17 +5,18 @@
 #   Educational Tool (BNSET)
 # =========================================
 
+import sys
+
 from core.number_conversion import (
     decimal_to_binary_float,
     binary_to_decimal_float,
-    to_ieee754,
     group_bits,
     color_binary_groups,
-    parse_number,
-    to_base32
+    parse_number
 )
-from visualization.circuit_visualization import show_circuit_menu
-from educational.educational_components import main as educational_menu
+from core.cache import cache_stats, disable_cache, enable_cache
+from core.instrumentation import DUMP_ENV, ENABLE_ENV, REGISTRY
+from core.terminal import RenderContext, set_render_context
 
 def show_decimal_to_binary_steps(value: float, int_bits: int = 64) -> None:
     """Show step-by-step decimal to binary conversion."""
@@ -58,31 +59,11 @@ def show_binary_to_decimal_steps(binary_str: str) -> float:
     print(f"\nFinal decimal value: {result}")
     return result
 
-def show_ieee754_visualization(value: float) -> None:
-    """Show detailed IEEE-754 single precision representation."""
-    print("\n=== IEEE-754 Single Precision Visualization ===")
-    print(f"Converting {value} to IEEE-754 format\n")
-    
-    ieee = to_ieee754(value)
-    
-    # Show binary layout
-    print("Binary layout (32 bits):")
-    print("| Sign | Exponent | Mantissa |")
-    print("|-------|-----------|-----------|")
-    print(f"|   {ieee['sign']}   | {ieee['exponent']} | {ieee['mantissa']} |")
-    
-    # Show detailed breakdown
-    print("\nComponent breakdown:")
-    print(f"1. Sign bit: {ieee['sign']} ({'negative' if ieee['sign_value'] else 'positive'})")
-    print(f"2. Exponent: {ieee['exponent']} (binary) = {ieee['exponent_raw']} (decimal)")
-    print(f"   - Bias: 127")
-    print(f"   - Actual exponent: {ieee['exponent_raw']} - 127 = {ieee['exponent_bias']}")
-    print(f"3. Mantissa: 1.{ieee['mantissa']} = {ieee['mantissa_value']}")
-    
-    # Show final calculation
-    print("\nFinal value calculation:")
-    print(f"(-1)^{ieee['sign_value']} × {ieee['mantissa_value']} × 2^{ieee['exponent_bias']}")
-    print(f"= {value}")
+def show_ieee754_visualization(value: float, fmt: str = 'binary32') -> None:
+    """Show detailed IEEE-754 representation (single precision by default)."""
+    # Imported on first use; dataclasses alone would add noticeably to startup
+    from visualization.ieee754_visualization import ieee754_visualization, render_ieee754_visualization
+    render_ieee754_visualization(ieee754_visualization(value, fmt))
 
 def show_multi_base_layout(value: float) -> None:
     """Show the number in multiple bases with visualization."""
@@ -94,9 +75,13 @@ def show_multi_base_layout(value: float) -> None:
     
     # Format in different bases
     bin_str = decimal_to_binary_float(value)
-    hex_str = format(abs(int_part), 'X')
-    oct_str = format(abs(int_part), 'o')
-    base32_str = to_base32(abs(value))
+    from core.radix import encode_multi, get_codec
+    # One pass over the integer bits feeds every power-of-two base
+    digits = encode_multi(abs(int_part), ('hex', 'octal', 'base32'))
+    hex_str = digits['hex']
+    oct_str = digits['octal']
+    base32_frac = get_codec('base32').encode_fraction(frac_part)
+    base32_str = f"{digits['base32']}.{base32_frac}" if base32_frac else digits['base32']
     
     # Create layout table
     print("\nNumber Layout:")
@@ -117,6 +102,32 @@ def show_multi_base_layout(value: float) -> None:
     print("\nBit Patterns:")
     print(f"Grouped binary: {group_bits(bin_str)}")
 
+def show_stats() -> None:
+    """Show call counts and latency of the instrumented functions."""
+    print("\n=== Function Statistics ===")
+    if not REGISTRY.enabled:
+        print(f"Instrumentation is off. Start the tool with {ENABLE_ENV}=1 to collect statistics")
+        print(f"(and {DUMP_ENV}=stats.json to also write them as JSON on exit).")
+        return
+    if not REGISTRY.snapshot():
+        print("No instrumented functions have been called yet.")
+        return
+    print(REGISTRY.format_table())
+
+def _cache_summary(stats) -> str:
+    return (f"{stats.hits} hits, {stats.misses} misses, {stats.evictions} evictions, "
+            f"{stats.size}/{stats.maxsize} entries")
+
+def toggle_cache(maxsize: int = 1024) -> None:
+    """Turn the conversion cache on, or report its statistics and turn it off."""
+    stats = cache_stats()
+    if stats is None:
+        enable_cache(maxsize)
+        print(f"\nConversion cache on ({maxsize} entries).")
+    else:
+        disable_cache()
+        print(f"\nConversion cache off. It had {_cache_summary(stats)}.")
+
 def main():
     """Main menu for the Binary Number System Educational Tool."""
     while True:
@@ -127,10 +138,12 @@ def main():
         print("4. Show Multi-Base Layout")
         print("5. Circuit Visualization")
         print("6. Educational Tools")
-        print("7. Exit")
+        print("7. Stats")
+        print(f"8. Conversion Cache ({'on' if cache_stats() else 'off'})")
+        print("9. Exit")
         
         try:
-            choice = input("\nEnter choice (1-7): ")
+            choice = input("\nEnter choice (1-9): ")
             
             if choice == "1":
                 value = float(input("Enter decimal number: "))
@@ -151,16 +164,26 @@ def main():
                     show_multi_base_layout(float(result))
             elif choice == "3":
                 value = float(input("Enter decimal number for IEEE-754 visualization: "))
-                show_ieee754_visualization(value)
+                from core.ieee754 import FORMATS
+                fmt = input(f"Enter format ({'/'.join(FORMATS)}, default binary32): ").strip() or "binary32"
+                show_ieee754_visualization(value, fmt)
                 show_multi_base_layout(value)
             elif choice == "4":
                 value = float(input("Enter decimal number for multi-base visualization: "))
                 show_multi_base_layout(value)
             elif choice == "5":
+                # The circuit and educational menus are imported on first use
+                # to keep startup fast for single conversions
+                from visualization.circuit_visualization import show_circuit_menu
                 show_circuit_menu()
             elif choice == "6":
+                from educational.educational_components import main as educational_menu
                 educational_menu()
             elif choice == "7":
+                show_stats()
+            elif choice == "8":
+                toggle_cache()
+            elif choice == "9":
                 print("\nThank you for using BNSET!")
                 break
                 
@@ -171,5 +194,76 @@ def main():
             print("\nExiting...")
             break
 
+def run_batch(args: 'argparse.Namespace') -> None:
+    """Stream conversions for every number in a file (or stdin) without the menu."""
+    from core.streaming import stream_conversions
+
+    conversions = [name.strip() for name in args.conversions.split(',') if name.strip()]
+    source = sys.stdin if args.batch == '-' else open(args.batch, encoding='utf-8')
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    try:
+        stream_conversions(source, out, args.format, conversions,
+                           args.int_bits, args.frac_bits, args.ieee_format)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+def run_inspect(args: 'argparse.Namespace') -> None:
+    """Print a byte range of a file as grouped binary, hex and octal."""
+    from visualization.binary_inspector import show_binary_file
+
+    try:
+        show_binary_file(args.inspect, args.offset, args.length, args.bytes_per_line)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+
+def parse_args(argv=None) -> 'argparse.Namespace':
+    """Parse command-line options; with none, the interactive menu runs."""
+    # Only needed once main() runs, not when main is imported
+    import argparse
+    parser = argparse.ArgumentParser(description="Binary Number System Educational Tool (BNSET)")
+    parser.add_argument('--batch', nargs='?', const='-', metavar='FILE',
+                        help="convert numbers line by line from FILE (or stdin) instead of showing the menu")
+    parser.add_argument('--format', choices=('csv', 'jsonl'), default='csv',
+                        help="record format for --batch (default: csv)")
+    parser.add_argument('--conversions', default='decimal,binary,hex,octal,base32,ieee754',
+                        help="comma-separated conversions for --batch")
+    parser.add_argument('--int-bits', type=int, default=32, help="integer bits for binary output")
+    parser.add_argument('--frac-bits', type=int, default=4, help="fraction bits for binary output")
+    parser.add_argument('--ieee-format', default='binary32', help="IEEE-754 format for ieee754 output")
+    parser.add_argument('--output', default='-', metavar='FILE', help="write --batch records to FILE")
+    parser.add_argument('--inspect', metavar='FILE', help="show the bytes of FILE as grouped binary, hex and octal")
+    parser.add_argument('--offset', type=lambda text: int(text, 0), default=0,
+                        help="first byte shown by --inspect (decimal or 0x hex)")
+    parser.add_argument('--length', type=lambda text: int(text, 0), default=256,
+                        help="number of bytes shown by --inspect (default: 256)")
+    parser.add_argument('--bytes-per-line', type=int, default=4, help="bytes per --inspect line (default: 4)")
+    parser.add_argument('--cache-size', type=int, default=0, metavar='N',
+                        help="memoize up to N conversion results and report cache statistics on exit")
+    parser.add_argument('--no-color', action='store_true',
+                        help="never emit ANSI colors (by default they are used only on a terminal)")
+    return parser.parse_args(argv)
+
+def cli(argv=None) -> None:
+    """Command-line entry point."""
+    args = parse_args(argv)
+    if args.no_color:
+        set_render_context(RenderContext(color=False))
+    if args.cache_size > 0:
+        enable_cache(args.cache_size)
+    try:
+        if args.batch is not None:
+            run_batch(args)
+        elif args.inspect is not None:
+            run_inspect(args)
+        else:
+            main()
+    finally:
+        stats = cache_stats()
+        if stats is not None:
+            print(f"Cache: {_cache_summary(stats)}", file=sys.stderr)
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    cli() 
\ No newline at end of file
@@ -5,17 +5,6 @@
 #   showing gates and digital logic implementation.
 # =========================================
 
-class Colors:
-    """ANSI color codes for terminal output."""
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    CYAN = '\033[96m'
-    MAGENTA = '\033[95m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-
 def show_half_adder(a: int, b: int) -> None:
     """Visualize a half adder circuit with inputs and outputs."""
     sum_bit = a ^ b  # XOR
@@ -7,16 +7,7 @@
 
 import struct
 
-class Colors:
-    """ANSI color codes for terminal output."""
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    CYAN = '\033[96m'
-    MAGENTA = '\033[95m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+from core.terminal import get_render_context
 
 def create_power_table(decimal_value: float, max_exponent: int = 10, show_fractional: bool = False) -> None:
     """
@@ -316,7 +307,8 @@ def show_bit_mapping(bin_str: str) -> None:
 
 def color_binary_groups(binary: str, group_size: int = 4) -> str:
     """Group binary digits with alternating colors."""
-    colors = [Colors.BLUE, Colors.GREEN, Colors.YELLOW, Colors.MAGENTA]
+    palette = get_render_context().palette
+    colors = [palette.BLUE, palette.GREEN, palette.YELLOW, palette.MAGENTA]
     if '.' in binary:
         int_part, frac_part = binary.split('.')
         # Color integer part
@@ -324,19 +316,23 @@ def color_binary_groups(binary: str, group_size: int = 4) -> str:
         for i, chunk in enumerate(range(0, len(int_part), group_size)):
             group = int_part[chunk:chunk+group_size]
             color = colors[i % len(colors)]
-            grouped_int += f"{color}{group}{Colors.ENDC} "
+            grouped_int += f"{color}{group}{palette.ENDC} "
         # Color fractional part
         grouped_frac = ''
         for i, chunk in enumerate(range(0, len(frac_part), group_size)):
             group = frac_part[chunk:chunk+group_size]
             color = colors[i % len(colors)]
-            grouped_frac += f"{color}{group}{Colors.ENDC} "
+            grouped_frac += f"{color}{group}{palette.ENDC} "
         return f"{grouped_int.strip()}.{grouped_frac.strip()}"
-    return ' '.join(f"{colors[i % len(colors)]}{binary[i:i+group_size]}{Colors.ENDC}" 
+    return ' '.join(f"{colors[i % len(colors)]}{binary[i:i+group_size]}{palette.ENDC}" 
                    for i in range(0, len(binary), group_size)).strip()
 
 def perform_binary_arithmetic(a: str, b: str, operation: str = 'add') -> tuple[str, list[str]]:
-    """Perform binary arithmetic operations with step-by-step explanation."""
+    """Perform binary arithmetic operations with step-by-step explanation.
+
+    a and b may also be BitVectors; their bit strings are used.
+    """
+    a, b = str(a), str(b)
     # Remove '0b' prefix if present
     a = a[2:] if a.startswith('0b') else a
     b = b[2:] if b.startswith('0b') else b
@@ -516,35 +512,28 @@ def perform_binary_arithmetic(a: str, b: str, operation: str = 'add') -> tuple[s
 BASE32_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
 
 def convert_base(number, base):
-    if base == 32:
-        # Standard base 32 alphabet (0-9, A-V)
-        alphabet = "0123456789ABCDEFGHIJKLMNOPQRSTUV"
-        integer_part = int(number)
-        fractional_part = number - integer_part
-        
-        if integer_part == 0:
-            integer_representation = "0"
-        else:
-            integer_representation = ""
-            while integer_part > 0:
-                remainder = integer_part % base
-                integer_representation = alphabet[remainder] + integer_representation
-                integer_part //= base
-                
-        if fractional_part > 0:
-            fractional_representation = "."
-            for _ in range(5):  # Limit fractional digits for practical purposes
-                fractional_part *= base
-                digit = int(fractional_part)
-                fractional_representation += alphabet[digit]
-                fractional_part -= digit
-                if fractional_part == 0:
-                    break
-        else:
-            fractional_representation = ""
-            
-        return integer_representation + fractional_representation
-    # ... existing code for other bases ...
+    """Convert a number to any base from 2 to 36 (0-9, A-Z digits) or 64."""
+    from core.radix import int_to_base, default_alphabet
+
+    alphabet = default_alphabet(base)
+    integer_part = int(number)
+    fractional_part = number - integer_part
+
+    integer_representation = int_to_base(integer_part, base, alphabet)
+
+    if fractional_part > 0:
+        fractional_representation = "."
+        for _ in range(5):  # Limit fractional digits for practical purposes
+            fractional_part *= base
+            digit = int(fractional_part)
+            fractional_representation += alphabet[digit]
+            fractional_part -= digit
+            if fractional_part == 0:
+                break
+    else:
+        fractional_representation = ""
+
+    return integer_representation + fractional_representation
 
 def to_base32(value: float) -> str:
     """Convert a number to base32 representation."""
@@ -5,64 +5,107 @@
 #   and overflow detection.
 # =========================================
 
-from typing import Tuple
+import sys
+from dataclasses import dataclass
+from typing import TextIO, Tuple
 
-def show_number_representations(value: int, bits: int = 8) -> None:
-    """Show different signed number representations."""
-    print(f"\n=== Signed Number Representations ({bits}-bit) ===")
-    print(f"Decimal value: {value}")
-    
+from core.instrumentation import instrument
+
+@dataclass(frozen=True)
+class NumberRepresentations:
+    """Bit patterns of a value in the common signed encodings."""
+    __slots__ = ('value', 'bits', 'max_unsigned', 'max_signed', 'min_signed', 'out_of_range',
+                 'unsigned', 'sign_bit', 'magnitude', 'ones_complement', 'twos_complement')
+    value: int
+    bits: int
+    max_unsigned: int
+    max_signed: int
+    min_signed: int
+    out_of_range: bool
+    unsigned: str
+    sign_bit: str
+    magnitude: str
+    ones_complement: str
+    twos_complement: str
+
+    @property
+    def sign_magnitude(self) -> str:
+        return self.sign_bit + self.magnitude
+
+@instrument
+def number_representations(value: int, bits: int = 8) -> NumberRepresentations:
+    """Compute unsigned, sign-magnitude, one's and two's complement patterns."""
     # Calculate ranges
     max_unsigned = (1 << bits) - 1
     max_signed = (1 << (bits - 1)) - 1
     min_signed = -(1 << (bits - 1))
     
-    # Check for overflow
-    if abs(value) > max_signed:
-        print(f"\nWarning: Value {value} exceeds {bits}-bit signed range [{min_signed}, {max_signed}]")
-        print("Results below show wrapped/modulo behavior")
-    
     # Unsigned representation (for comparison)
     unsigned_pattern = format(value & ((1 << bits) - 1), f'0{bits}b')
-    print(f"\nUnsigned binary:  {unsigned_pattern}")
-    print(f"Unsigned decimal: {int(unsigned_pattern, 2)}")
     
     # Sign-magnitude representation
     sign_bit = '1' if value < 0 else '0'
     magnitude = format(abs(value) & ((1 << (bits-1)) - 1), f'0{bits-1}b')
-    sign_magnitude = sign_bit + magnitude
-    print(f"\nSign-magnitude:")
-    print(f"Binary:  {sign_bit} {magnitude}")
-    print(f"         │ └─ Magnitude bits")
-    print(f"         └─── Sign bit (0=positive, 1=negative)")
     
     # One's complement
     if value < 0:
         ones_complement = ''.join('1' if b == '0' else '0' for b in format(abs(value), f'0{bits}b'))
     else:
         ones_complement = format(value, f'0{bits}b')
-    print(f"\nOne's complement:")
-    print(f"Binary:  {ones_complement}")
-    if value < 0:
-        print("(Inverted all bits of positive number)")
     
     # Two's complement
     if value < 0:
         twos_complement = format((1 << bits) + value, f'0{bits}b')
     else:
         twos_complement = format(value, f'0{bits}b')
-    print(f"\nTwo's complement:")
-    print(f"Binary:  {twos_complement}")
-    if value < 0:
-        print("(One's complement + 1)")
-    
-    # Show ranges
-    print(f"\nValid ranges for {bits}-bit numbers:")
-    print(f"Unsigned:        0 to {max_unsigned}")
-    print(f"Sign-magnitude: -{max_signed} to {max_signed}")
-    print(f"One's complement: -{max_signed} to {max_signed}")
-    print(f"Two's complement: {min_signed} to {max_signed}")
+    
+    return NumberRepresentations(value, bits, max_unsigned, max_signed, min_signed,
+                                 abs(value) > max_signed, unsigned_pattern, sign_bit, magnitude,
+                                 ones_complement, twos_complement)
 
+def render_number_representations(rep: NumberRepresentations, out: TextIO = None) -> None:
+    """Write the representations and valid ranges to out (stdout by default)."""
+    parts = [
+        f"\n=== Signed Number Representations ({rep.bits}-bit) ===\n",
+        f"Decimal value: {rep.value}\n",
+    ]
+    if rep.out_of_range:
+        parts.append(f"\nWarning: Value {rep.value} exceeds {rep.bits}-bit signed range "
+                     f"[{rep.min_signed}, {rep.max_signed}]\n"
+                     "Results below show wrapped/modulo behavior\n")
+    parts.append(
+        f"\nUnsigned binary:  {rep.unsigned}\n"
+        f"Unsigned decimal: {int(rep.unsigned, 2)}\n"
+        "\nSign-magnitude:\n"
+        f"Binary:  {rep.sign_bit} {rep.magnitude}\n"
+        "         │ └─ Magnitude bits\n"
+        "         └─── Sign bit (0=positive, 1=negative)\n"
+        "\nOne's complement:\n"
+        f"Binary:  {rep.ones_complement}\n"
+    )
+    if rep.value < 0:
+        parts.append("(Inverted all bits of positive number)\n")
+    parts.append(
+        "\nTwo's complement:\n"
+        f"Binary:  {rep.twos_complement}\n"
+    )
+    if rep.value < 0:
+        parts.append("(One's complement + 1)\n")
+    parts.append(
+        f"\nValid ranges for {rep.bits}-bit numbers:\n"
+        f"Unsigned:        0 to {rep.max_unsigned}\n"
+        f"Sign-magnitude: -{rep.max_signed} to {rep.max_signed}\n"
+        f"One's complement: -{rep.max_signed} to {rep.max_signed}\n"
+        f"Two's complement: {rep.min_signed} to {rep.max_signed}\n"
+    )
+    (out or sys.stdout).write(''.join(parts))
+
+@instrument
+def show_number_representations(value: int, bits: int = 8) -> None:
+    """Show different signed number representations."""
+    render_number_representations(number_representations(value, bits))
+
+@instrument
 def check_overflow(a: int, b: int, result: int, bits: int = 8, operation: str = 'add') -> Tuple[bool, str]:
     """Check for overflow in arithmetic operations."""
     max_val = (1 << (bits - 1)) - 1
@@ -107,8 +150,13 @@ def check_overflow(a: int, b: int, result: int, bits: int = 8, operation: str =
     
     return False, ""
 
+@instrument
 def show_carry_chain(a: str, b: str, operation: str = 'add') -> None:
-    """Visualize carry/borrow chain in binary arithmetic."""
+    """Visualize carry/borrow chain in binary arithmetic.
+
+    a and b may also be BitVectors; they are shown as their bit strings.
+    """
+    a, b = str(a), str(b)
     print("\nCarry Chain Visualization:")
     print("  " + " ".join(a))  # First number
     print(f"{'+ ' if operation == 'add' else '- '}" + " ".join(b))  # Second number
@@ -149,6 +197,7 @@ def show_carry_chain(a: str, b: str, operation: str = 'add') -> None:
         print("  " + " ".join(str(c) for c in carries) + "  ← Carries")
     print("  " + " ".join(result) + "  ← Result")
 
+@instrument
 def show_overflow_cases(bits: int = 4) -> None:
     """Demonstrate common overflow scenarios with visual explanations."""
     print(f"\n=== Overflow Demonstration ({bits}-bit numbers) ===")
@@ -5,5 +5,8 @@ setup(
     version="0.1",
     packages=find_packages(),
     install_requires=[],
+    extras_require={
+        "batch": ["numpy"],
+    },
     python_requires=">=3.6",
 ) 
\ No newline at end of file
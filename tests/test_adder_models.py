@@ -0,0 +1,57 @@
+import io
+import unittest
+from visualization.adder_models import (
+    ADDER_BUILDERS,
+    analyze_adder,
+    carry_select_netlist,
+    compare_adders,
+    render_adder_comparison
+)
+from visualization.verification import verify_adder
+
+class TestAdderModels(unittest.TestCase):
+    """Test suite for the lookahead, select and prefix adder models."""
+
+    def test_every_design_adds_correctly(self):
+        """Test each design on every input combination of small widths."""
+        for design, builder in ADDER_BUILDERS.items():
+            for width in (1, 2, 3, 4, 5, 7, 8):
+                with self.subTest(design=design, width=width):
+                    netlist = builder(width)
+                    self.assertEqual(netlist.outputs[-1], 'c_out')
+                    self.assertTrue(verify_adder(width, netlist).passed)
+        for block_size in (1, 3, 8):
+            with self.subTest(block_size=block_size):
+                self.assertTrue(verify_adder(6, carry_select_netlist(6, block_size)).passed)
+
+    def test_scaling(self):
+        """Test the expected growth of depth and gate count with width."""
+        reports = {(r.design, r.width): r for r in compare_adders([64, 1024])}
+        for width in (64, 1024):
+            self.assertEqual(reports['ripple', width].depth, 2 * width + 1)
+            for design in ('carry-lookahead', 'brent-kung', 'kogge-stone'):
+                self.assertLess(reports[design, width].delay, reports['carry-select', width].delay)
+            self.assertLess(reports['carry-select', width].delay, reports['ripple', width].delay)
+        # Kogge-Stone adds a prefix level per doubling; Brent-Kung two
+        self.assertEqual(reports['kogge-stone', 1024].depth - reports['kogge-stone', 64].depth, 2 * 4)
+        self.assertEqual(reports['brent-kung', 1024].depth - reports['brent-kung', 64].depth, 4 * 4)
+        # and Brent-Kung stays linear in size while Kogge-Stone grows as n log n
+        self.assertLess(reports['brent-kung', 1024].gates, 10 * 1024)
+        self.assertGreater(reports['kogge-stone', 1024].gates, 2 * reports['brent-kung', 1024].gates)
+
+    def test_report_and_rendering(self):
+        """Test a single report and the comparison table."""
+        report = analyze_adder('kogge-stone', 16)
+        self.assertEqual(report.gates, sum(report.gate_counts.values()))
+        self.assertTrue(report.critical_path[0].startswith(('a', 'b', 'c_in')))
+        self.assertTrue(report.critical_path[-1].startswith(('s', 'c_out')))
+        out = io.StringIO()
+        render_adder_comparison(compare_adders([8, 16], ['ripple', 'kogge-stone']), out)
+        text = out.getvalue()
+        self.assertIn("Adder Architecture Comparison", text)
+        self.assertEqual(text.count('kogge-stone'), 2)
+        with self.assertRaises(ValueError):
+            analyze_adder('carry-skip', 8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+from core.number_conversion import (
+    decimal_to_binary_float,
+    binary_to_decimal_float,
+    to_ieee754,
+    BinaryParseError
+)
+from core.batch_conversion import (
+    decimal_to_binary_array,
+    binary_to_decimal_array,
+    to_ieee754_array,
+    ieee754_record
+)
+
+class TestBatchConversion(unittest.TestCase):
+    """Test suite for the NumPy batch conversions."""
+
+    def test_decimal_to_binary_array_matches_scalar(self):
+        """Test batch conversion against the scalar function."""
+        values = [42, 0, -42, 255, 3.75, -3.75, 26.5, 0.1, -0.3, 1234.5678, -7.0625]
+        for int_bits, frac_bits in [(32, 4), (12, 10), (16, 0), (64, 52), (64, 64)]:
+            with self.subTest(int_bits=int_bits, frac_bits=frac_bits):
+                result = decimal_to_binary_array(values, int_bits, frac_bits)
+                expected = [decimal_to_binary_float(v, int_bits, frac_bits) for v in values]
+                self.assertEqual([r.decode() for r in result], expected)
+
+    def test_integer_input(self):
+        """Test int64 input including two's complement wrapping."""
+        values = np.array([5, -1, -128, 127], dtype=np.int64)
+        result = decimal_to_binary_array(values, int_bits=8)
+        self.assertEqual(result.tolist(), [b'00000101', b'11111111', b'10000000', b'01111111'])
+
+    def test_packed_bits(self):
+        """Test packed uint8 bit matrix output."""
+        result = decimal_to_binary_array([3.75, -1], int_bits=8, frac_bits=8, packed=True)
+        self.assertEqual(result.dtype, np.uint8)
+        self.assertEqual(result.tolist(), [[0b00000011, 0b11000000], [0b11111111, 0]])
+
+    def test_shape_preserved(self):
+        """Test that multi-dimensional input keeps its shape."""
+        result = decimal_to_binary_array(np.zeros((2, 3)), int_bits=4)
+        self.assertEqual(result.shape, (2, 3))
+
+    def test_invalid_inputs(self):
+        """Test handling of invalid inputs."""
+        with self.assertRaises(ValueError):
+            decimal_to_binary_array([256], int_bits=8)
+        with self.assertRaises(ValueError):
+            decimal_to_binary_array([float('nan')])
+        with self.assertRaises(ValueError):
+            decimal_to_binary_array([1.0], int_bits=65)
+
+    def test_binary_to_decimal_array_matches_scalar(self):
+        """Test bulk parsing of lists, string arrays and byte buffers."""
+        literals = ["00101010", "0", "11111111", "00000011.11", "00011010.1000", ".1", "1.", "."]
+        expected = [binary_to_decimal_float(b) for b in literals]
+        inputs = [
+            literals,
+            np.array(literals),
+            np.array(literals, dtype='S'),
+            "\n".join(literals).encode() + b"\n",
+        ]
+        for data in inputs:
+            with self.subTest(data_type=type(data).__name__):
+                self.assertEqual(binary_to_decimal_array(data).tolist(), expected)
+
+    def test_binary_parse_errors(self):
+        """Test that parse errors report the index and offset of the first bad digit."""
+        test_cases = [
+            (["0101", "0102", "2"], 1, 3),
+            (b"01\n1.0.1\n", 1, 3),
+            (["1", ""], 1, 0),
+        ]
+        for data, index, offset in test_cases:
+            with self.subTest(data=data):
+                with self.assertRaises(BinaryParseError) as ctx:
+                    binary_to_decimal_array(data)
+                self.assertEqual(ctx.exception.index, index)
+                self.assertEqual(ctx.exception.offset, offset)
+
+    def test_ieee754_fields_match_scalar(self):
+        """Test IEEE-754 field decomposition against to_ieee754."""
+        values = np.array([0.1, -2.5, 0.0, -0.0, 1e-40, np.inf, 3.4e38, 123.456], dtype=np.float32)
+        fields = to_ieee754_array(values)
+        for i, value in enumerate(values):
+            with self.subTest(value=value):
+                self.assertEqual(ieee754_record(fields, i), to_ieee754(float(value)))
+
+    def test_ieee754_fields_values(self):
+        """Test the numeric fields of the structured array."""
+        fields = to_ieee754_array([-6.0])
+        self.assertEqual(fields['sign_value'].tolist(), [1])
+        self.assertEqual(fields['exponent_raw'].tolist(), [129])
+        self.assertEqual(fields['exponent_bias'].tolist(), [2])
+        self.assertEqual(fields['mantissa_value'].tolist(), [1.5])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from benchmarks.suite import (
+    collect_benchmarks,
+    compare,
+    load_baseline,
+    main,
+    run_benchmarks,
+    save_baseline,
+    time_benchmark
+)
+from core.cache import disable_cache, enable_cache, get_cache
+from core.terminal import RenderContext, get_render_context, set_render_context
+
+class TestBenchmarks(unittest.TestCase):
+    """Test suite for the benchmark harness (not the timings themselves)."""
+
+    def test_every_benchmark_runs(self):
+        """Test that each benchmark callable runs without error."""
+        benchmarks = collect_benchmarks()
+        self.assertEqual(len({b.name for b in benchmarks}), len(benchmarks))
+        for benchmark in benchmarks:
+            with self.subTest(benchmark=benchmark.name):
+                benchmark.func()
+
+    def test_compare_flags_regressions(self):
+        """Test that only slowdowns beyond the threshold are reported."""
+        baseline = {'fast': 1.0, 'slow': 1.0, 'gone': 1.0}
+        results = {'fast': 1.1, 'slow': 1.5, 'new': 9.0}
+        regressions = compare(results, baseline, threshold=0.2)
+        self.assertEqual([r.name for r in regressions], ['slow'])
+        self.assertAlmostEqual(regressions[0].ratio, 1.5)
+
+    def test_baseline_round_trip(self):
+        """Test saving and loading a JSON baseline."""
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            save_baseline({'a': 1e-6}, path)
+            self.assertEqual(load_baseline(path), {'a': 1e-6})
+        finally:
+            os.remove(path)
+
+    def test_compare_without_usable_baseline(self):
+        """Test that a missing or broken baseline gives a message, not a traceback."""
+        directory = tempfile.mkdtemp()
+        missing = os.path.join(directory, 'missing.json')
+        broken = os.path.join(directory, 'broken.json')
+        with open(broken, 'w', encoding='utf-8') as f:
+            f.write('{"results": [1, 2]}')
+        try:
+            for path, message in ((missing, "run `python -m benchmarks --save` first"),
+                                  (broken, "Cannot read baseline")):
+                with self.subTest(path=path):
+                    errors = io.StringIO()
+                    with contextlib.redirect_stderr(errors):
+                        self.assertEqual(main(['--compare', path]), 2)
+                    self.assertIn(message, errors.getvalue())
+        finally:
+            os.remove(broken)
+            os.rmdir(directory)
+
+    def test_zero_and_missing_baseline_entries(self):
+        """Test that zero, missing or non-numeric entries are skipped, not divided by."""
+        name = collect_benchmarks()[0].name
+        self.assertEqual(compare({name: 1.0, 'other': 1.0}, {name: 0.0, 'other': None}), [])
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            save_baseline({name: 0.0}, path)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(main(['-k', name, '--repeat', '1', '--compare', path]), 0)
+        finally:
+            os.remove(path)
+        self.assertIn(name, output.getvalue())
+        self.assertNotIn("x baseline", output.getvalue())
+
+    def test_run_restores_cache_and_render_context(self):
+        """Test that running benchmarks leaves the caller's cache and colors alone."""
+        cache = enable_cache(16)
+        context = RenderContext(color=False)
+        set_render_context(context)
+        try:
+            run_benchmarks(collect_benchmarks()[0].name, repeat=1, min_time=0.001)
+            self.assertIs(get_cache(), cache)
+            self.assertIs(get_render_context(), context)
+        finally:
+            disable_cache()
+            set_render_context(None)
+
+    def test_time_benchmark(self):
+        """Test that timing returns a positive per-call time."""
+        benchmark = collect_benchmarks()[0]
+        self.assertGreater(time_benchmark(benchmark, repeat=1, min_time=0.001), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from visualization.binary_inspector import BinaryFileInspector, show_binary_file
+
+class TestBinaryInspector(unittest.TestCase):
+    """Test suite for the memory-mapped binary file inspector."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        with os.fdopen(handle, 'wb') as f:
+            f.write(bytes(range(10)))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_render_lines(self):
+        """Test the binary, hex and octal columns, including a short last line."""
+        with BinaryFileInspector(self.path, colored=False) as inspector:
+            lines = inspector.render().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0], "00000000: 0000 0000 0000 0001 0000 0010 0000 0011  00 01 02 03  000 001 002 003")
+        self.assertEqual(lines[2], "00000008: 0000 1000 0000 1001                      08 09        010 011")
+
+    def test_colors_match_color_binary_groups(self):
+        """Test that group colors follow the digit offset, as color_binary_groups does."""
+        from core.number_conversion import color_binary_groups
+        from core.terminal import RenderContext, set_render_context
+        set_render_context(RenderContext(color=True))
+        try:
+            for group_size in (1, 2, 4, 8):
+                with self.subTest(group_size=group_size):
+                    with BinaryFileInspector(self.path, group_size=group_size, colored=True) as inspector:
+                        line = inspector.render(offset=0, length=4)
+                    expected = color_binary_groups(''.join(format(byte, '08b') for byte in range(4)), group_size)
+                    self.assertEqual(line.split(': ', 1)[1].split('  ')[0], expected)
+        finally:
+            set_render_context(None)
+
+    def test_window_is_zero_copy(self):
+        """Test that windows are views into the mapping."""
+        with BinaryFileInspector(self.path) as inspector:
+            view = inspector.window(2, 3)
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(view.tobytes(), b'\x02\x03\x04')
+            view.release()
+
+    def test_offset_and_pages(self):
+        """Test rendering a range and paging through the file."""
+        with BinaryFileInspector(self.path, bytes_per_line=2, colored=False) as inspector:
+            self.assertEqual(inspector.render(offset=4, length=2),
+                             "00000004: 0000 0100 0000 0101  04 05  004 005")
+            pages = list(inspector.pages(lines_per_page=2))
+        self.assertEqual(len(pages), 3)
+        self.assertTrue(pages[1].startswith("00000004:"))
+
+    def test_empty_file(self):
+        """Test that an empty file renders nothing."""
+        open(self.path, 'wb').close()
+        with BinaryFileInspector(self.path) as inspector:
+            self.assertEqual(inspector.size, 0)
+            self.assertEqual(inspector.render(), "")
+
+    def test_invalid_arguments(self):
+        """Test that bad sizes and negative offsets or lengths are rejected."""
+        for kwargs in ({'bytes_per_line': 0}, {'bytes_per_line': -4}, {'group_size': 0}, {'group_size': -1},
+                       {'group_size': 3}, {'group_size': 16}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    BinaryFileInspector(self.path, **kwargs)
+        with BinaryFileInspector(self.path) as inspector:
+            for offset, length in ((-1, 4), (0, -1)):
+                with self.subTest(offset=offset, length=length):
+                    with self.assertRaises(ValueError):
+                        inspector.window(offset, length)
+                    with self.assertRaises(ValueError):
+                        inspector.render(offset, length)
+            with self.assertRaises(ValueError):
+                next(inspector.pages(offset=-2))
+            with self.assertRaises(ValueError):
+                next(inspector.pages(lines_per_page=0))
+        output = io.StringIO()
+        for kwargs in ({'offset': -1}, {'length': -1}, {'bytes_per_line': 0}, {'group_size': 0}, {'group_size': 3}):
+            with self.subTest(**kwargs):
+                with contextlib.redirect_stdout(output), self.assertRaises(ValueError):
+                    show_binary_file(self.path, **kwargs)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_inspect_command_line_errors(self):
+        """Test that bad --inspect arguments exit with a message instead of a traceback."""
+        import main
+        for argv in (['--offset', '-1'], ['--length', '-8'], ['--bytes-per-line', '0']):
+            with self.subTest(argv=argv):
+                with self.assertRaises(SystemExit) as raised:
+                    main.cli(['--inspect', self.path, *argv])
+                self.assertTrue(str(raised.exception.code).startswith("Error: "))
+
+if __name__ == '__main__':
+    unittest.main()
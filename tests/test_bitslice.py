@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+from visualization.bitslice import (
+    ALL_ONES,
+    combination_numbers,
+    evaluate_words,
+    exhaustive_words,
+    pack_words,
+    unpack_words,
+    word_count
+)
+from visualization.netlist import exhaustive_lanes, ripple_carry_netlist
+
+class TestBitSlice(unittest.TestCase):
+    """Test suite for the NumPy bit-sliced input patterns."""
+
+    def test_words_match_lane_patterns(self):
+        """Test that uint64 words enumerate combinations like the int lane patterns."""
+        count = 9
+        lanes, _ = exhaustive_lanes(count)
+        words = exhaustive_words(count)
+        self.assertEqual(len(words[0]), word_count(count))
+        for i, (pattern, word) in enumerate(zip(lanes, words)):
+            with self.subTest(input=i):
+                self.assertEqual(sum(int(w) << (64 * j) for j, w in enumerate(word)), pattern)
+
+    def test_chunks_and_small_counts(self):
+        """Test word ranges and enumeration of fewer than six inputs."""
+        full = exhaustive_words(10)
+        chunk = exhaustive_words(10, 4, 9)
+        for whole, part in zip(full, chunk):
+            np.testing.assert_array_equal(whole[4:9], part)
+        self.assertEqual(word_count(3), 1)
+        self.assertEqual(int(exhaustive_words(3)[2][0]), 0xF0F0_F0F0_F0F0_F0F0)
+        with self.assertRaises(ValueError):
+            exhaustive_words(10, 0, 17)
+
+    def test_pack_round_trip(self):
+        """Test that pack_words inverts unpack_words."""
+        words = np.array([0, 1, 0x8000_0000_0000_0001, int(ALL_ONES)], dtype=np.uint64)
+        np.testing.assert_array_equal(pack_words(unpack_words(words)), words)
+
+    def test_exhaustive_adder(self):
+        """Test a 5-bit adder on every combination with 64 vectors per word."""
+        width = 5
+        count = 2 * width + 1
+        outputs = evaluate_words(ripple_carry_netlist(width).compile(), exhaustive_words(count))
+        numbers = combination_numbers(0, word_count(count))
+        low = np.uint64((1 << width) - 1)
+        expected = (numbers & low) + (numbers >> np.uint64(width) & low) + (numbers >> np.uint64(2 * width))
+        for j, word in enumerate(outputs):
+            with self.subTest(bit=j):
+                np.testing.assert_array_equal(word, pack_words(expected >> np.uint64(j) & np.uint64(1)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from core.bitvector import BitVector
+from core.number_conversion import (
+    binary_to_decimal,
+    binary_to_decimal_float,
+    decimal_to_binary_float,
+    group_bits,
+    parse_number,
+    to_base32
+)
+from visualization.circuit_visualization import ripple_carry_adder
+
+class TestBitVector(unittest.TestCase):
+    """Test suite for the int-backed BitVector."""
+
+    def test_construction(self):
+        """Test widths, masking and parsing."""
+        self.assertEqual(str(BitVector(5)), "101")
+        self.assertEqual(str(BitVector(5, signed=True)), "0101")
+        self.assertEqual(str(BitVector(-3, 8)), "11111101")
+        self.assertEqual(BitVector.from_string("0b1010_0101"), BitVector(0xA5, 8))
+        self.assertEqual(len(BitVector.from_string("0001")), 4)
+        for bad in ("", "0b", "102"):
+            with self.subTest(text=bad):
+                with self.assertRaises(ValueError):
+                    BitVector.from_string(bad)
+        with self.assertRaises(ValueError):
+            BitVector(-1)
+
+    def test_immutable(self):
+        """Test that fields cannot be reassigned and copies rebuild cleanly."""
+        import copy
+        import pickle
+        bits = BitVector(-3, 8, signed=True)
+        self.assertEqual(str(bits), "11111101")
+        for name in ('value', 'width', 'signed', '_text'):
+            with self.subTest(name=name):
+                with self.assertRaises(AttributeError):
+                    setattr(bits, name, 1)
+                with self.assertRaises(AttributeError):
+                    delattr(bits, name)
+        self.assertEqual(str(bits), "11111101")
+        for clone in (copy.copy(bits), copy.deepcopy(bits), pickle.loads(pickle.dumps(bits))):
+            self.assertEqual(clone, bits)
+            self.assertEqual((int(clone), str(clone)), (-3, "11111101"))
+
+    def test_bit_access_and_slicing(self):
+        """Test LSB-first indexing, slicing and iteration."""
+        bits = BitVector.from_string("10110010")
+        self.assertEqual([bits[i] for i in range(8)], [0, 1, 0, 0, 1, 1, 0, 1])
+        self.assertEqual(bits[-1], 1)
+        self.assertEqual(str(bits[0:4]), "0010")
+        self.assertEqual(str(bits[4:]), "1011")
+        self.assertEqual(list(bits), [0, 1, 0, 0, 1, 1, 0, 1])
+        with self.assertRaises(IndexError):
+            bits[8]
+
+    def test_signedness_and_concat(self):
+        """Test two's complement reinterpretation, resizing and concatenation."""
+        bits = BitVector.from_string("11111011")
+        self.assertEqual(int(bits), 251)
+        self.assertEqual(int(bits.as_signed()), -5)
+        self.assertEqual(str(bits.as_signed().resize(12)), "111111111011")
+        self.assertEqual(str(bits.resize(4)), "1011")
+        self.assertEqual(str(BitVector(1, 2).concat(BitVector(0, 3), BitVector(1, 1))), "010001")
+        self.assertEqual(bits.bit_count(), 7)
+
+    def test_wide_vectors(self):
+        """Test that very wide vectors round-trip without digit limits."""
+        text = "10" * 50000
+        bits = BitVector.from_string(text)
+        self.assertEqual(str(bits), text)
+        self.assertEqual(bits[bits.width - 1], 1)
+
+    def test_core_functions_accept_bitvectors(self):
+        """Test the conversion and adder entry points with BitVector input."""
+        bits = BitVector.from_string("1010010111110000")
+        self.assertEqual(binary_to_decimal(bits), 0xA5F0)
+        self.assertEqual(binary_to_decimal(bits.as_signed()), 0xA5F0 - (1 << 16))
+        self.assertEqual(binary_to_decimal_float(BitVector(6, 3)), 6.0)
+        self.assertEqual(group_bits(bits), group_bits(str(bits)))
+        self.assertEqual(group_bits(BitVector(5, 6)), group_bits("000101"))
+        self.assertEqual(decimal_to_binary_float(BitVector(-3, 4, signed=True), 8, 0), "11111101")
+        self.assertEqual(ripple_carry_adder(BitVector(15, 4), BitVector(1, 4)).result, "10000")
+        self.assertEqual(to_base32(BitVector(255, 16)), to_base32(255))
+        self.assertEqual(to_base32(bits), "19FG")
+        with self.assertRaises(ValueError):
+            to_base32(bits.as_signed())
+        self.assertEqual(parse_number(bits), 0xA5F0)
+        self.assertEqual(parse_number(BitVector(-3, 4, signed=True), 2), -3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import contextlib
+import io
+import math
+import unittest
+from unittest.mock import patch
+from core.cache import LRUCache, cache_stats, disable_cache, enable_cache
+from core.number_conversion import decimal_to_binary_float, to_base32, to_ieee754
+
+class TestConversionCache(unittest.TestCase):
+    """Test suite for the opt-in LRU conversion cache."""
+
+    def tearDown(self):
+        disable_cache()
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.size), (1, 1, 1, 2))
+
+    def test_disabled_by_default(self):
+        """Test that nothing is cached until the cache is enabled."""
+        self.assertIsNone(cache_stats())
+        decimal_to_binary_float(5.5)
+
+    def test_results_unchanged(self):
+        """Test that cached results match uncached ones."""
+        values = [0, 1, -1, 255, 0.1, 3.75, 0.0, -0.0, 1.0, True]
+        expected = [(decimal_to_binary_float(v, 16, 4), to_ieee754(float(v)), to_base32(abs(v)))
+                    for v in values]
+        enable_cache(64)
+        for _ in range(2):
+            actual = [(decimal_to_binary_float(v, 16, 4), to_ieee754(float(v)), to_base32(abs(v)))
+                      for v in values]
+            self.assertEqual(actual, expected)
+        # -0.0 must not be served from the 0.0 entry
+        self.assertEqual(to_ieee754(-0.0)['sign'], '1')
+        stats = cache_stats()
+        self.assertGreater(stats.hits, 0)
+        self.assertEqual(stats.evictions, 0)
+
+    def test_width_parameters_in_key(self):
+        """Test that different widths are cached separately."""
+        enable_cache(8)
+        self.assertEqual(decimal_to_binary_float(5, 4, 0), '0101')
+        self.assertEqual(decimal_to_binary_float(5, 8, 0), '00000101')
+        self.assertEqual(cache_stats().misses, 2)
+
+    def test_dict_results_are_copies(self):
+        """Test that modifying a returned dict does not affect the cache."""
+        enable_cache(8)
+        to_ieee754(2.5)['sign'] = 'x'
+        self.assertEqual(to_ieee754(2.5)['sign'], '0')
+
+    def test_nan_keys_hit(self):
+        """Test that NaN arguments are served from the cache, keeping their payloads apart."""
+        enable_cache(8)
+        quiet = float('nan')
+        negative = -math.nan
+        for _ in range(2):
+            self.assertEqual(to_ieee754(quiet)['exponent'], '11111111')
+            self.assertEqual(to_ieee754(float('nan'))['sign'], '0')
+            self.assertEqual(to_ieee754(negative)['sign'], '1')
+        stats = cache_stats()
+        self.assertEqual((stats.misses, stats.hits), (2, 4))
+
+    def test_menu_toggle(self):
+        """Test switching the cache on and off from the main menu."""
+        import main
+        output = io.StringIO()
+        with patch('builtins.input', side_effect=['8', '8', '9']), contextlib.redirect_stdout(output):
+            main.main()
+        text = output.getvalue()
+        self.assertIn("8. Conversion Cache (off)", text)
+        self.assertIn("Conversion cache on (1024 entries).", text)
+        self.assertIn("8. Conversion Cache (on)", text)
+        self.assertIn("Conversion cache off. It had 0 hits, 0 misses", text)
+        self.assertIsNone(cache_stats())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,23 @@ import unittest
 import io
 import sys
 from contextlib import contextmanager
-from ..visualization.circuit_visualization import (
+import random
+from unittest.mock import PropertyMock, patch
+from visualization.circuit_visualization import (
+    IncrementalRippleAdder,
+    full_adder,
+    half_adder,
+    render_ripple_carry_adder,
+    ripple_carry_adder,
     show_half_adder,
     show_full_adder,
-    show_ripple_carry_adder
+    show_ripple_carry_adder,
+    render_incremental_update,
+    render_wide_adder,
+    show_circuit_menu,
+    wide_ripple_carry_adder
 )
+from core.bitvector import BitVector
 
 @contextmanager
 def capture_output():
@@ -101,6 +113,149 @@ class TestCircuitVisualization(unittest.TestCase):
                     self.assertIn("Bit-by-bit addition", output_text)
                     self.assertIn("Full Adder", output_text)
 
+    def test_adder_results(self):
+        """Test the structured results behind the visualizations."""
+        self.assertEqual((half_adder(1, 1).sum, half_adder(1, 1).carry), (0, 1))
+        result = full_adder(1, 0, 1)
+        self.assertEqual((result.sum1, result.carry2, result.sum, result.carry_out), (1, 1, 0, 1))
+        with self.assertRaises(AttributeError):
+            result.sum = 1
+
+        ripple = ripple_carry_adder("1111", "1")
+        self.assertEqual(ripple.b, "0001")
+        self.assertEqual(ripple.result, "10000")
+        self.assertEqual(ripple.carry_out, 1)
+        self.assertEqual([stage.carry_out for stage in ripple.stages], [1, 1, 1, 1])
+
+    def test_render_to_stream(self):
+        """Test that rendering to a stream matches the printed output."""
+        buffer = io.StringIO()
+        render_ripple_carry_adder(ripple_carry_adder("0101", "0011"), buffer)
+        with capture_output() as output:
+            show_ripple_carry_adder("0101", "0011")
+        self.assertEqual(buffer.getvalue(), output.getvalue())
+
+    def test_wide_adder_matches_ripple(self):
+        """Test that the word-level adder matches the bit-by-bit one."""
+        test_cases = [("0101", "0011"), ("1111", "0001"), ("1011", "0111"), ("0", "0"),
+                      ("110010101111", "011111100001")]
+        for a, b in test_cases:
+            with self.subTest(a=a, b=b):
+                ripple = ripple_carry_adder(a, b)
+                wide = wide_ripple_carry_adder(a, b)
+                self.assertEqual(wide.carry_out, ripple.carry_out)
+                self.assertEqual(str(wide.sum), ripple.result[-len(a):])
+                self.assertEqual([wide.carries[i + 1] for i in range(len(a))],
+                                 [stage.carry_out for stage in ripple.stages])
+                self.assertEqual([wide.carries[i] for i in range(len(a))],
+                                 [stage.carry_in for stage in ripple.stages])
+
+    def test_wide_adder_rejects_bad_carry_in(self):
+        """Test that a carry in other than 0 or 1 is rejected."""
+        self.assertEqual(str(wide_ripple_carry_adder("0111", "0001", carry_in=1).sum), "1001")
+        for carry_in in (2, -1, 3):
+            with self.subTest(carry_in=carry_in):
+                with self.assertRaises(ValueError):
+                    wide_ripple_carry_adder("0101", "0011", carry_in=carry_in)
+
+    def test_wide_adder_render(self):
+        """Test the summary and window rendering on a wide operand."""
+        width = 100000
+        result = wide_ripple_carry_adder(BitVector((1 << width) - 1, width), BitVector(1, width))
+        self.assertEqual((result.sum.value, result.carry_out), (0, 1))
+        buffer = io.StringIO()
+        render_wide_adder(result, buffer, window=(0, 1))
+        text = buffer.getvalue()
+        self.assertIn(f"Stages producing a carry: {width} of {width}", text)
+        self.assertIn(f"Longest carry chain: {width} stages (positions 0-{width - 1})", text)
+        self.assertIn("       0   1  1    0    0     1", text)
+        self.assertLess(len(text), 1000)
+
+    def test_wide_adder_menu_input(self):
+        """Test that bad windows and oversized operands are reported, not raised."""
+        answers = {
+            '5': "Positions 5 to 5:",
+            '2-3': "Positions 3 to 2:",
+            '3-1': "Error: Invalid input - positions must satisfy",
+            '1-2-3': "Error: Invalid input - expected a position or a range",
+            '-1': "Error: Invalid input",
+            '8': "Error: Invalid input - positions must satisfy",
+            'x': "Error: Invalid input",
+        }
+        for window, expected in answers.items():
+            with self.subTest(window=window):
+                # Errors return straight to the menu; a rendered summary waits for Enter
+                inputs = ['4', '8', '0x0F', '0b1', window] + ([] if 'Error' in expected else ['']) + ['10']
+                with patch('builtins.input', side_effect=inputs), capture_output() as output:
+                    show_circuit_menu()
+                self.assertIn(expected, output.getvalue())
+        for operand in ('0x100', '111111111'):
+            with self.subTest(operand=operand):
+                with patch('builtins.input', side_effect=['4', '8', operand, '10']), capture_output() as output:
+                    show_circuit_menu()
+                self.assertIn(f"Error: Invalid input - operand {operand} does not fit in 8 bits",
+                              output.getvalue())
+        result = wide_ripple_carry_adder("0101", "0011")
+        with self.assertRaises(ValueError):
+            render_wide_adder(result, io.StringIO(), window=(3, 1))
+
+    def test_incremental_adder_tracks_toggles(self):
+        """Test that incremental updates keep the full adder state exact."""
+        rng = random.Random(5)
+        width = 256
+        a, b = rng.getrandbits(width), rng.getrandbits(width)
+        adder = IncrementalRippleAdder(BitVector(a, width), BitVector(b, width))
+        for _ in range(500):
+            operand, position = rng.choice('ab'), rng.randrange(width)
+            update = adder.toggle(operand, position)
+            if operand == 'a':
+                a ^= 1 << position
+            else:
+                b ^= 1 << position
+            self.assertEqual(update.stages[0].position, position)
+            self.assertEqual(adder.sum.value, (a + b) % (1 << width))
+            self.assertEqual(adder.carry_out, (a + b) >> width)
+        self.assertEqual(adder.result(), ripple_carry_adder(adder.a, adder.b))
+
+    def test_incremental_adder_stops_when_carry_stabilises(self):
+        """Test that only the stages on the changed carry chain are re-evaluated."""
+        width = 4096
+        adder = IncrementalRippleAdder(BitVector((1 << 8) - 1, width), BitVector(0, width))
+        # No carry changes: only the toggled stage
+        self.assertEqual(len(adder.toggle('a', 2000).stages), 1)
+        # A carry into the run of eight 1s ripples through it and stops after
+        update = adder.set_carry_in(1)
+        self.assertEqual([stage.position for stage in update.stages], list(range(9)))
+        self.assertEqual(adder.sum.value, (1 << 2000) + (1 << 8))
+        self.assertEqual(adder.set_bit('b', 5, 0).stages, ())
+        with self.assertRaises(IndexError):
+            adder.toggle('a', width)
+        with self.assertRaises(ValueError):
+            adder.set_bit('c', 0, 1)
+
+        buffer = io.StringIO()
+        render_incremental_update(update, adder, buffer)
+        text = buffer.getvalue()
+        self.assertIn("Re-evaluated 9 of 4096 stages (positions 0-8)", text)
+        self.assertLess(len(text), 1000)
+
+    def test_incremental_render_reads_only_shown_bits(self):
+        """Test that the sum line matches the full sum without building it."""
+        rng = random.Random(9)
+        for width in (1, 4, 5, 131, 132, 136, 137, 4096, 4099):
+            with self.subTest(width=width):
+                adder = IncrementalRippleAdder(BitVector(rng.getrandbits(width), width),
+                                               BitVector(rng.getrandbits(width), width))
+                digits = format(adder.sum.value, f'0{(width + 3) // 4}X')
+                expected = digits if len(digits) <= 35 else f"{digits[:16]}...{digits[-16:]} ({len(digits)} digits)"
+                self.assertEqual(adder.sum_hex(), expected)
+        update = adder.toggle('b', 4000)
+        buffer = io.StringIO()
+        with patch.object(IncrementalRippleAdder, 'sum', new_callable=PropertyMock,
+                          side_effect=AssertionError("full sum built")):
+            render_incremental_update(update, adder, buffer)
+        self.assertIn(f"Sum:       0x{adder.sum_hex()}", buffer.getvalue())
+
 def run_tests():
     """Run all tests with detailed output."""
     suite = unittest.TestLoader().loadTestsFromTestCase(TestCircuitVisualization)
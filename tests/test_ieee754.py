@@ -0,0 +1,162 @@
+import io
+import math
+import struct
+import unittest
+from fractions import Fraction
+import numpy as np
+from core.number_conversion import to_ieee754
+from visualization.ieee754_visualization import ieee754_visualization, render_ieee754_visualization
+from core.ieee754 import (
+    FORMATS,
+    get_format,
+    encode,
+    decode,
+    classify,
+    decompose,
+    encode_array,
+    decode_array
+)
+
+class TestIEEE754(unittest.TestCase):
+    """Test suite for the multi-format IEEE-754 engine."""
+
+    def setUp(self):
+        """Set up sample values covering every value category."""
+        self.values = [
+            0.0, -0.0, 1.0, -2.5, 0.1, 1 / 3, 65504.0, 65520.0, 1e-5, 6e-8,
+            1e-40, 1e-310, 3.4e38, 1e300, math.inf, -math.inf,
+        ]
+
+    def test_format_parameters(self):
+        """Test derived widths and biases."""
+        test_cases = [
+            ("binary16", 16, 15),
+            ("bfloat16", 16, 127),
+            ("binary32", 32, 127),
+            ("binary64", 64, 1023),
+            ("binary128", 128, 16383),
+        ]
+        for name, width, bias in test_cases:
+            with self.subTest(fmt=name):
+                fmt = get_format(name)
+                self.assertEqual(fmt.width, width)
+                self.assertEqual(fmt.bias, bias)
+
+    def test_encode_matches_hardware(self):
+        """Test encoding against struct and NumPy conversions."""
+        for value in self.values:
+            with self.subTest(value=value):
+                self.assertEqual(encode(value, "binary64"), struct.unpack("!Q", struct.pack("!d", value))[0])
+                if abs(value) < 3.4e38 or math.isinf(value):
+                    self.assertEqual(encode(value, "binary32"), struct.unpack("!I", struct.pack("!f", value))[0])
+                with np.errstate(over="ignore"):
+                    half = int(np.array(value).astype(np.float16).view(np.uint16))
+                self.assertEqual(encode(value, "binary16"), half)
+
+    def test_known_patterns(self):
+        """Test hand-checked bit patterns."""
+        test_cases = [
+            (1.0, "bfloat16", 0x3F80),
+            (65520.0, "binary16", 0x7C00),   # Rounds up to infinity
+            (6e-8, "binary16", 0x0001),      # Smallest subnormal
+            (1.0, "binary128", 0x3FFF << 112),
+            (Fraction(1, 3), "binary128", 0x3FFD5555555555555555555555555555),
+        ]
+        for value, fmt, expected in test_cases:
+            with self.subTest(value=value, fmt=fmt):
+                self.assertEqual(encode(value, fmt), expected)
+
+    def test_round_trip(self):
+        """Test that decode inverts encode for values each format can hold."""
+        for value in self.values:
+            with self.subTest(value=value):
+                self.assertEqual(decode(encode(value, "binary64"), "binary64"), value)
+                self.assertEqual(decode(encode(value, "binary128"), "binary128"), value)
+        third = decode(encode(Fraction(1, 3), "binary128"), "binary128", exact=True)
+        self.assertLess(abs(third - Fraction(1, 3)), Fraction(1, 2 ** 113))
+
+    def test_nan_payloads(self):
+        """Test that NaN payloads survive conversion between formats."""
+        nan = decode(0x7E01, "binary16")
+        self.assertTrue(math.isnan(nan))
+        self.assertEqual(encode(nan, "binary16"), 0x7E01)
+        self.assertEqual(classify(encode(nan, "bfloat16"), "bfloat16"), "nan")
+        self.assertEqual(classify(0x7F800000), "infinity")
+        self.assertEqual(classify(0x00000001), "subnormal")
+
+    def test_batch_matches_scalar(self):
+        """Test the vectorized paths against the scalar encoder and decoder."""
+        values = self.values + [math.nan]
+        for name in FORMATS:
+            with self.subTest(fmt=name):
+                bits = encode_array(values, name)
+                expected = [encode(v, name) for v in values]
+                self.assertEqual([int(b) for b in bits], expected)
+                decoded = decode_array(bits, name)
+                for got, want in zip(decoded.tolist(), (decode(b, name) for b in expected)):
+                    self.assertTrue(got == want or (math.isnan(got) and math.isnan(want)))
+
+    def test_to_ieee754_formats(self):
+        """Test to_ieee754 with a non-default format."""
+        result = to_ieee754(-6.0, "binary64")
+        self.assertEqual(result["exponent_bias"], 2)
+        self.assertEqual(result["mantissa_value"], 1.5)
+        self.assertEqual(result["bias"], 1023)
+        self.assertEqual(decompose(1e-40)["category"], "subnormal")
+        with self.assertRaises(ValueError):
+            to_ieee754(1.0, "binary8")
+
+    def test_visualization_result(self):
+        """Test the structured IEEE-754 visualization and its renderer."""
+        result = ieee754_visualization(-6.75)
+        self.assertEqual((result.sign, result.exponent_bias, result.hidden_bit), ('1', 2, '1'))
+        self.assertEqual(ieee754_visualization(5e-324, 'binary64').hidden_bit, '0')
+        buffer = io.StringIO()
+        render_ieee754_visualization(ieee754_visualization(1.5, 'binary16'), buffer)
+        self.assertIn("|   0   | 01111 | 1000000000 |", buffer.getvalue())
+        self.assertIn("Half Precision", buffer.getvalue())
+
+    def test_visualization_categories(self):
+        """Test the exponent and final value of every category in three formats."""
+        smallest = {'binary16': (6e-8, -24), 'binary32': (1e-45, -149), 'binary64': (5e-324, -1074)}
+        for fmt, (tiny, power) in smallest.items():
+            bias = get_format(fmt).bias
+            with self.subTest(fmt=fmt, category='subnormal'):
+                result = ieee754_visualization(tiny, fmt)
+                self.assertEqual((result.category, result.hidden_bit, result.exponent_bias),
+                                 ('subnormal', '0', 1 - bias))
+                self.assertEqual(result.encoded, 2.0 ** power)
+                self.assertEqual(result.mantissa_value * 2.0 ** result.exponent_bias, 2.0 ** power)
+                text = self._render(result)
+                self.assertIn(f"exponent fixed at 1 - {bias} = {1 - bias}", text)
+                self.assertIn(f"× 2^{1 - bias}\n= {2.0 ** power}", text)
+            with self.subTest(fmt=fmt, category='normal'):
+                result = ieee754_visualization(-6.75, fmt)
+                self.assertEqual((result.category, result.exponent_bias, result.encoded), ('normal', 2, -6.75))
+                self.assertIn(f"Actual exponent: {bias + 2} - {bias} = 2", self._render(result))
+            with self.subTest(fmt=fmt, category='zero'):
+                result = ieee754_visualization(0.0, fmt)
+                self.assertEqual((result.category, result.hidden_bit), ('zero', '0'))
+                self.assertIn("= 0.0", self._render(result))
+            with self.subTest(fmt=fmt, category='infinity'):
+                text = self._render(ieee754_visualization(float('-inf'), fmt))
+                self.assertIn("encodes -infinity\n= -inf", text)
+                self.assertNotIn("2^", text)
+            with self.subTest(fmt=fmt, category='nan'):
+                result = ieee754_visualization(float('nan'), fmt)
+                self.assertEqual(result.category, 'nan')
+                text = self._render(result)
+                self.assertIn("quiet NaN\n= nan", text)
+                self.assertNotIn("2^", text)
+        # binary32 no longer shows subnormals with a hidden 1
+        result = ieee754_visualization(1e-40)
+        self.assertEqual((result.category, result.hidden_bit, result.exponent_bias), ('subnormal', '0', -126))
+
+    @staticmethod
+    def _render(result) -> str:
+        buffer = io.StringIO()
+        render_ieee754_visualization(result, buffer)
+        return buffer.getvalue()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from core import instrumentation
+from core.instrumentation import InstrumentationRegistry, instrument
+
+class TestInstrumentation(unittest.TestCase):
+    """Test suite for the hot-path instrumentation registry."""
+
+    def setUp(self):
+        self.registry = InstrumentationRegistry(enabled=True)
+        self.saved = instrumentation.REGISTRY
+        instrumentation.REGISTRY = self.registry
+
+    def tearDown(self):
+        instrumentation.REGISTRY = self.saved
+
+    def test_disabled_returns_function_unchanged(self):
+        """Test that a disabled registry adds no wrapper."""
+        self.registry.enabled = False
+        def square(x):
+            return x * x
+        self.assertIs(instrument(square), square)
+
+    def test_records_calls_and_sizes(self):
+        """Test call counts, percentiles and input sizes."""
+        @instrument
+        def pad(text):
+            return text.zfill(8)
+        for text in ('1', '101', '10110'):
+            self.assertEqual(pad(text), text.zfill(8))
+        stats = self.registry.snapshot()[f"{__name__}.{pad.__qualname__}"]
+        self.assertEqual(stats['calls'], 3)
+        self.assertEqual(stats['mean_input_size'], 3)
+        self.assertEqual(stats['max_input_size'], 5)
+        self.assertLessEqual(stats['p50_us'], stats['p99_us'])
+        self.assertLessEqual(stats['p99_us'], stats['max_us'])
+
+    def test_exceptions_are_recorded(self):
+        """Test that calls which raise are still counted."""
+        @instrument
+        def fail(value):
+            raise ValueError(value)
+        with self.assertRaises(ValueError):
+            fail(255)
+        stats = self.registry.snapshot()[f"{__name__}.{fail.__qualname__}"]
+        self.assertEqual((stats['calls'], stats['max_input_size']), (1, 8))
+
+    def test_json_dump(self):
+        """Test writing the snapshot as JSON."""
+        self.registry.record('f', 0.002, 4)
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            self.registry.dump_json(path)
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        finally:
+            os.remove(path)
+        self.assertEqual(data['f']['calls'], 1)
+        self.assertAlmostEqual(data['f']['total_ms'], 2.0)
+        self.assertIn('f', self.registry.format_table())
+
+    def test_disabled_imports_nothing(self):
+        """Test that json, atexit and threading are only imported when enabled."""
+        script = ("import sys, core.instrumentation; "
+                  "print(sorted(m for m in ('atexit', 'json', 'threading') if m in sys.modules))")
+        env = {key: value for key, value in os.environ.items() if key != instrumentation.ENABLE_ENV}
+        result = subprocess.run([sys.executable, '-c', script], cwd=Path(__file__).resolve().parent.parent,
+                                env=env, capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), '[]')
+
+    def test_circuit_and_signed_functions_recorded(self):
+        """Test that the circuit and signed representation results are instrumented."""
+        script = ("from visualization import circuit_visualization as c; "
+                  "from python.signed_representations import number_representations; "
+                  "from core.instrumentation import REGISTRY; "
+                  "c.half_adder(1, 1); c.full_adder(1, 0, 1); c.ripple_carry_adder('01', '11'); "
+                  "c.wide_ripple_carry_adder('01', '11'); number_representations(-3); "
+                  "print('\\n'.join(REGISTRY.snapshot()))")
+        env = dict(os.environ, **{instrumentation.ENABLE_ENV: '1'})
+        env.pop(instrumentation.DUMP_ENV, None)
+        result = subprocess.run([sys.executable, '-c', script], cwd=Path(__file__).resolve().parent.parent,
+                                env=env, capture_output=True, text=True, check=True)
+        names = {name.rsplit('.', 1)[-1] for name in result.stdout.split()}
+        self.assertLessEqual({'half_adder', 'full_adder', 'ripple_carry_adder', 'wide_ripple_carry_adder',
+                              'number_representations'}, names)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import io
+import unittest
+import numpy as np
+from visualization.adder_models import ADDER_BUILDERS
+from visualization.multipliers import (
+    MULTIPLIER_BUILDERS,
+    analyze_multiplier,
+    array_multiplier_netlist,
+    render_multiplier_comparison,
+    verify_multiplier
+)
+from visualization.verification import verify_exhaustive
+
+class TestMultipliers(unittest.TestCase):
+    """Test suite for the array, Wallace and Dadda multipliers."""
+
+    def test_every_design_multiplies_correctly(self):
+        """Test each design and final adder on every operand pair of small widths."""
+        for design in MULTIPLIER_BUILDERS:
+            for final_adder in ('ripple', 'kogge-stone', 'carry-select'):
+                for width in (1, 2, 3, 4, 5, 6):
+                    with self.subTest(design=design, final_adder=final_adder, width=width):
+                        self.assertTrue(verify_multiplier(design, width, final_adder).passed)
+            with self.subTest(design=design, width=8):
+                result = verify_multiplier(design, 8, 'brent-kung')
+                self.assertTrue(result.passed)
+                self.assertEqual(result.checked, 1 << 16)
+
+    def test_unequal_widths(self):
+        """Test a 3 x 5 array multiplier against integer multiplication."""
+        netlist = array_multiplier_netlist(3, 5)
+        self.assertEqual(len(netlist.outputs), 8)
+        reference = lambda numbers: (numbers & np.uint64(7)) * (numbers >> np.uint64(3))
+        self.assertTrue(verify_exhaustive(netlist, reference).passed)
+
+    def test_structure(self):
+        """Test cell counts and that the trees beat the array on depth."""
+        reports = {(r.design, r.final_adder): r for r in
+                   (analyze_multiplier(design, 16, final_adder, throughput=False)
+                    for design in MULTIPLIER_BUILDERS for final_adder in ('ripple', 'kogge-stone'))}
+        array = reports['array', 'ripple']
+        # n * (n - 1) adder cells: n - 1 rows of n, the last row of the ripple being half adders
+        self.assertEqual((array.full_adders, array.half_adders), (16 * 15 - 16, 16))
+        self.assertEqual(array.gates, sum(array.gate_counts.values()))
+        # Dadda's reduction uses n^2 - 4n + 3 full and n - 1 half adders
+        dadda = reports['dadda', 'kogge-stone']
+        self.assertEqual((dadda.full_adders, dadda.half_adders), (16 * 16 - 4 * 16 + 3, 15))
+        for design in ('wallace', 'dadda'):
+            self.assertLess(reports[design, 'kogge-stone'].delay, reports[design, 'ripple'].delay)
+            self.assertLess(reports[design, 'kogge-stone'].depth, array.depth)
+
+    def test_rendering_and_errors(self):
+        """Test the comparison table and rejection of unknown designs."""
+        reports = [analyze_multiplier(design, 4) for design in MULTIPLIER_BUILDERS]
+        self.assertTrue(all(report.throughput > 0 for report in reports))
+        out = io.StringIO()
+        render_multiplier_comparison(reports, out)
+        text = out.getvalue()
+        self.assertIn("Multiplier Comparison", text)
+        self.assertEqual(text.count('4x4'), len(MULTIPLIER_BUILDERS))
+        with self.assertRaises(ValueError):
+            analyze_multiplier('booth', 8)
+        with self.assertRaises(ValueError):
+            verify_multiplier('array', 4, 'carry-skip')
+        with self.assertRaises(ValueError):
+            verify_multiplier('array', 33)
+        with self.assertRaises(ValueError):
+            array_multiplier_netlist(0)
+        self.assertIn('kogge-stone', ADDER_BUILDERS)
+
+if __name__ == '__main__':
+    unittest.main()
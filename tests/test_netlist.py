@@ -0,0 +1,140 @@
+import itertools
+import unittest
+from visualization.netlist import (
+    Netlist,
+    decoder_netlist,
+    exhaustive_lanes,
+    full_adder_netlist,
+    half_adder_netlist,
+    mux_netlist,
+    pack_lanes,
+    ripple_carry_netlist,
+    unpack_lanes
+)
+from visualization.circuit_visualization import ripple_carry_adder_batch
+
+def _bits(value: int, width: int) -> list:
+    return [value >> i & 1 for i in range(width)]
+
+class TestNetlist(unittest.TestCase):
+    """Test suite for the gate-level netlist engine."""
+
+    def test_adders(self):
+        """Test the half, full and ripple carry adders against integer addition."""
+        half = half_adder_netlist().compile()
+        full = full_adder_netlist().compile()
+        for a, b, c in itertools.product((0, 1), repeat=3):
+            with self.subTest(a=a, b=b, c=c):
+                self.assertEqual(half(a, b), (a ^ b, a & b))
+                sum1, carry1, carry2, total, carry_out = full(a, b, c)
+                self.assertEqual(total + 2 * carry_out, a + b + c)
+                self.assertEqual((sum1, carry1, carry2), (a ^ b, a & b, (a ^ b) & c))
+
+        adder = ripple_carry_netlist(3).compile()
+        for a, b, c in itertools.product(range(8), range(8), (0, 1)):
+            outputs = adder(*_bits(a, 3), *_bits(b, 3), c)
+            self.assertEqual(sum(bit << i for i, bit in enumerate(outputs)), a + b + c)
+
+    def test_mux_and_decoder(self):
+        """Test multiplexers and decoders over all inputs."""
+        mux = mux_netlist(2).compile()
+        for data, select in itertools.product(range(16), range(4)):
+            self.assertEqual(mux(*_bits(data, 4), *_bits(select, 2)), (data >> select & 1,))
+        decoder = decoder_netlist(3).compile()
+        for value in range(8):
+            self.assertEqual(decoder(*_bits(value, 3)), tuple(int(i == value) for i in range(8)))
+
+    def test_structure(self):
+        """Test gate counts, depth and ordering of out-of-order gates."""
+        adder = ripple_carry_netlist(4)
+        self.assertEqual(adder.gate_counts(), {'XOR': 8, 'AND': 8, 'OR': 4})
+        self.assertEqual(adder.depth, 9)
+
+        netlist = Netlist('backwards', ['a', 'b'])
+        netlist.add('NOT', 'x', output='y')
+        netlist.add('NAND', 'a', 'b', output='x')
+        netlist.set_outputs('y')
+        self.assertEqual([gate.output for gate in netlist.topological_order()], ['x', 'y'])
+        self.assertEqual(netlist.compile()(1, 1), (1,))
+
+    def test_critical_path(self):
+        """Test arrival times and the critical path of a ripple carry adder."""
+        adder = ripple_carry_netlist(4)
+        delay, path = adder.critical_path()
+        # XOR into the first carry, then AND + OR per stage, then the final sum XOR
+        self.assertEqual(delay, 2.0 + 1.5 + 1.5 + 3 * (1.5 + 1.5))
+        self.assertEqual(path[0], 'a0')
+        self.assertIn(path[-1], ('s3', 'c_out'))
+        unit = dict.fromkeys(('AND', 'OR', 'XOR', 'NOT', 'BUF', 'NAND', 'NOR', 'XNOR'), 1.0)
+        self.assertEqual(adder.critical_path(unit)[0], adder.depth)
+        self.assertEqual(Netlist('empty', ['a']).critical_path(), (0.0, []))
+
+    def test_invalid_netlists(self):
+        """Test that loops, undriven wires and bad gates are rejected."""
+        loop = Netlist('loop', ['a'])
+        loop.add('AND', 'a', 'y', output='x')
+        loop.add('OR', 'x', 'a', output='y')
+        with self.assertRaises(ValueError):
+            loop.topological_order()
+
+        undriven = Netlist('undriven', ['a'])
+        undriven.add('AND', 'a', 'missing')
+        with self.assertRaises(ValueError):
+            undriven.compile()
+
+        netlist = Netlist('bad', ['a'])
+        with self.assertRaises(ValueError):
+            netlist.add('MAYBE', 'a')
+        with self.assertRaises(ValueError):
+            netlist.add('NOT', 'a', 'a')
+        netlist.add('BUF', 'a', output='x')
+        with self.assertRaises(ValueError):
+            netlist.add('BUF', 'a', output='x')
+
+    def test_compiled_once(self):
+        """Test that compile() caches the generated function until the netlist changes."""
+        netlist = half_adder_netlist()
+        evaluate = netlist.compile()
+        self.assertIs(netlist.compile(), evaluate)
+        self.assertIn("def evaluate", evaluate.source)
+        netlist.add('OR', 'a', 'b', output='either')
+        self.assertIsNot(netlist.compile(), evaluate)
+
+    def test_pack_lanes_round_trip(self):
+        """Test that packing into lanes and unpacking restores the vectors."""
+        vectors = [0b101, 0b011, 0b000, 0b111, 0b110]
+        words = pack_lanes(vectors, 3)
+        self.assertEqual(words, [0b01011, 0b11010, 0b11001])
+        self.assertEqual(unpack_lanes(words, len(vectors)), vectors)
+
+    def test_exhaustive_lanes_enumerate_combinations(self):
+        """Test that lane k of the exhaustive patterns holds combination k."""
+        words, mask = exhaustive_lanes(4)
+        self.assertEqual(mask, 0xFFFF)
+        self.assertEqual(unpack_lanes(words, 16), list(range(16)))
+        with self.assertRaises(ValueError):
+            exhaustive_lanes(25)
+
+    def test_exhaustive_ripple_carry_bit_sliced(self):
+        """Test every input combination of an 8-bit adder in one pass."""
+        width = 8
+        lanes = 1 << (2 * width + 1)
+        words, mask = exhaustive_lanes(2 * width + 1)
+        outputs = ripple_carry_netlist(width).compile()(*words, mask=mask)
+        low = (1 << width) - 1
+        expected = [(k & low) + (k >> width & low) + (k >> 2 * width) for k in range(lanes)]
+        self.assertEqual(unpack_lanes(outputs, lanes), expected)
+
+    def test_evaluate_batch(self):
+        """Test batch evaluation of arbitrary vectors, including inverting gates."""
+        decoder = decoder_netlist(2)
+        self.assertEqual(decoder.evaluate_batch([0, 1, 2, 3, 2]), [1, 2, 4, 8, 4])
+        a_values = [0, 1, 200, 255, 37]
+        b_values = [0, 255, 100, 255, 90]
+        self.assertEqual(ripple_carry_adder_batch(a_values, b_values, 8, [0, 0, 1, 1, 0]),
+                         [0, 256, 301, 511, 127])
+        with self.assertRaises(ValueError):
+            ripple_carry_adder_batch([1], [1, 2], 8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,18 @@
 import unittest
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN
+from fractions import Fraction
 from core.number_conversion import (
     decimal_to_binary_float,
+    decimal_to_binary_exact,
     binary_to_decimal_float,
     to_base32,
     group_bits,
+    format_bits,
+    BinaryParseError,
     color_binary_groups,
     parse_number
 )
+from core.terminal import RenderContext, set_render_context
 
 class TestNumberConversion(unittest.TestCase):
     """Test suite for number conversion utility."""
@@ -56,6 +62,33 @@ class TestNumberConversion(unittest.TestCase):
                 result = decimal_to_binary_float(decimal)
                 self.assertEqual(result, expected)
     
+    def test_decimal_to_binary_exact(self):
+        """Test exact fixed-point conversion with rounding modes."""
+        test_cases = [
+            (Fraction(1, 3), 10, None, "00000000.0101010101"),
+            (Fraction(2, 3), 4, ROUND_HALF_EVEN, "00000000.1011"),
+            (2.25, 1, ROUND_HALF_EVEN, "00000010.0"),   # Tie rounds to even
+            (2.75, 1, ROUND_HALF_EVEN, "00000011.0"),
+            (-2.75, 1, ROUND_FLOOR, "11111101.0"),
+            (-2.75, 1, ROUND_CEILING, "11111110.1"),
+            (Decimal("0.5"), 2, None, "00000000.10"),
+        ]
+
+        for value, frac_bits, rounding, expected in test_cases:
+            with self.subTest(value=value, rounding=rounding):
+                if rounding is None:
+                    result = decimal_to_binary_exact(value, 8, frac_bits)
+                else:
+                    result = decimal_to_binary_exact(value, 8, frac_bits, rounding)
+                self.assertEqual(result, expected)
+
+    def test_decimal_to_binary_wide_fraction(self):
+        """Test that fractions far beyond double precision stay exact."""
+        result = decimal_to_binary_exact(Fraction(1, 3), 8, 1000)
+        self.assertEqual(result.split('.')[1], "01" * 500)
+        # A float holds exactly 0.1's nearest double, whose bits end after 55 places
+        self.assertEqual(decimal_to_binary_float(0.1, 8, 1000).rstrip('0')[-4:], "1101")
+
     def test_binary_to_decimal(self):
         """Test binary to decimal conversion."""
         test_cases = [
@@ -130,12 +163,62 @@ class TestNumberConversion(unittest.TestCase):
         # since testing ANSI color codes in strings is complex
         test_cases = ["1010", "1111", "101010", "1010.1010"]
         
-        for binary in test_cases:
-            with self.subTest(binary=binary):
-                result = color_binary_groups(binary)
-                self.assertIsInstance(result, str)
-                self.assertGreater(len(result), len(binary))
+        set_render_context(RenderContext(color=True))
+        try:
+            for binary in test_cases:
+                with self.subTest(binary=binary):
+                    result = color_binary_groups(binary)
+                    self.assertIsInstance(result, str)
+                    self.assertGreater(len(result), len(binary))
+        finally:
+            set_render_context(None)
+
+        # Without color the output is plain grouping, with no escape codes
+        set_render_context(RenderContext(color=False))
+        try:
+            for binary in test_cases:
+                with self.subTest(binary=binary, color=False):
+                    self.assertEqual(color_binary_groups(binary), group_bits(binary))
+        finally:
+            set_render_context(None)
+
+    def test_interactive_color_binary_groups(self):
+        """Test that the interactive tool's grouping follows the render context."""
+        from python.number_conversion_interactive import color_binary_groups as interactive_groups
+        set_render_context(RenderContext(color=False))
+        try:
+            for binary in ["1010", "101010", "1010.1010"]:
+                with self.subTest(binary=binary):
+                    result = interactive_groups(binary)
+                    self.assertNotIn('\033', result)
+                    self.assertEqual(result, group_bits(binary))
+        finally:
+            set_render_context(None)
     
+    def test_format_bits_tables(self):
+        """Test table-driven formatting against the string-slicing path."""
+        test_cases = [
+            (0xA5, 8, 4),
+            (0xA5F0, 16, 2),
+            (0x0123456789ABCDEF, 64, 4),
+            (0xFF00, 16, 8),
+            (0, 24, 1),
+        ]
+        for value, width, group_size in test_cases:
+            with self.subTest(value=value, group_size=group_size):
+                binary = format(value, f'0{width}b')
+                self.assertEqual(format_bits(value, width, group_size), group_bits(binary, group_size))
+                self.assertEqual(group_bits(binary + '.' + binary, group_size),
+                                 f"{format_bits(value, width, group_size)}.{format_bits(value, width, group_size)}")
+                set_render_context(RenderContext(color=True))
+                try:
+                    self.assertEqual(color_binary_groups(binary + '.1010', group_size).split('.')[0],
+                                     format_bits(value, width, group_size, colored=True))
+                finally:
+                    set_render_context(None)
+        with self.assertRaises(ValueError):
+            format_bits(5, 12)
+
     def test_invalid_inputs(self):
         """Test handling of invalid inputs."""
         # Test invalid hex
@@ -145,6 +228,9 @@ class TestNumberConversion(unittest.TestCase):
         # Test invalid binary
         with self.assertRaises(ValueError):
             binary_to_decimal_float("00102")  # Invalid binary digit
+        with self.assertRaises(BinaryParseError) as ctx:
+            binary_to_decimal_float("01.x1")
+        self.assertEqual(ctx.exception.offset, 3)
         
         # Test invalid base32
         with self.assertRaises(ValueError):
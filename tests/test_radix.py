@@ -0,0 +1,136 @@
+import random
+import unittest
+from fractions import Fraction
+from core.radix import (
+    DIGITS,
+    BASE64_ALPHABET,
+    CODECS,
+    RadixCodec,
+    int_to_base,
+    base_to_int,
+    get_codec,
+    register_codec,
+    encode_multi
+)
+
+class TestRadix(unittest.TestCase):
+    """Test suite for divide-and-conquer radix conversion."""
+
+    def test_known_values(self):
+        """Test conversions against hand-checked digit strings."""
+        test_cases = [
+            (0, 2, "0"),
+            (255, 16, "FF"),
+            (255, 32, "7V"),
+            (1024, 32, "100"),
+            (-42, 10, "-42"),
+            (35, 36, "Z"),
+            (4095, 64, "//"),
+            (64, 64, "BA"),
+        ]
+        for value, base, expected in test_cases:
+            with self.subTest(value=value, base=base):
+                self.assertEqual(int_to_base(value, base), expected)
+                self.assertEqual(base_to_int(expected, base), value)
+
+    def test_matches_builtins(self):
+        """Test against Python's own formatting for numbers of many sizes."""
+        rng = random.Random(1234)
+        for bits in (1, 63, 200, 5000, 12000):
+            value = rng.getrandbits(bits)
+            with self.subTest(bits=bits):
+                self.assertEqual(int_to_base(value, 16), format(value, 'X'))
+                self.assertEqual(int_to_base(value, 8), format(value, 'o'))
+                if bits < 4000:
+                    self.assertEqual(int_to_base(value, 10), str(value))
+
+    def test_round_trip_huge(self):
+        """Test round trips through every base with values well past the leaf size."""
+        rng = random.Random(42)
+        value = rng.getrandbits(40000)
+        for base in list(range(2, 37)) + [64]:
+            with self.subTest(base=base):
+                self.assertEqual(base_to_int(int_to_base(value, base), base), value)
+
+    def test_custom_alphabet(self):
+        """Test conversion with a caller-supplied alphabet."""
+        rfc_base32 = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+        self.assertEqual(int_to_base(33, 32, rfc_base32), "BB")
+        self.assertEqual(base_to_int("BB", 32, rfc_base32), 33)
+        self.assertEqual(base_to_int("ff", 16), 255)  # Default alphabet is case-insensitive
+        self.assertEqual(len(DIGITS), 36)
+        self.assertEqual(len(set(BASE64_ALPHABET)), 64)
+
+    def test_invalid_inputs(self):
+        """Test handling of invalid inputs."""
+        with self.assertRaises(ValueError):
+            int_to_base(10, 37)
+        with self.assertRaises(ValueError):
+            int_to_base(10, 4, "012")
+        with self.assertRaises(ValueError):
+            base_to_int("12", 2)
+        with self.assertRaises(ValueError):
+            base_to_int("", 10)
+
+    def test_codec_registry(self):
+        """Test codec lookup by name and by base."""
+        self.assertIs(get_codec(16), get_codec('hex'))
+        self.assertEqual(get_codec('base32-rfc4648').encode_int(33), "BB")
+        self.assertEqual(get_codec('base32').decode_table['V'], 31)
+        with self.assertRaises(ValueError):
+            get_codec('base99')
+
+    def test_codec_fractions(self):
+        """Test encoding and decoding numbers with fractional parts."""
+        test_cases = [
+            ('base32', 26.5, "Q.G"),
+            ('hex', 255.25, "FF.4"),
+            ('octal', -3.75, "-3.6"),
+            ('base64', 2.75, "C.w"),
+            ('decimal', Fraction(1, 3), "0.333333"),
+        ]
+        for name, value, expected in test_cases:
+            with self.subTest(codec=name, value=value):
+                codec = get_codec(name)
+                self.assertEqual(codec.encode(value), expected)
+        self.assertEqual(get_codec('hex').decode("-FF.4"), Fraction(-1021, 4))
+        self.assertEqual(get_codec('hex').decode_batch(["10", "0.8"]), [16, Fraction(1, 2)])
+        self.assertEqual(get_codec('binary').encode_batch([5, 0.5]), ["101", "0.1"])
+
+    def test_truncated_fractions_keep_all_digits(self):
+        """Test that only exact fractions drop trailing zero digits."""
+        codec = get_codec('base32')
+        self.assertEqual(codec.encode(1e-12), "0.000000")
+        self.assertEqual(codec.encode(Fraction(3) + Fraction(1, 32) + Fraction(1, 2 ** 40)), "3.100000")
+        self.assertEqual(codec.encode(Fraction(3) + Fraction(1, 32)), "3.1")
+        self.assertEqual(get_codec('decimal').encode(0.5, frac_digits=3), "0.5")
+
+    def test_decode_rejects_extra_signs(self):
+        """Test that exactly one leading minus sign is accepted."""
+        codec = get_codec('hex')
+        self.assertEqual(codec.decode("-1.8"), Fraction(-3, 2))
+        self.assertEqual(codec.decode("-.8"), Fraction(-1, 2))
+        for text in ("--1", "--1.8", "1.-8", "-1-.8"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    codec.decode(text)
+
+    def test_custom_codec(self):
+        """Test registering a new alphabet."""
+        codec = register_codec(RadixCodec('test-base4', "ACGT"))
+        try:
+            self.assertEqual(codec.encode_int(27), "CGT")
+            self.assertEqual(codec.decode_int("CGT"), 27)
+        finally:
+            del CODECS['test-base4']
+
+    def test_encode_multi(self):
+        """Test one-pass encoding into several codecs."""
+        names = ['binary', 'octal', 'hex', 'base32', 'base64', 'decimal', 'base36']
+        for value in (0, 1, 1000, 2 ** 100 + 12345):
+            with self.subTest(value=value):
+                result = encode_multi(value, names)
+                self.assertEqual(result, {name: get_codec(name).encode_int(value) for name in names})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import io
+import unittest
+from python.signed_representations import number_representations, render_number_representations
+
+class TestSignedRepresentations(unittest.TestCase):
+    """Test suite for signed number representations."""
+
+    def test_number_representations(self):
+        """Test the encodings of positive and negative values."""
+        test_cases = [
+            (5, 8, '00000101', '00000101', '00000101', '00000101'),
+            (-5, 8, '11111011', '10000101', '11111010', '11111011'),
+            (-8, 4, '1000', '1000', '0111', '1000'),
+        ]
+        for value, bits, unsigned, sign_magnitude, ones, twos in test_cases:
+            with self.subTest(value=value, bits=bits):
+                rep = number_representations(value, bits)
+                self.assertEqual(rep.unsigned, unsigned)
+                self.assertEqual(rep.sign_magnitude, sign_magnitude)
+                self.assertEqual(rep.ones_complement, ones)
+                self.assertEqual(rep.twos_complement, twos)
+        self.assertTrue(number_representations(200, 8).out_of_range)
+
+    def test_render(self):
+        """Test rendering to a stream."""
+        buffer = io.StringIO()
+        render_number_representations(number_representations(-5, 8), buffer)
+        text = buffer.getvalue()
+        self.assertIn("Binary:  1 0000101", text)
+        self.assertIn("(One's complement + 1)", text)
+        self.assertIn("Two's complement: -128 to 127", text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Subsystems and stdlib modules that must only be imported when the menu,
+# flag or conversion that needs them is used. Checking what is imported is
+# stable on any machine, unlike a wall-clock budget.
+LAZY_MODULES = (
+    'visualization',
+    'educational',
+    'numpy',
+    'core.batch_conversion',
+    'core.streaming',
+    'core.ieee754',
+    'core.radix',
+    'argparse',
+    'decimal',
+    'fractions',
+    'json',
+    'threading',
+)
+
+def _startup_modules() -> list:
+    """Import main in a fresh interpreter and return the names in sys.modules."""
+    env = {key: value for key, value in os.environ.items() if not key.startswith('BNSET_')}
+    command = [sys.executable, '-c', 'import sys, main; print("\\n".join(sys.modules))']
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+class TestStartup(unittest.TestCase):
+    """Test suite for the cold-start cost of main.py."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.modules = _startup_modules()
+
+    def test_main_imported(self):
+        """Test that the check really imported main."""
+        self.assertIn('main', self.modules)
+        self.assertIn('core.number_conversion', self.modules)
+
+    def test_lazy_modules_not_imported(self):
+        """Test that optional subsystems and heavy stdlib modules are not imported at startup."""
+        for lazy in LAZY_MODULES:
+            with self.subTest(module=lazy):
+                loaded = [name for name in self.modules if name == lazy or name.startswith(lazy + '.')]
+                self.assertEqual(loaded, [], f"{lazy} imported at startup")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import io
+import json
+import unittest
+from core.streaming import (
+    FLUSH_EVERY,
+    parse_literal,
+    stream_conversions
+)
+
+class TestStreaming(unittest.TestCase):
+    """Test suite for the non-interactive streaming batch mode."""
+
+    def test_parse_literal(self):
+        """Test parsing of decimal and prefixed literals."""
+        test_cases = [
+            ("42", 42),
+            ("-3.75", -3.75),
+            ("0x1A", 26),
+            ("0b101", 5),
+            ("-0o17", -15),
+            ("1e3", 1000.0),
+        ]
+        for text, expected in test_cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse_literal(text), expected)
+        # Longer than int()'s default digit limit
+        self.assertEqual(parse_literal("7" * 5000) % 10 ** 6, 777777)
+        for text in ("0x1.8", "-0b1.1", "0x", "0x-5", "--0x5", "+-7"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    parse_literal(text)
+
+    def test_fractional_prefixed_literal_is_an_error_record(self):
+        """Test that 0x1.8 is reported on its own line instead of becoming 1."""
+        out = io.StringIO()
+        stream_conversions(["0x1.8", "0x18"], out, fmt='jsonl', conversions=['decimal'])
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertIn("Fractional 0x literals are not supported", records[0]['error'])
+        self.assertNotIn('decimal', records[0])
+        self.assertEqual(records[1], {'input': '0x18', 'decimal': '24'})
+
+    def test_csv_output(self):
+        """Test CSV records, including an error record."""
+        out = io.StringIO()
+        count = stream_conversions(["42", "", "abc", "-1"], out, "csv",
+                                   ["decimal", "binary", "hex"], int_bits=8)
+        self.assertEqual(count, 3)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], "input,decimal,binary,hex,error")
+        self.assertEqual(lines[1], "42,42,00101010,2A,")
+        self.assertTrue(lines[2].startswith("abc,,,,"))
+        self.assertEqual(lines[3], "-1,-1,11111111,-1,")
+
+    def test_jsonl_output(self):
+        """Test JSONL records."""
+        out = io.StringIO()
+        stream_conversions(["0.5"], out, "jsonl", ["binary", "base32", "ieee754"])
+        record = json.loads(out.getvalue())
+        self.assertEqual(record["binary"], "00000000000000000000000000000000.1000")
+        self.assertEqual(record["base32"], "0.G")
+        self.assertEqual(record["ieee754"], "00111111000000000000000000000000")
+
+    def test_streams_lazily(self):
+        """Test that input is consumed lazily and written in blocks."""
+        writes = []
+
+        class Sink:
+            def write(self, text):
+                writes.append(text)
+
+            def flush(self):
+                pass
+
+        lines = (str(i) for i in range(FLUSH_EVERY * 2 + 5))
+        stream_conversions(lines, Sink(), "jsonl", ["hex"])
+        self.assertEqual(len(writes), 3)
+
+    def test_invalid_options(self):
+        """Test handling of invalid options."""
+        with self.assertRaises(ValueError):
+            stream_conversions(["1"], io.StringIO(), "csv", ["roman"])
+        with self.assertRaises(ValueError):
+            stream_conversions(["1"], io.StringIO(), "xml")
+
+if __name__ == '__main__':
+    unittest.main()
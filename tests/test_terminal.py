@@ -0,0 +1,36 @@
+import io
+import unittest
+from core.terminal import Colors, NoColors, RenderContext, detect_color
+
+class FakeTTY(io.StringIO):
+    def isatty(self):
+        return True
+
+class TestTerminal(unittest.TestCase):
+    """Test suite for terminal capability detection."""
+
+    def test_detect_color(self):
+        """Test the NO_COLOR, FORCE_COLOR, TERM and TTY rules."""
+        test_cases = [
+            (FakeTTY(), {}, True),
+            (io.StringIO(), {}, False),
+            (FakeTTY(), {'NO_COLOR': '1'}, False),
+            (FakeTTY(), {'NO_COLOR': ''}, True),
+            (FakeTTY(), {'TERM': 'dumb'}, False),
+            (io.StringIO(), {'FORCE_COLOR': '1'}, True),
+            (io.StringIO(), {'FORCE_COLOR': '0'}, False),
+            (FakeTTY(), {'NO_COLOR': '1', 'FORCE_COLOR': '1'}, False),
+        ]
+        for stream, environ, expected in test_cases:
+            with self.subTest(tty=stream.isatty(), environ=environ):
+                self.assertEqual(detect_color(stream, environ), expected)
+
+    def test_palette(self):
+        """Test that the no-color palette has every code, all empty."""
+        self.assertIs(RenderContext(color=True).palette, Colors)
+        self.assertIs(RenderContext(color=False).palette, NoColors)
+        codes = [name for name in vars(Colors) if name.isupper()]
+        self.assertEqual([getattr(NoColors, name) for name in codes], [''] * len(codes))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import io
+import unittest
+from visualization.adder_models import kogge_stone_netlist
+from visualization.netlist import Netlist, half_adder_netlist, ripple_carry_netlist
+from visualization.timing import (
+    TimingSimulator,
+    random_adder_stimuli,
+    render_timing_report,
+    simulate_adder
+)
+
+class TestTimingSimulator(unittest.TestCase):
+    """Test suite for the event-driven timing simulator."""
+
+    def test_gate_delays(self):
+        """Test that outputs change after their gate delays."""
+        simulator = TimingSimulator(half_adder_netlist())
+        simulator.reset({'b': 1})
+        result = simulator.apply({'a': 1})
+        self.assertEqual(result.settle_times, {'sum': 2.0, 'carry': 1.5})
+        self.assertEqual(result.glitches, {})
+        self.assertEqual((simulator.value('sum'), simulator.value('carry')), (0, 1))
+
+    def test_static_hazard_glitch(self):
+        """Test that a AND NOT a pulses while the inverter catches up."""
+        netlist = Netlist('hazard', ['a'])
+        netlist.add('AND', 'a', netlist.add('NOT', 'a'), output='y')
+        simulator = TimingSimulator(netlist.set_outputs('y'))
+        result = simulator.apply({'a': 1})
+        self.assertEqual(result.transitions, {'y': 2})
+        self.assertEqual(result.glitches, {'y': 2})
+        self.assertEqual(result.settle_time, 2.5)
+        self.assertEqual(simulator.value('y'), 0)
+
+    def test_simultaneous_inputs(self):
+        """Test that inputs changing at the same tick are seen together."""
+        netlist = Netlist('xor', ['a', 'b'])
+        netlist.add('XOR', 'a', 'b', output='y')
+        simulator = TimingSimulator(netlist.set_outputs('y'))
+        result = simulator.apply({'a': 1, 'b': 1})
+        self.assertEqual(result.transitions, {})
+        self.assertEqual(result.settle_time, 0.0)
+
+    def test_ripple_carry_settle_time(self):
+        """Test that a carry rippling through every stage settles last."""
+        simulator = TimingSimulator(ripple_carry_netlist(4))
+        simulator.reset({f"a{i}": 1 for i in range(4)})
+        result = simulator.apply({'c_in': 1})
+        # Each stage adds an AND and an OR (1.5 each) to the carry path
+        self.assertEqual(result.settle_times['c_out'], 12.0)
+        self.assertEqual(result.settle_times['s3'], 9.0 + 2.0)
+        self.assertEqual(result.settle_time, 12.0)
+
+    def test_final_values_match_netlist(self):
+        """Test that the settled outputs agree with the compiled netlist."""
+        netlist = kogge_stone_netlist(8)
+        evaluate = netlist.compile()
+        simulator = TimingSimulator(netlist)
+        for stimulus in random_adder_stimuli(8, 50, seed=3):
+            simulator.apply(stimulus)
+            expected = evaluate(*(stimulus[wire] for wire in netlist.inputs))
+            self.assertEqual(tuple(simulator.value(wire) for wire in netlist.outputs), expected)
+
+    def test_mean_settle_time_over_moving_stimuli(self):
+        """Test that the mean settle time ignores stimuli that left an output alone."""
+        simulator = TimingSimulator(half_adder_netlist())
+        report = simulator.run([{'a': 1}, {'b': 1}, {'a': 1, 'b': 1}])
+        outputs = {output.wire: output for output in report.outputs}
+        # sum moves on the first two stimuli; carry only on the second
+        self.assertEqual(outputs['sum'].mean_settle_time, 2.0)
+        self.assertEqual(outputs['carry'].mean_settle_time, 1.5)
+
+    def test_simulate_adder_report(self):
+        """Test the summary of random transitions on an adder."""
+        report = simulate_adder(16, 'ripple', stimuli=200, seed=7)
+        self.assertEqual(report.stimuli, 200)
+        self.assertEqual(len(report.outputs), 17)
+        self.assertGreater(report.events, 0)
+        self.assertLessEqual(report.settle_time, ripple_carry_netlist(16).critical_path()[0])
+        self.assertEqual(report.glitches, sum(output.glitches for output in report.outputs))
+        out = io.StringIO()
+        render_timing_report(report, out)
+        self.assertIn("Timing Simulation: ripple_carry_adder_16", out.getvalue())
+        self.assertIn("c_out", out.getvalue())
+        with self.assertRaises(ValueError):
+            simulate_adder(4, 'carry-skip')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import io
+import unittest
+import numpy as np
+from visualization.netlist import Netlist, full_adder_netlist, mux_netlist, ripple_carry_netlist
+from visualization.verification import (
+    render_verification,
+    verify_adder,
+    verify_exhaustive
+)
+
+def _with_gate(netlist: Netlist, output: str, op: str) -> Netlist:
+    """Copy a netlist with the gate driving output changed to op."""
+    faulty = Netlist(netlist.name + '_faulty', netlist.inputs)
+    for gate in netlist.gates:
+        faulty.add(op if gate.output == output else gate.op, *gate.inputs, output=gate.output)
+    return faulty.set_outputs(*netlist.outputs)
+
+class TestVerification(unittest.TestCase):
+    """Test suite for exhaustive netlist verification."""
+
+    def test_ripple_carry_adders_pass(self):
+        """Test that ripple carry adders match integer addition on every input."""
+        for width in (1, 2, 5, 8):
+            with self.subTest(width=width):
+                result = verify_adder(width, chunk_words=64)
+                self.assertTrue(result.passed)
+                self.assertEqual(result.checked, 1 << (2 * width + 1))
+
+    def test_first_counterexample(self):
+        """Test that an injected fault is reported at its lowest failing input."""
+        # The carry out of stage 2 computed with AND instead of OR: the
+        # lowest failing input is 7 + 1, where the carry ripples into stage 2
+        faulty = _with_gate(ripple_carry_netlist(4), 'c3', 'AND')
+        result = verify_adder(4, faulty)
+        self.assertFalse(result.passed)
+        example = result.counterexample
+        self.assertEqual(example.combination, 7 | 1 << 4)
+        self.assertEqual(example.inputs['a2'], 1)
+        self.assertEqual(example.inputs['b2'], 0)
+        self.assertEqual(example.expected, 8)
+        self.assertEqual(example.actual, 0)
+
+        out = io.StringIO()
+        render_verification(result, out)
+        self.assertIn("FAIL", out.getvalue())
+        self.assertIn("a2=1", out.getvalue())
+
+    def test_equivalence_with_netlist_reference(self):
+        """Test equivalence checks against another netlist."""
+        # carry1 and carry2 are never both 1, so XOR can replace the final OR
+        self.assertTrue(verify_exhaustive(_with_gate(full_adder_netlist(), 'carry_out', 'XOR'),
+                                          full_adder_netlist()).passed)
+        result = verify_exhaustive(_with_gate(full_adder_netlist(), 'carry_out', 'AND'), full_adder_netlist())
+        self.assertFalse(result.passed)
+        with self.assertRaises(ValueError):
+            verify_exhaustive(full_adder_netlist(), mux_netlist(1))
+        # Same function, but ports in another order or under other names are not comparable
+        adder = full_adder_netlist()
+        swapped = Netlist('full_adder_swapped', ['b', 'a', 'c_in'])
+        for gate in adder.gates:
+            swapped.add(gate.op, *gate.inputs, output=gate.output)
+        renamed = _with_gate(adder, 'carry_out', 'OR')
+        renamed.outputs[-1] = 'carry1'
+        for other in (swapped.set_outputs(*adder.outputs), renamed):
+            with self.subTest(reference=other.name):
+                with self.assertRaises(ValueError):
+                    verify_exhaustive(adder, other)
+
+    def test_function_reference(self):
+        """Test a multiplexer against a NumPy reference split over several chunks."""
+        def reference(numbers: np.ndarray) -> np.ndarray:
+            select = numbers >> np.uint64(8)
+            return numbers >> select & np.uint64(1)
+        result = verify_exhaustive(mux_netlist(3), reference, chunk_words=4)
+        self.assertTrue(result.passed)
+        self.assertEqual(result.checked, 1 << 11)
+
+    def test_process_pool(self):
+        """Test that a process pool finds the same first counterexample."""
+        faulty = _with_gate(ripple_carry_netlist(5), 's4', 'XNOR')
+        serial = verify_adder(5, faulty, chunk_words=2)
+        pooled = verify_adder(5, faulty, chunk_words=2, processes=2)
+        self.assertEqual(pooled.counterexample, serial.counterexample)
+        self.assertTrue(verify_adder(5, chunk_words=2, processes=2).passed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,278 @@
+# =========================================
+# File: adder_models.py
+# Description:
+#   Carry-lookahead, carry-select and parallel
+#   prefix adders as gate netlists, with gate
+#   count, depth and critical-path comparison
+# =========================================
+
+import math
+import sys
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+from visualization.netlist import Netlist, ripple_carry_netlist
+
+# Every builder returns a netlist with the ripple_carry_netlist interface:
+# inputs a0.., b0.., c_in and outputs s0.., c_out
+AdderBuilder = Callable[[int], Netlist]
+
+# Group size of each carry-lookahead level (the classic 74182 unit)
+LOOKAHEAD_GROUP = 4
+
+def _adder_inputs(width: int) -> List[str]:
+    if width <= 0:
+        raise ValueError("width must be positive")
+    return [f"a{i}" for i in range(width)] + [f"b{i}" for i in range(width)] + ['c_in']
+
+def _carry_name(position: int, width: int) -> str:
+    """Name of the carry into bit position (the carry out of the adder at position == width)."""
+    return 'c_out' if position == width else f"c{position}"
+
+def _generate_propagate(netlist: Netlist, width: int) -> Tuple[List[str], List[str]]:
+    """Bitwise generate g_i = a_i AND b_i and propagate p_i = a_i XOR b_i."""
+    generate = [netlist.add('AND', f"a{i}", f"b{i}", output=f"g{i}") for i in range(width)]
+    propagate = [netlist.add('XOR', f"a{i}", f"b{i}", output=f"p{i}") for i in range(width)]
+    return generate, propagate
+
+def _sum_bits(netlist: Netlist, propagate: Sequence[str], carries: Sequence[str]) -> Netlist:
+    """s_i = p_i XOR c_i, given the carry into every bit; sets the adder outputs."""
+    width = len(propagate)
+    for i in range(width):
+        netlist.add('XOR', propagate[i], carries[i], output=f"s{i}")
+    return netlist.set_outputs(*(f"s{i}" for i in range(width)), 'c_out')
+
+# ---------------------------------------------------------------------------
+# Parallel prefix adders
+# ---------------------------------------------------------------------------
+
+def _prefix_adder(name: str, width: int, levels: List[List[Tuple[int, int]]]) -> Netlist:
+    """Build a prefix adder from a schedule of (upper, lower) group merges per level.
+
+    Node i starts as the group (g_i, p_i); merging it with node j below it
+    gives G = G_i | P_i & G_j and P = P_i & P_j. Bit 0 absorbs c_in, so a
+    group that reaches bit 0 is a carry and needs no P. Within a level,
+    merges read the values from the previous level.
+    """
+    netlist = Netlist(name, _adder_inputs(width))
+    generate, propagate = _generate_propagate(netlist, width)
+    group_g = list(generate)
+    group_p = list(propagate)
+    low = list(range(width))
+    group_g[0] = netlist.add('OR', generate[0], netlist.add('AND', propagate[0], 'c_in'),
+                             output=_carry_name(1, width))
+    low[0] = -1
+    for level in levels:
+        updates = []
+        for upper, lower in level:
+            reaches_carry = low[lower] == -1
+            g = netlist.add('OR', group_g[upper], netlist.add('AND', group_p[upper], group_g[lower]),
+                            output=_carry_name(upper + 1, width) if reaches_carry else None)
+            p = None if reaches_carry else netlist.add('AND', group_p[upper], group_p[lower])
+            updates.append((upper, g, p, low[lower]))
+        for upper, g, p, reach in updates:
+            group_g[upper], group_p[upper], low[upper] = g, p, reach
+    if any(reach != -1 for reach in low):
+        raise ValueError(f"Prefix schedule for {name} does not cover every bit")
+    return _sum_bits(netlist, propagate, ['c_in'] + group_g[:width - 1])
+
+def kogge_stone_netlist(width: int) -> Netlist:
+    """Kogge-Stone adder: log2(width) prefix levels, every node merged at every level."""
+    levels = []
+    distance = 1
+    while distance < width:
+        levels.append([(i, i - distance) for i in range(distance, width)])
+        distance *= 2
+    return _prefix_adder(f'kogge_stone_adder_{width}', width, levels)
+
+def brent_kung_netlist(width: int) -> Netlist:
+    """Brent-Kung adder: an up-sweep then a down-sweep, about 2 * width prefix nodes."""
+    levels = []
+    distance = 1
+    while distance < width:
+        levels.append([(i, i - distance) for i in range(2 * distance - 1, width, 2 * distance)])
+        distance *= 2
+    distance //= 2
+    while distance >= 1:
+        level = [(i, i - distance) for i in range(3 * distance - 1, width, 2 * distance)]
+        if level:
+            levels.append(level)
+        distance //= 2
+    return _prefix_adder(f'brent_kung_adder_{width}', width, levels)
+
+# ---------------------------------------------------------------------------
+# Hierarchical carry-lookahead adder
+# ---------------------------------------------------------------------------
+
+def _lookahead_carries(netlist: Netlist, groups: Sequence[Tuple[str, str]], carry_in: str) -> List[str]:
+    """Two-level carries after each of the first len(groups) - 1 groups.
+
+    c_{k+1} = G_k | P_k G_{k-1} | ... | P_k ... P_0 c_in, one AND per term.
+    """
+    carries = []
+    for k in range(len(groups) - 1):
+        terms = [groups[k][0]]
+        for j in range(k - 1, -2, -1):
+            source = groups[j][0] if j >= 0 else carry_in
+            terms.append(netlist.add('AND', *(groups[m][1] for m in range(j + 1, k + 1)), source))
+        carries.append(netlist.add('OR', *terms))
+    return carries
+
+def _group_signals(netlist: Netlist, groups: Sequence[Tuple[str, str]]) -> Tuple[str, str]:
+    """Block generate and propagate of up to LOOKAHEAD_GROUP groups."""
+    if len(groups) == 1:
+        return groups[0]
+    k = len(groups) - 1
+    terms = [groups[k][0]]
+    for j in range(k - 1, -1, -1):
+        terms.append(netlist.add('AND', *(groups[m][1] for m in range(j + 1, k + 1)), groups[j][0]))
+    return netlist.add('OR', *terms), netlist.add('AND', *(p for _, p in groups))
+
+class _LookaheadBlock(NamedTuple):
+    generate: str
+    propagate: str
+    children: Tuple['_LookaheadBlock', ...]
+    signals: Tuple[Tuple[str, str], ...]
+
+def _build_block(netlist: Netlist, signals: Sequence[Tuple[str, str]]) -> _LookaheadBlock:
+    """Group bits into blocks of LOOKAHEAD_GROUP recursively, computing each block's G and P."""
+    if len(signals) <= LOOKAHEAD_GROUP:
+        return _LookaheadBlock(*_group_signals(netlist, signals), (), tuple(signals))
+    # Largest power of the group size that still leaves more than one child
+    size = LOOKAHEAD_GROUP
+    while size * LOOKAHEAD_GROUP < len(signals):
+        size *= LOOKAHEAD_GROUP
+    children = tuple(_build_block(netlist, signals[i:i + size]) for i in range(0, len(signals), size))
+    groups = tuple((child.generate, child.propagate) for child in children)
+    return _LookaheadBlock(*_group_signals(netlist, groups), children, groups)
+
+def _distribute_carries(netlist: Netlist, block: _LookaheadBlock, carry_in: str) -> List[str]:
+    """Carries into every bit of block after the first, top-down from the block carry-in."""
+    inner = _lookahead_carries(netlist, block.signals, carry_in)
+    if not block.children:
+        return inner
+    # Each child's carry out is the next child's carry in, computed at this level
+    carries = []
+    for j, (child, child_carry) in enumerate(zip(block.children, [carry_in] + inner)):
+        carries += _distribute_carries(netlist, child, child_carry)
+        if j < len(inner):
+            carries.append(inner[j])
+    return carries
+
+def carry_lookahead_netlist(width: int) -> Netlist:
+    """Hierarchical carry-lookahead adder built from 4-bit lookahead units.
+
+    Block generate/propagate signals are formed bottom-up in groups of
+    LOOKAHEAD_GROUP, then block carries flow top-down, so the carry path
+    grows with log4(width) instead of width.
+    """
+    netlist = Netlist(f'carry_lookahead_adder_{width}', _adder_inputs(width))
+    generate, propagate = _generate_propagate(netlist, width)
+    top = _build_block(netlist, list(zip(generate, propagate)))
+    carries = _distribute_carries(netlist, top, 'c_in')
+    netlist.add('OR', top.generate, netlist.add('AND', top.propagate, 'c_in'), output='c_out')
+    return _sum_bits(netlist, propagate, ['c_in'] + carries)
+
+# ---------------------------------------------------------------------------
+# Carry-select adder
+# ---------------------------------------------------------------------------
+
+def _ripple_block(netlist: Netlist, bits: range, carry_in: Optional[str], assumed: int = 0,
+                  name_outputs: bool = False) -> Tuple[List[str], str]:
+    """Ripple-add bits with a wired carry-in, or with a constant carry-in when carry_in is None.
+
+    With name_outputs the sums are the adder outputs s{i}, and a final
+    carry out of the top bit is named c_out.
+    """
+    sums = []
+    carry = carry_in
+    for i in bits:
+        a, b = f"a{i}", f"b{i}"
+        name = f"s{i}" if name_outputs else None
+        if carry is None and assumed == 0:
+            sums.append(netlist.add('XOR', a, b, output=name))
+            carry = netlist.add('AND', a, b)
+        elif carry is None:
+            sums.append(netlist.add('XNOR', a, b, output=name))
+            carry = netlist.add('OR', a, b)
+        else:
+            half = netlist.add('XOR', a, b)
+            sums.append(netlist.add('XOR', half, carry, output=name))
+            carry = netlist.add('OR', netlist.add('AND', a, b), netlist.add('AND', half, carry),
+                                output='c_out' if name_outputs and i == len(netlist.inputs) // 2 - 1 else None)
+    return sums, carry
+
+def carry_select_netlist(width: int, block_size: int = None) -> Netlist:
+    """Carry-select adder: every block past the first is added for carry-in 0 and 1,
+    and the real block carry picks the result through a multiplexer.
+
+    block_size defaults to about sqrt(width), which balances the ripple
+    inside a block against the chain of block multiplexers.
+    """
+    block_size = block_size or max(1, math.isqrt(width))
+    netlist = Netlist(f'carry_select_adder_{width}', _adder_inputs(width))
+    _, carry = _ripple_block(netlist, range(min(block_size, width)), 'c_in', name_outputs=True)
+    for start in range(block_size, width, block_size):
+        bits = range(start, min(start + block_size, width))
+        sums0, carry0 = _ripple_block(netlist, bits, None, 0)
+        sums1, carry1 = _ripple_block(netlist, bits, None, 1)
+        select_low = netlist.add('NOT', carry)
+        for i, s0, s1 in zip(bits, sums0, sums1):
+            netlist.add('OR', netlist.add('AND', s0, select_low), netlist.add('AND', s1, carry), output=f"s{i}")
+        # carry1 is 1 whenever carry0 is, so c = carry0 | carry1 & carry
+        carry = netlist.add('OR', carry0, netlist.add('AND', carry1, carry),
+                            output='c_out' if bits.stop == width else None)
+    return netlist.set_outputs(*(f"s{i}" for i in range(width)), 'c_out')
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+ADDER_BUILDERS: Dict[str, AdderBuilder] = {
+    'ripple': ripple_carry_netlist,
+    'carry-lookahead': carry_lookahead_netlist,
+    'carry-select': carry_select_netlist,
+    'brent-kung': brent_kung_netlist,
+    'kogge-stone': kogge_stone_netlist,
+}
+
+class AdderReport(NamedTuple):
+    """Size and speed of one adder design at one width."""
+    design: str
+    width: int
+    gates: int
+    gate_counts: Dict[str, int]
+    depth: int
+    delay: float
+    critical_path: Tuple[str, ...]
+
+def analyze_adder(design: str, width: int, delays: Dict[str, float] = None) -> AdderReport:
+    """Build one adder and measure it with linear-time passes over its netlist."""
+    if design not in ADDER_BUILDERS:
+        raise ValueError(f"Unknown adder design: {design} (choose from {', '.join(ADDER_BUILDERS)})")
+    netlist = ADDER_BUILDERS[design](width)
+    delay, path = netlist.critical_path(delays)
+    return AdderReport(design, width, len(netlist.gates), netlist.gate_counts(),
+                       netlist.depth, delay, tuple(path))
+
+def compare_adders(widths: Sequence[int], designs: Sequence[str] = None,
+                   delays: Dict[str, float] = None) -> List[AdderReport]:
+    """Analyze every design at every width."""
+    designs = list(ADDER_BUILDERS) if designs is None else designs
+    return [analyze_adder(design, width, delays) for width in widths for design in designs]
+
+def render_adder_comparison(reports: Sequence[AdderReport], out: TextIO = None) -> None:
+    """Write the reports as a side-by-side table to out (stdout by default)."""
+    lines = ["\n=== Adder Architecture Comparison ===",
+             f"{'Width':>6}  {'Design':<16} {'Gates':>8} {'Depth':>6} {'Delay':>8}"]
+    previous = None
+    for report in reports:
+        if previous is not None and report.width != previous:
+            lines.append('')
+        previous = report.width
+        lines.append(f"{report.width:>6}  {report.design:<16} {report.gates:>8} "
+                     f"{report.depth:>6} {report.delay:>8.2f}")
+    lines.append("\nDelay is in nominal gate delays along the critical path.")
+    (out or sys.stdout).write('\n'.join(lines) + '\n')
+
+def show_adder_comparison(widths: Sequence[int] = (8, 16, 32, 64, 128, 256, 512, 1024)) -> None:
+    """Display gate count, depth and critical-path delay of every adder design."""
+    render_adder_comparison(compare_adders(widths))
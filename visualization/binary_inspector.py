@@ -0,0 +1,109 @@
+# =========================================
+# File: binary_inspector.py
+# Description:
+#   xxd-style viewer that renders byte ranges
+#   of a memory-mapped file as grouped binary,
+#   hex and octal
+# =========================================
+
+import mmap
+import os
+from typing import Iterator
+
+from core.number_conversion import format_bits
+from core.terminal import get_render_context
+
+def _check_range(offset: int, length: int = None) -> None:
+    if offset < 0:
+        raise ValueError("offset must be non-negative")
+    if length is not None and length < 0:
+        raise ValueError("length must be non-negative")
+
+class BinaryFileInspector:
+    """Read-only, memory-mapped view of a file.
+
+    Only the bytes of the window being rendered are touched, so opening a
+    multi-gigabyte file costs no more than the lines shown. Slices are
+    memoryviews over the mapping and never copy the data.
+    """
+
+    def __init__(self, path: str, bytes_per_line: int = 4, group_size: int = 4, colored: bool = None):
+        if bytes_per_line <= 0:
+            raise ValueError("bytes_per_line must be positive")
+        if group_size <= 0 or 8 % group_size:
+            raise ValueError("group_size must divide 8 (1, 2, 4 or 8)")
+        self.path = path
+        self.bytes_per_line = bytes_per_line
+        self.group_size = group_size
+        # By default color follows the terminal's capabilities
+        self.colored = get_render_context().color if colored is None else colored
+        self._file = open(path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        # mmap refuses empty files, so those get an empty view instead
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._view = memoryview(self._map) if self._map is not None else memoryview(b'')
+
+    def __enter__(self) -> 'BinaryFileInspector':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping; views returned by window() must be released first."""
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def window(self, offset: int, length: int) -> memoryview:
+        """Return a zero-copy view of length bytes starting at offset."""
+        _check_range(offset, length)
+        return self._view[offset:offset + length]
+
+    def render_line(self, offset: int, data: memoryview) -> str:
+        """Render one line: offset, grouped binary, hex and octal."""
+        line_bits = self.bytes_per_line * 8
+        binary = format_bits(int.from_bytes(data, 'big'), len(data) * 8, self.group_size, self.colored,
+                             stride=self.group_size)
+        # Pad short final lines so the hex and octal columns stay aligned
+        plain_width = line_bits + line_bits // self.group_size - 1
+        binary += ' ' * (plain_width - (len(data) * 8 + len(data) * 8 // self.group_size - 1))
+        hex_bytes = data.hex(' ') if data else ''
+        octal = ' '.join(format(byte, '03o') for byte in data)
+        return (f"{offset:08x}: {binary}  {hex_bytes:<{self.bytes_per_line * 3 - 1}}  "
+                f"{octal}")
+
+    def lines(self, offset: int = 0, length: int = None) -> Iterator[str]:
+        """Yield rendered lines for a byte range, reading the mapping lazily."""
+        _check_range(offset, length)
+        end = self.size if length is None else min(self.size, offset + length)
+        for start in range(offset, end, self.bytes_per_line):
+            data = self._view[start:min(start + self.bytes_per_line, end)]
+            try:
+                yield self.render_line(start, data)
+            finally:
+                data.release()
+
+    def render(self, offset: int = 0, length: int = None) -> str:
+        """Render a byte range as one block of text."""
+        return '\n'.join(self.lines(offset, length))
+
+    def pages(self, lines_per_page: int = 16, offset: int = 0) -> Iterator[str]:
+        """Yield the file one page at a time, rendering each only when requested."""
+        if lines_per_page <= 0:
+            raise ValueError("lines_per_page must be positive")
+        _check_range(offset)
+        page_bytes = lines_per_page * self.bytes_per_line
+        for start in range(offset, self.size, page_bytes):
+            yield self.render(start, page_bytes)
+
+def show_binary_file(path: str, offset: int = 0, length: int = 256,
+                     bytes_per_line: int = 4, colored: bool = None, group_size: int = 4) -> None:
+    """Print a byte range of a file in the inspector layout."""
+    # Checked before the file is opened, so bad arguments print nothing
+    _check_range(offset, length)
+    with BinaryFileInspector(path, bytes_per_line, group_size, colored) as inspector:
+        print(f"\n=== {path} ({inspector.size} bytes) ===")
+        for line in inspector.lines(offset, length):
+            print(line)
@@ -0,0 +1,83 @@
+# =========================================
+# File: bitslice.py
+# Description:
+#   NumPy uint64 bit-sliced input patterns:
+#   64 test vectors per word, millions per
+#   pass of a compiled netlist
+# =========================================
+
+from typing import List, Sequence, Tuple
+import numpy as np
+
+WORD_BITS = 64
+ALL_ONES = np.uint64(0xFFFF_FFFF_FFFF_FFFF)
+
+# Lane patterns of inputs 0-5 inside one word: bit k of _LOW_PATTERNS[i] is bit i of k
+_LOW_PATTERNS = (
+    0xAAAA_AAAA_AAAA_AAAA,
+    0xCCCC_CCCC_CCCC_CCCC,
+    0xF0F0_F0F0_F0F0_F0F0,
+    0xFF00_FF00_FF00_FF00,
+    0xFFFF_0000_FFFF_0000,
+    0xFFFF_FFFF_0000_0000,
+)
+
+def word_count(count: int) -> int:
+    """Number of 64-lane words needed to enumerate every combination of count inputs."""
+    return max(1, (1 << count) // WORD_BITS)
+
+def exhaustive_words(count: int, start: int = 0, stop: int = None) -> List[np.ndarray]:
+    """Bit-sliced uint64 patterns for input combinations start*64 .. stop*64 - 1.
+
+    Lane k of word w holds combination w * 64 + k, with input i taken from
+    bit i of that number, so splitting [0, word_count(count)) into ranges
+    splits the enumeration into independent chunks. With fewer than six
+    inputs the lanes of the single word repeat the combinations.
+    """
+    stop = word_count(count) if stop is None else stop
+    if not 0 <= start <= stop <= word_count(count):
+        raise ValueError(f"word range must lie within [0, {word_count(count)}]")
+    indices = np.arange(start, stop, dtype=np.uint64)
+    words = []
+    for i in range(count):
+        if i < len(_LOW_PATTERNS):
+            words.append(np.full(len(indices), _LOW_PATTERNS[i], dtype=np.uint64))
+        else:
+            words.append(((indices >> np.uint64(i - len(_LOW_PATTERNS))) & np.uint64(1)) * ALL_ONES)
+    return words
+
+def combination_numbers(start: int, stop: int) -> np.ndarray:
+    """The combination number of every lane of words start .. stop - 1, shape (words, 64)."""
+    base = np.arange(start, stop, dtype=np.uint64)[:, None] * np.uint64(WORD_BITS)
+    return base + np.arange(WORD_BITS, dtype=np.uint64)
+
+def pack_words(bits: np.ndarray) -> np.ndarray:
+    """Pack a (words, 64) array of 0/1 lane values into uint64 words (lane 0 = LSB)."""
+    bits = np.asarray(bits).reshape(-1, WORD_BITS).astype(bool, copy=False)
+    return np.packbits(bits, axis=1, bitorder='little').view('<u8').ravel().astype(np.uint64, copy=False)
+
+def unpack_words(words: np.ndarray) -> np.ndarray:
+    """Inverse of pack_words: a (words, 64) uint8 array of 0/1 lane values."""
+    words = np.ascontiguousarray(words, dtype='<u8')
+    return np.unpackbits(words.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+
+def pack_values(values: np.ndarray, bits: int) -> np.ndarray:
+    """Bit-slice per-lane values: row j of the result holds bit j of every lane as uint64 words.
+
+    values has shape (words, 64); bits is the number of low bits kept.
+    """
+    values = np.asarray(values).reshape(-1, WORD_BITS)
+    # Narrow the lanes first: each pass below then touches fewer bytes
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if bits <= np.iinfo(dtype).bits:
+            values = values.astype(dtype)
+            break
+    packed = np.empty((bits, len(values)), dtype=np.uint64)
+    for j in range(bits):
+        lane_bits = (values & values.dtype.type(1 << j)).astype(bool)
+        packed[j] = np.packbits(lane_bits, axis=1, bitorder='little').view('<u8').ravel()
+    return packed
+
+def evaluate_words(evaluate, words: Sequence[np.ndarray]) -> Tuple[np.ndarray, ...]:
+    """Run a compiled netlist over uint64 word arrays, 64 vectors per element."""
+    return evaluate(*words, mask=ALL_ONES)
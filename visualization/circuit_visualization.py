@@ -4,97 +4,471 @@
 #   Circuit visualization components for binary operations
 # =========================================
 
-from typing import List, Tuple
+import functools
+import random
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, TextIO, Tuple, Union
+from core.bitvector import BitVector
 from core.number_conversion import Colors
+from core.instrumentation import instrument
+from visualization.netlist import Netlist, full_adder_netlist, half_adder_netlist, ripple_carry_netlist
 
-def show_half_adder(a: int, b: int) -> None:
-    """Visualize a half adder circuit with given inputs."""
-    sum_bit = a ^ b  # XOR
-    carry = a & b    # AND
-    
-    print("\n=== Half Adder Circuit ===")
-    print("Inputs:")
-    print(f"A = {a}")
-    print(f"B = {b}")
-    
-    print("\nCircuit Diagram:")
-    print("   A ─┬─[XOR]─── Sum")
-    print("      │")
-    print("   B ─┴─[AND]─── Carry")
-    
-    print("\nResults:")
-    print(f"Sum:   {sum_bit}")
-    print(f"Carry: {carry}")
+# Gate-level models compiled once; each call is a single generated function
+_HALF_ADDER = half_adder_netlist().compile()
+_FULL_ADDER = full_adder_netlist().compile()
 
-def show_full_adder(a: int, b: int, c_in: int) -> None:
-    """Visualize a full adder circuit with given inputs."""
-    # First half adder
-    sum1 = a ^ b
-    carry1 = a & b
-    
-    # Second half adder
-    sum_out = sum1 ^ c_in
-    carry2 = sum1 & c_in
-    
-    # OR gate for final carry
-    carry_out = carry1 | carry2
-    
-    print("\n=== Full Adder Circuit ===")
-    print("Inputs:")
-    print(f"A:      {a}")
-    print(f"B:      {b}")
-    print(f"Carry_in: {c_in}")
-    
-    print("\nCircuit Diagram:")
-    print("   A ─┬─[XOR]─┬─[XOR]─── Sum")
-    print("      │       │")
-    print("   B ─┴─[AND]─┤")
-    print("              │")
-    print("   Cin ──────[AND]─[OR]── Carry_out")
-    
-    print("\nResults:")
-    print(f"Sum:        {sum_out}")
-    print(f"Carry_out:  {carry_out}")
+@dataclass(frozen=True)
+class HalfAdderResult:
+    """Inputs and outputs of a half adder."""
+    __slots__ = ('a', 'b', 'sum', 'carry')
+    a: int
+    b: int
+    sum: int
+    carry: int
 
-def show_ripple_carry_adder(a: str, b: str) -> None:
-    """Visualize a ripple carry adder for two binary numbers."""
+@dataclass(frozen=True)
+class FullAdderResult:
+    """Inputs, internal signals and outputs of a full adder."""
+    __slots__ = ('a', 'b', 'c_in', 'sum1', 'carry1', 'carry2', 'sum', 'carry_out')
+    a: int
+    b: int
+    c_in: int
+    sum1: int
+    carry1: int
+    carry2: int
+    sum: int
+    carry_out: int
+
+@dataclass(frozen=True)
+class AdderStage:
+    """One full adder of a ripple carry adder; index is the string position."""
+    __slots__ = ('position', 'index', 'a', 'b', 'carry_in', 'sum', 'carry_out')
+    position: int
+    index: int
+    a: int
+    b: int
+    carry_in: int
+    sum: int
+    carry_out: int
+
+@dataclass(frozen=True)
+class RippleCarryResult:
+    """Zero-padded operands, per-bit stages (LSB first) and the final sum."""
+    __slots__ = ('a', 'b', 'stages', 'carry_out', 'result')
+    a: str
+    b: str
+    stages: Tuple[AdderStage, ...]
+    carry_out: int
+    result: str
+
+@instrument
+def half_adder(a: int, b: int) -> HalfAdderResult:
+    """Compute a half adder."""
+    return HalfAdderResult(a, b, *_HALF_ADDER(a, b))
+
+@instrument
+def full_adder(a: int, b: int, c_in: int) -> FullAdderResult:
+    """Compute a full adder from two half adders and an OR gate."""
+    return FullAdderResult(a, b, c_in, *_FULL_ADDER(a, b, c_in))
+
+@instrument
+def ripple_carry_adder(a: Union[str, BitVector], b: Union[str, BitVector]) -> RippleCarryResult:
+    """Add two binary strings (or BitVectors) one full adder at a time."""
+    a, b = str(a), str(b)
     # Ensure equal length
     max_len = max(len(a), len(b))
     a = a.zfill(max_len)
     b = b.zfill(max_len)
     
-    print("\n=== Ripple Carry Adder ===")
-    print(f"A: {a}")
-    print(f"B: {b}")
-    
-    # Process each bit
-    result = ""
+    stages = []
+    sum_bits = []
     carry = 0
-    print("\nBit-by-bit addition:")
-    
     for i in range(max_len-1, -1, -1):
         bit_a = int(a[i])
         bit_b = int(b[i])
-        
-        # Show full adder for this position
-        print(f"\nPosition {max_len-i-1} Full Adder:")
-        print(f"A[{i}] = {bit_a}")
-        print(f"B[{i}] = {bit_b}")
-        print(f"Carry_in = {carry}")
-        
-        # Calculate results
-        current_sum = bit_a ^ bit_b ^ carry
-        carry = (bit_a & bit_b) | (carry & (bit_a ^ bit_b))
-        
-        result = str(current_sum) + result
-        print(f"Sum = {current_sum}")
-        print(f"Carry_out = {carry}")
+        _, _, _, current_sum, carry_out = _FULL_ADDER(bit_a, bit_b, carry)
+        stages.append(AdderStage(max_len-i-1, i, bit_a, bit_b, carry, current_sum, carry_out))
+        sum_bits.append(str(current_sum))
+        carry = carry_out
     
     if carry:
-        result = "1" + result
-    
-    print("\nFinal Result:")
-    print(result)
+        sum_bits.append("1")
+    return RippleCarryResult(a, b, tuple(stages), carry, ''.join(reversed(sum_bits)))
+
+@functools.lru_cache(maxsize=None)
+def ripple_carry_circuit(width: int) -> Netlist:
+    """The width-bit ripple carry netlist, built and compiled once per width."""
+    netlist = ripple_carry_netlist(width)
+    netlist.compile()
+    return netlist
+
+@instrument
+def ripple_carry_adder_batch(a_values: Sequence[int], b_values: Sequence[int], width: int,
+                             carry_in: Union[int, Sequence[int]] = 0) -> List[int]:
+    """Add many pairs of width-bit operands in one bit-sliced pass of the gate netlist.
+
+    Each lane of the packed wires is an independent test vector, so the
+    cost is one pass over the gates regardless of how many pairs are given.
+    Returns the (width + 1)-bit sums.
+    """
+    if len(a_values) != len(b_values):
+        raise ValueError("a_values and b_values must have the same length")
+    if isinstance(carry_in, int):
+        carry_in = [carry_in] * len(a_values)
+    mask = (1 << width) - 1
+    vectors = [(a & mask) | (b & mask) << width | (c & 1) << (2 * width)
+               for a, b, c in zip(a_values, b_values, carry_in)]
+    return ripple_carry_circuit(width).evaluate_batch(vectors)
+
+def render_half_adder(result: HalfAdderResult, out: TextIO = None) -> None:
+    """Write the half adder diagram and results to out (stdout by default)."""
+    (out or sys.stdout).write(
+        "\n=== Half Adder Circuit ===\n"
+        "Inputs:\n"
+        f"A = {result.a}\n"
+        f"B = {result.b}\n"
+        "\nCircuit Diagram:\n"
+        "   A ─┬─[XOR]─── Sum\n"
+        "      │\n"
+        "   B ─┴─[AND]─── Carry\n"
+        "\nResults:\n"
+        f"Sum:   {result.sum}\n"
+        f"Carry: {result.carry}\n"
+    )
+
+def render_full_adder(result: FullAdderResult, out: TextIO = None) -> None:
+    """Write the full adder diagram and results to out (stdout by default)."""
+    (out or sys.stdout).write(
+        "\n=== Full Adder Circuit ===\n"
+        "Inputs:\n"
+        f"A:      {result.a}\n"
+        f"B:      {result.b}\n"
+        f"Carry_in: {result.c_in}\n"
+        "\nCircuit Diagram:\n"
+        "   A ─┬─[XOR]─┬─[XOR]─── Sum\n"
+        "      │       │\n"
+        "   B ─┴─[AND]─┤\n"
+        "              │\n"
+        "   Cin ──────[AND]─[OR]── Carry_out\n"
+        "\nResults:\n"
+        f"Sum:        {result.sum}\n"
+        f"Carry_out:  {result.carry_out}\n"
+    )
+
+def render_ripple_carry_adder(result: RippleCarryResult, out: TextIO = None) -> None:
+    """Write the bit-by-bit ripple carry addition to out (stdout by default)."""
+    parts = [
+        "\n=== Ripple Carry Adder ===\n",
+        f"A: {result.a}\n",
+        f"B: {result.b}\n",
+        "\nBit-by-bit addition:\n",
+    ]
+    for stage in result.stages:
+        parts.append(
+            f"\nPosition {stage.position} Full Adder:\n"
+            f"A[{stage.index}] = {stage.a}\n"
+            f"B[{stage.index}] = {stage.b}\n"
+            f"Carry_in = {stage.carry_in}\n"
+            f"Sum = {stage.sum}\n"
+            f"Carry_out = {stage.carry_out}\n"
+        )
+    parts.append(f"\nFinal Result:\n{result.result}\n")
+    (out or sys.stdout).write(''.join(parts))
+
+@dataclass(frozen=True)
+class WideAdderResult:
+    """Ripple carry addition computed with whole-word integer operations.
+
+    carries has width + 1 bits: bit i is the carry into position i (bit 0
+    is carry_in) and the top bit is the carry out.
+    """
+    __slots__ = ('a', 'b', 'carry_in', 'sum', 'carries')
+    a: BitVector
+    b: BitVector
+    carry_in: int
+    sum: BitVector
+    carries: BitVector
+
+    @property
+    def width(self) -> int:
+        return self.sum.width
+
+    @property
+    def carry_out(self) -> int:
+        return self.carries[self.width]
+
+def _as_vector(bits: Union[str, BitVector]) -> BitVector:
+    return bits if isinstance(bits, BitVector) else BitVector.from_string(bits)
+
+@instrument
+def wide_ripple_carry_adder(a: Union[str, BitVector], b: Union[str, BitVector],
+                            carry_in: int = 0) -> WideAdderResult:
+    """Simulate a ripple carry adder of any width without a per-bit loop.
+
+    One big-integer addition gives every sum bit; the carry into each
+    position is the bit where a + b + carry_in differs from a ^ b.
+    """
+    if carry_in not in (0, 1):
+        raise ValueError(f"carry_in must be 0 or 1, got {carry_in}")
+    a, b = _as_vector(a), _as_vector(b)
+    width = max(a.width, b.width)
+    total = a.value + b.value + carry_in
+    carries = total ^ a.value ^ b.value
+    return WideAdderResult(a, b, carry_in, BitVector(total, width), BitVector(carries, width + 1))
+
+def _abbreviate(text: str, keep: int = 16) -> str:
+    """Shorten long digit strings to their first and last keep digits."""
+    if len(text) <= 2 * keep + 3:
+        return text
+    return f"{text[:keep]}...{text[-keep:]} ({len(text)} digits)"
+
+def _longest_run(bits: str) -> Tuple[int, int]:
+    """Length and LSB-first start position of the longest run of 1s in an MSB-first string."""
+    best_length, best_end, offset = 0, 0, 0
+    for run in bits.split('0'):
+        if len(run) > best_length:
+            best_length, best_end = len(run), offset + len(run)
+        offset += len(run) + 1
+    return best_length, len(bits) - best_end
+
+def render_wide_adder(result: WideAdderResult, out: TextIO = None, window: Tuple[int, int] = None) -> None:
+    """Write a summary of a wide addition, plus bit positions window[0]..window[1] if given."""
+    width = result.width
+    digits = (width + 3) // 4
+
+    def hex_digits(value: int) -> str:
+        return _abbreviate(format(value, f'0{digits}X'))
+
+    # Carries into positions 1..width, i.e. the carry out of every stage
+    stage_carries = str(result.carries[1:])
+    chain, chain_start = _longest_run(stage_carries)
+    parts = [
+        f"\n=== Wide Ripple Carry Adder ({width} bits) ===\n",
+        f"A:         0x{hex_digits(result.a.value)}\n",
+        f"B:         0x{hex_digits(result.b.value)}\n",
+        f"Carry_in:  {result.carry_in}\n",
+        f"Sum:       0x{hex_digits(result.sum.value)}\n",
+        f"Carry_out: {result.carry_out}\n",
+        f"Stages producing a carry: {stage_carries.count('1')} of {width}\n",
+    ]
+    if chain:
+        parts.append(f"Longest carry chain: {chain} stages (positions {chain_start}-{chain_start + chain - 1})\n")
+    else:
+        parts.append("Longest carry chain: none\n")
+
+    if window is not None:
+        if len(window) != 2 or window[0] > window[1]:
+            raise ValueError(f"window must be (low, high) with low <= high, got {window}")
+        low, high = max(0, window[0]), min(width - 1, window[1])
+        if low <= high:
+            parts.append(f"\nPositions {high} to {low}:\n")
+            parts.append("Position   A  B  Cin  Sum  Cout\n")
+            span = high - low + 1
+            a_bits = str(BitVector(result.a.value >> low, span))
+            b_bits = str(BitVector(result.b.value >> low, span))
+            sum_bits = str(result.sum[low:high + 1])
+            carry_bits = str(result.carries[low:high + 2])
+            for i in range(span):
+                position = high - i
+                parts.append(f"{position:>8}   {a_bits[i]}  {b_bits[i]}  {carry_bits[i + 1]:>3}"
+                             f"  {sum_bits[i]:>3}  {carry_bits[i]:>4}\n")
+    (out or sys.stdout).write(''.join(parts))
+
+@dataclass(frozen=True)
+class IncrementalUpdate:
+    """The stages re-evaluated (LSB first) after one input of an IncrementalRippleAdder changed."""
+    __slots__ = ('input', 'position', 'value', 'stages', 'carry_out')
+    input: str
+    position: int
+    value: int
+    stages: Tuple[AdderStage, ...]
+    carry_out: int
+
+# Maps the ASCII digits of a bit string to bit values for bytearray storage
+_DIGIT_VALUES = bytes.maketrans(b'01', b'\x00\x01')
+_VALUE_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+class IncrementalRippleAdder:
+    """A ripple carry adder that keeps its state between input changes.
+
+    Operand bits, sums and the carry into every stage are stored LSB first
+    in bytearrays. Changing one input bit re-evaluates that stage and then
+    only the following stages whose carry-in changed, so the cost of an
+    update is the length of the affected carry chain, not the width.
+    """
+
+    def __init__(self, a: Union[str, BitVector], b: Union[str, BitVector], carry_in: int = 0):
+        a, b = _as_vector(a), _as_vector(b)
+        width = max(a.width, b.width)
+        self.width = width
+        self._a = self._bits(BitVector(a.value, width))
+        self._b = self._bits(BitVector(b.value, width))
+        # The initial state comes from one whole-word addition
+        wide = wide_ripple_carry_adder(BitVector(a.value, width), BitVector(b.value, width), carry_in & 1)
+        self._sums = self._bits(wide.sum)
+        self._carries = self._bits(wide.carries)
+
+    @staticmethod
+    def _bits(vector: BitVector) -> bytearray:
+        return bytearray(str(vector)[::-1].encode('ascii').translate(_DIGIT_VALUES))
+
+    @staticmethod
+    def _vector(bits: bytearray) -> BitVector:
+        return BitVector.from_string(bytes(bits[::-1]).translate(_VALUE_DIGITS).decode('ascii'))
+
+    @property
+    def a(self) -> BitVector:
+        return self._vector(self._a)
+
+    @property
+    def b(self) -> BitVector:
+        return self._vector(self._b)
+
+    @property
+    def sum(self) -> BitVector:
+        return self._vector(self._sums)
+
+    @property
+    def carry_in(self) -> int:
+        return self._carries[0]
+
+    @property
+    def carry_out(self) -> int:
+        return self._carries[self.width]
+
+    def set_bit(self, operand: str, position: int, value: int) -> IncrementalUpdate:
+        """Set bit position (0 = LSB) of operand 'a' or 'b' and re-evaluate the affected stages."""
+        if operand not in ('a', 'b'):
+            raise ValueError("operand must be 'a' or 'b'")
+        if not 0 <= position < self.width:
+            raise IndexError("bit position out of range")
+        bits = self._a if operand == 'a' else self._b
+        value &= 1
+        if bits[position] == value:
+            return IncrementalUpdate(operand, position, value, (), self.carry_out)
+        bits[position] = value
+        return IncrementalUpdate(operand, position, value, self._propagate(position), self.carry_out)
+
+    def toggle(self, operand: str, position: int) -> IncrementalUpdate:
+        """Flip one operand bit."""
+        bits = self._a if operand == 'a' else self._b
+        if not 0 <= position < self.width:
+            raise IndexError("bit position out of range")
+        return self.set_bit(operand, position, bits[position] ^ 1)
+
+    def set_carry_in(self, value: int) -> IncrementalUpdate:
+        """Change the carry into stage 0."""
+        value &= 1
+        if self._carries[0] == value:
+            return IncrementalUpdate('c_in', 0, value, (), self.carry_out)
+        self._carries[0] = value
+        return IncrementalUpdate('c_in', 0, value, self._propagate(0), self.carry_out)
+
+    def _propagate(self, position: int) -> Tuple[AdderStage, ...]:
+        """Re-evaluate stages from position up until a carry-out comes out unchanged."""
+        a_bits, b_bits, sums, carries = self._a, self._b, self._sums, self._carries
+        width = self.width
+        stages = []
+        carry = carries[position]
+        while position < width:
+            a, b = a_bits[position], b_bits[position]
+            _, _, _, total, carry_out = _FULL_ADDER(a, b, carry)
+            sums[position] = total
+            stages.append(AdderStage(position, width - 1 - position, a, b, carry, total, carry_out))
+            if carries[position + 1] == carry_out:
+                break
+            carries[position + 1] = carry = carry_out
+            position += 1
+        return tuple(stages)
+
+    def sum_hex(self, keep: int = 16) -> str:
+        """The sum as hex digits, shortened like _abbreviate, reading only the bits shown.
+
+        A wide sum costs O(keep), not O(width): the first and last keep digits
+        are built straight from the stored sum bits.
+        """
+        digits = (self.width + 3) // 4
+        if digits <= 2 * keep + 3:
+            return self._hex(0, digits)
+        return f"{self._hex(digits - keep, digits)}...{self._hex(0, keep)} ({digits} digits)"
+
+    def _hex(self, start: int, stop: int) -> str:
+        """Hex digits start..stop - 1 (0 = least significant) of the sum, MSB first."""
+        bits = bytes(self._sums[4 * start:4 * stop][::-1]).translate(_VALUE_DIGITS)
+        return format(int(bits, 2) if bits else 0, f'0{stop - start}X')
+
+    def result(self) -> RippleCarryResult:
+        """The full adder state in the form ripple_carry_adder returns."""
+        width = self.width
+        stages = tuple(AdderStage(i, width - 1 - i, self._a[i], self._b[i], self._carries[i],
+                                  self._sums[i], self._carries[i + 1]) for i in range(width))
+        total = str(self.sum)
+        if self.carry_out:
+            total = '1' + total
+        return RippleCarryResult(str(self.a), str(self.b), stages, self.carry_out, total)
+
+def render_incremental_update(update: IncrementalUpdate, adder: IncrementalRippleAdder,
+                              out: TextIO = None) -> None:
+    """Write only the stages an update re-evaluated, plus the new sum, to out (stdout by default)."""
+    name = 'Carry_in' if update.input == 'c_in' else f"{update.input.upper()}[{update.position}]"
+    parts = [f"\n=== Incremental Update: {name} = {update.value} ===\n"]
+    if update.stages:
+        first, last = update.stages[0].position, update.stages[-1].position
+        parts.append(f"Re-evaluated {len(update.stages)} of {adder.width} stages (positions {first}-{last})\n")
+        parts.append("Position   A  B  Cin  Sum  Cout\n")
+        for stage in update.stages:
+            parts.append(f"{stage.position:>8}   {stage.a}  {stage.b}  {stage.carry_in:>3}"
+                         f"  {stage.sum:>3}  {stage.carry_out:>4}\n")
+    else:
+        parts.append("Input unchanged: no stages re-evaluated\n")
+    parts.append(f"Sum:       0x{adder.sum_hex()}\n"
+                 f"Carry_out: {adder.carry_out}\n")
+    (out or sys.stdout).write(''.join(parts))
+
+@instrument
+def show_half_adder(a: int, b: int) -> None:
+    """Visualize a half adder circuit with given inputs."""
+    render_half_adder(half_adder(a, b))
+
+@instrument
+def show_full_adder(a: int, b: int, c_in: int) -> None:
+    """Visualize a full adder circuit with given inputs."""
+    render_full_adder(full_adder(a, b, c_in))
+
+@instrument
+def show_ripple_carry_adder(a: Union[str, BitVector], b: Union[str, BitVector]) -> None:
+    """Visualize a ripple carry adder for two binary numbers."""
+    render_ripple_carry_adder(ripple_carry_adder(a, b))
+
+@instrument
+def show_wide_ripple_carry_adder(a: Union[str, BitVector], b: Union[str, BitVector],
+                                 window: Tuple[int, int] = None) -> None:
+    """Summarize a ripple carry addition of any width, optionally showing a window of positions."""
+    render_wide_adder(wide_ripple_carry_adder(a, b), window=window)
+
+def _read_operand(prompt: str, width: int) -> BitVector:
+    """Read a 0x hex or binary operand; an empty answer picks random bits."""
+    text = input(prompt).strip()
+    if not text:
+        return BitVector(random.getrandbits(width), width)
+    value = int(text[2:], 16) if text.lower().startswith('0x') else BitVector.from_string(text).value
+    if value >> width:
+        raise ValueError(f"operand {text} does not fit in {width} bits")
+    return BitVector(value, width)
+
+def _parse_window(text: str, width: int) -> Optional[Tuple[int, int]]:
+    """Parse 'low-high' or a single position into an inclusive window; empty text means none."""
+    text = text.strip()
+    if not text:
+        return None
+    parts = text.split('-')
+    if len(parts) > 2:
+        raise ValueError(f"expected a position or a range like 0-15, got {text!r}")
+    low, high = int(parts[0]), int(parts[-1])
+    if not 0 <= low <= high < width:
+        raise ValueError(f"positions must satisfy 0 <= low <= high < {width}")
+    return low, high
 
 def show_circuit_menu() -> None:
     """Display menu for circuit visualization options."""
@@ -103,9 +477,15 @@ def show_circuit_menu() -> None:
         print("1. Half Adder")
         print("2. Full Adder")
         print("3. Ripple Carry Adder")
-        print("4. Return to Main Menu")
+        print("4. Wide Ripple Carry Adder (summary)")
+        print("5. Verify N-bit Adder (all inputs)")
+        print("6. Compare Adder Architectures")
+        print("7. Adder Timing Simulation")
+        print("8. Flip Bits of a Ripple Carry Adder (incremental)")
+        print("9. Compare Multipliers (array, Wallace, Dadda)")
+        print("10. Return to Main Menu")
         
-        choice = input("\nEnter choice (1-4): ")
+        choice = input("\nEnter choice (1-10): ")
         
         if choice == "1":
             a = int(input("Enter first bit (0/1): "))
@@ -130,6 +510,73 @@ def show_circuit_menu() -> None:
                 continue
             show_ripple_carry_adder(a, b)
         elif choice == "4":
+            try:
+                width = int(input("Enter width in bits: "))
+                if width <= 0:
+                    raise ValueError("width must be positive")
+                a = _read_operand("Enter first operand (0x hex or binary, Enter for random): ", width)
+                b = _read_operand("Enter second operand (0x hex or binary, Enter for random): ", width)
+                window = _parse_window(input("Bit positions to show (e.g. 0-15, Enter for none): "), width)
+            except ValueError as e:
+                print(f"Error: Invalid input - {e}")
+                continue
+            show_wide_ripple_carry_adder(a, b, window)
+        elif choice == "5":
+            try:
+                width = int(input("Enter adder width in bits (1-12): "))
+                if not 1 <= width <= 12:
+                    raise ValueError("width must be between 1 and 12")
+            except ValueError as e:
+                print(f"Error: Invalid input - {e}")
+                continue
+            # NumPy is only needed here, so import on demand
+            from visualization.verification import render_verification, verify_adder
+            render_verification(verify_adder(width))
+        elif choice == "6":
+            from visualization.adder_models import show_adder_comparison
+            show_adder_comparison()
+        elif choice == "7":
+            from visualization.adder_models import ADDER_BUILDERS
+            from visualization.timing import render_timing_report, simulate_adder
+            try:
+                width = int(input("Enter adder width in bits: "))
+                design = input(f"Design ({', '.join(ADDER_BUILDERS)}) [ripple]: ").strip() or 'ripple'
+                stimuli = int(input("Number of random input changes [1000]: ").strip() or 1000)
+                if width <= 0 or stimuli <= 0:
+                    raise ValueError("width and number of changes must be positive")
+                report = simulate_adder(width, design, stimuli)
+            except ValueError as e:
+                print(f"Error: Invalid input - {e}")
+                continue
+            render_timing_report(report)
+        elif choice == "8":
+            try:
+                width = int(input("Enter width in bits: "))
+                if width <= 0:
+                    raise ValueError("width must be positive")
+                a = _read_operand("Enter first operand (0x hex or binary, Enter for random): ", width)
+                b = _read_operand("Enter second operand (0x hex or binary, Enter for random): ", width)
+            except ValueError as e:
+                print(f"Error: Invalid input - {e}")
+                continue
+            adder = IncrementalRippleAdder(a, b)
+            while True:
+                command = input("\nFlip a bit ('a 5', 'b 0' or 'c' for carry in, Enter to stop): ").split()
+                if not command:
+                    break
+                try:
+                    if command[0] == 'c':
+                        update = adder.set_carry_in(adder.carry_in ^ 1)
+                    else:
+                        update = adder.toggle(command[0], int(command[1]))
+                except (ValueError, IndexError) as e:
+                    print(f"Error: Invalid input - {e}")
+                    continue
+                render_incremental_update(update, adder)
+        elif choice == "9":
+            from visualization.multipliers import show_multiplier_comparison
+            show_multiplier_comparison()
+        elif choice == "10":
             break
         
         input("\nPress Enter to continue...") 
\ No newline at end of file
@@ -0,0 +1,92 @@
+# =========================================
+# File: ieee754_visualization.py
+# Description:
+#   IEEE-754 field breakdown as a result object
+#   and a renderer for the main menu display
+# =========================================
+
+import sys
+from dataclasses import dataclass
+from typing import TextIO
+
+from core.ieee754 import decode, decompose, get_format
+
+@dataclass(frozen=True)
+class IEEE754Visualization:
+    """A value split into the fields of an IEEE-754 format, ready to render.
+
+    exponent_bias is the exponent the value is scaled by: raw - bias for
+    normal numbers and the fixed 1 - bias for zeros and subnormals.
+    encoded is the value the bits actually hold after rounding.
+    """
+    __slots__ = ('value', 'title', 'width', 'bias', 'sign', 'exponent', 'mantissa', 'sign_value',
+                 'exponent_raw', 'exponent_bias', 'mantissa_value', 'hidden_bit', 'category', 'encoded')
+    value: float
+    title: str
+    width: int
+    bias: int
+    sign: str
+    exponent: str
+    mantissa: str
+    sign_value: int
+    exponent_raw: int
+    exponent_bias: int
+    mantissa_value: float
+    hidden_bit: str
+    category: str
+    encoded: float
+
+def ieee754_visualization(value: float, fmt: str = 'binary32') -> IEEE754Visualization:
+    """Compute the IEEE-754 fields shown by show_ieee754_visualization."""
+    float_format = get_format(fmt)
+    ieee = decompose(value, float_format)
+    category = ieee['category']
+    hidden_bit = '0' if category in ('zero', 'subnormal') else '1'
+    exponent = 1 - float_format.bias if hidden_bit == '0' else ieee['exponent_bias']
+    return IEEE754Visualization(value, float_format.title, float_format.width, float_format.bias,
+                                ieee['sign'], ieee['exponent'], ieee['mantissa'], ieee['sign_value'],
+                                ieee['exponent_raw'], exponent, ieee['mantissa_value'],
+                                hidden_bit, category, decode(int(ieee['binary'], 2), float_format))
+
+def _exponent_lines(ieee: IEEE754Visualization) -> str:
+    if ieee.category == 'normal':
+        return (f"   - Bias: {ieee.bias}\n"
+                f"   - Actual exponent: {ieee.exponent_raw} - {ieee.bias} = {ieee.exponent_bias}\n")
+    if ieee.category in ('zero', 'subnormal'):
+        return (f"   - Bias: {ieee.bias}\n"
+                f"   - All zeros: {ieee.category}, hidden bit 0 and exponent fixed at "
+                f"1 - {ieee.bias} = {ieee.exponent_bias}\n")
+    return "   - All ones: reserved for infinities and NaNs\n"
+
+def _value_lines(ieee: IEEE754Visualization) -> str:
+    if ieee.category == 'infinity':
+        return f"Mantissa 0 with an all-ones exponent encodes {'-' if ieee.sign_value else '+'}infinity\n= {ieee.encoded}\n"
+    if ieee.category == 'nan':
+        kind = 'quiet' if ieee.mantissa[0] == '1' else 'signaling'
+        return f"A non-zero mantissa with an all-ones exponent encodes a {kind} NaN\n= nan\n"
+    return (f"(-1)^{ieee.sign_value} × {ieee.mantissa_value} × 2^{ieee.exponent_bias}\n"
+            f"= {ieee.encoded}\n")
+
+def render_ieee754_visualization(ieee: IEEE754Visualization, out: TextIO = None) -> None:
+    """Write the IEEE-754 layout and breakdown to out (stdout by default)."""
+    if ieee.category in ('infinity', 'nan'):
+        mantissa = f"3. Mantissa: {ieee.mantissa} ({'zero' if ieee.category == 'infinity' else 'NaN payload'})\n"
+    else:
+        mantissa = f"3. Mantissa: {ieee.hidden_bit}.{ieee.mantissa} = {ieee.mantissa_value}\n"
+    (out or sys.stdout).write(
+        f"\n=== IEEE-754 {ieee.title} Visualization ===\n"
+        f"Converting {ieee.value} to IEEE-754 format\n\n"
+        # Show binary layout
+        f"Binary layout ({ieee.width} bits):\n"
+        "| Sign | Exponent | Mantissa |\n"
+        "|-------|-----------|-----------|\n"
+        f"|   {ieee.sign}   | {ieee.exponent} | {ieee.mantissa} |\n"
+        # Show detailed breakdown
+        "\nComponent breakdown:\n"
+        f"1. Sign bit: {ieee.sign} ({'negative' if ieee.sign_value else 'positive'})\n"
+        f"2. Exponent: {ieee.exponent} (binary) = {ieee.exponent_raw} (decimal)\n"
+        + _exponent_lines(ieee) + mantissa +
+        # Show final calculation
+        f"\nFinal value ({ieee.category}):\n"
+        + _value_lines(ieee)
+    )
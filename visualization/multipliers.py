@@ -0,0 +1,278 @@
+# =========================================
+# File: multipliers.py
+# Description:
+#   Array, Wallace-tree and Dadda-tree
+#   multipliers built from the full adder
+#   cell, with size, depth and throughput
+# =========================================
+
+import functools
+import re
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+from visualization.adder_models import ADDER_BUILDERS
+from visualization.netlist import Netlist, full_adder_netlist, half_adder_netlist
+
+# Bits of equal weight waiting to be added, indexed by weight
+Columns = List[List[str]]
+
+class _CellBuilder:
+    """Adds half and full adder cells to a netlist, numbering their instances."""
+
+    def __init__(self, netlist: Netlist):
+        self.netlist = netlist
+        self.full = full_adder_netlist()
+        self.half = half_adder_netlist()
+        self.count = 0
+
+    def add(self, bits: Sequence[str], sum_name: str = None) -> Tuple[str, Optional[str]]:
+        """Add 1-3 bits of one weight: returns the sum and the carry (None for a single bit).
+
+        sum_name, if given, names the sum wire of the cell.
+        """
+        if len(bits) == 1:
+            return bits[0], None
+        self.count += 1
+        if len(bits) == 2:
+            names = self.netlist.instantiate(self.half, {'a': bits[0], 'b': bits[1]}, f"ha{self.count}_",
+                                             rename={'sum': sum_name} if sum_name else None)
+            return names['sum'], names['carry']
+        names = self.netlist.instantiate(self.full, {'a': bits[0], 'b': bits[1], 'c_in': bits[2]},
+                                         f"fa{self.count}_", rename={'sum': sum_name} if sum_name else None)
+        return names['sum'], names['carry_out']
+
+def _multiplier_inputs(width_a: int, width_b: int) -> List[str]:
+    if width_a <= 0 or width_b <= 0:
+        raise ValueError("operand widths must be positive")
+    return [f"a{i}" for i in range(width_a)] + [f"b{j}" for j in range(width_b)]
+
+def _partial_products(netlist: Netlist, width_a: int, width_b: int) -> Columns:
+    """AND every a_i with every b_j, grouped into columns by weight i + j."""
+    columns: Columns = [[] for _ in range(width_a + width_b)]
+    for j in range(width_b):
+        for i in range(width_a):
+            columns[i + j].append(netlist.add('AND', f"a{i}", f"b{j}", output=f"pp{i}_{j}"))
+    return columns
+
+def _final_adder(netlist: Netlist, cells: _CellBuilder, columns: Columns, final_adder: str) -> Netlist:
+    """Add the last two rows (columns of at most two bits) into the product outputs.
+
+    'ripple' chains adder cells from the lowest column with two bits; any
+    other name instantiates that design from adder_models as the
+    carry-propagate adder. Sums are named p{weight}; columns below the
+    first two-bit column pass their single bit straight to the output.
+    """
+    if final_adder != 'ripple' and final_adder not in ADDER_BUILDERS:
+        raise ValueError(f"Unknown final adder: {final_adder} (choose from {', '.join(ADDER_BUILDERS)})")
+    start = next((k for k, column in enumerate(columns) if len(column) > 1), len(columns))
+    outputs = [column[0] if column else None for column in columns[:start]]
+    width = len(columns) - start
+    if final_adder == 'ripple' or width == 0:
+        carry = None
+        for k in range(start, len(columns)):
+            total, carry = cells.add(columns[k] + ([carry] if carry else []), sum_name=f"p{k}")
+            outputs.append(total)
+    else:
+        rows = {'c_in': None}
+        for i, column in enumerate(columns[start:]):
+            rows[f"a{i}"] = column[0] if column else None
+            rows[f"b{i}"] = column[1] if len(column) > 1 else None
+        if None in rows.values():
+            # Missing bits are a constant 0, which XOR of a wire with itself gives without a glitch
+            zero = netlist.add('XOR', 'a0', 'a0', output='zero')
+            rows = {name: wire or zero for name, wire in rows.items()}
+        names = netlist.instantiate(ADDER_BUILDERS[final_adder](width), rows, 'cpa_',
+                                    rename={f"s{i}": f"p{start + i}" for i in range(width)})
+        outputs += [names[f"s{i}"] for i in range(width)]
+    if None in outputs:
+        # Only the top bit of a 1 x 1 product can be empty: it is always 0
+        outputs[outputs.index(None)] = netlist.add('XOR', 'a0', 'a0', output=f"p{outputs.index(None)}")
+    return netlist.set_outputs(*outputs)
+
+def array_multiplier_netlist(width_a: int, width_b: int = None, final_adder: str = 'ripple') -> Netlist:
+    """Carry-save array multiplier: one row of adder cells per partial-product row.
+
+    Each row adds a partial-product row to the running sums and the carries
+    of the row above (carries move one column left per row instead of
+    rippling), and a final ripple carry adder merges the last sums and carries.
+    """
+    width_b = width_a if width_b is None else width_b
+    netlist = Netlist(f'array_multiplier_{width_a}x{width_b}', _multiplier_inputs(width_a, width_b))
+    cells = _CellBuilder(netlist)
+    _partial_products(netlist, width_a, width_b)
+    rows = [[f"pp{i}_{j}" for i in range(width_a)] for j in range(width_b)]
+    sums: Dict[int, str] = {i: wire for i, wire in enumerate(rows[0])}
+    carries: Dict[int, str] = {}
+    columns: Columns = [[] for _ in range(width_a + width_b)]
+    for j in range(1, width_b):
+        # The lowest running sum is final once no later row reaches its weight
+        columns[j - 1].append(sums.pop(j - 1))
+        new_sums, new_carries = {}, {}
+        for i, product in enumerate(rows[j]):
+            weight = i + j
+            bits = [product] + [wire for wire in (sums.get(weight), carries.get(weight)) if wire]
+            new_sums[weight], carry = cells.add(bits)
+            if carry:
+                new_carries[weight + 1] = carry
+        sums, carries = new_sums, new_carries
+    for weight, wire in sums.items():
+        columns[weight].append(wire)
+    for weight, wire in carries.items():
+        columns[weight].append(wire)
+    return _final_adder(netlist, cells, columns, final_adder)
+
+def _wallace_stage(cells: _CellBuilder, columns: Columns) -> Columns:
+    """One Wallace layer: full adders on every group of three bits, a half adder on a leftover pair."""
+    reduced: Columns = [[] for _ in columns]
+    for k, column in enumerate(columns):
+        index = 0
+        while len(column) - index >= 3 or (len(column) - index == 2 and len(column) > 2):
+            group = column[index:index + 3]
+            index += len(group)
+            total, carry = cells.add(group)
+            reduced[k].append(total)
+            if k + 1 < len(reduced):
+                reduced[k + 1].append(carry)
+        reduced[k].extend(column[index:])
+    return reduced
+
+def wallace_multiplier_netlist(width_a: int, width_b: int = None, final_adder: str = 'ripple') -> Netlist:
+    """Wallace-tree multiplier: reduce every column as early as possible, then one final adder."""
+    width_b = width_a if width_b is None else width_b
+    netlist = Netlist(f'wallace_multiplier_{width_a}x{width_b}', _multiplier_inputs(width_a, width_b))
+    cells = _CellBuilder(netlist)
+    columns = _partial_products(netlist, width_a, width_b)
+    while max(len(column) for column in columns) > 2:
+        columns = _wallace_stage(cells, columns)
+    return _final_adder(netlist, cells, columns, final_adder)
+
+def _dadda_heights(tallest: int) -> List[int]:
+    """Dadda's stage targets 2, 3, 4, 6, 9, 13, ... below the tallest column, largest first."""
+    heights = [2]
+    while heights[-1] * 3 // 2 < tallest:
+        heights.append(heights[-1] * 3 // 2)
+    return heights[::-1]
+
+def dadda_multiplier_netlist(width_a: int, width_b: int = None, final_adder: str = 'ripple') -> Netlist:
+    """Dadda-tree multiplier: reduce each column only as far as the next target height.
+
+    Uses fewer adder cells than Wallace for the same number of layers.
+    """
+    width_b = width_a if width_b is None else width_b
+    netlist = Netlist(f'dadda_multiplier_{width_a}x{width_b}', _multiplier_inputs(width_a, width_b))
+    cells = _CellBuilder(netlist)
+    columns = _partial_products(netlist, width_a, width_b)
+    for target in _dadda_heights(max(len(column) for column in columns)):
+        reduced: Columns = [[] for _ in columns]
+        for k, column in enumerate(columns):
+            bits = list(column)
+            # reduced[k] already holds the carries produced by column k - 1 in this stage
+            while len(bits) + len(reduced[k]) > target:
+                excess = len(bits) + len(reduced[k]) - target
+                group = bits[:3] if excess >= 2 else bits[:2]
+                del bits[:len(group)]
+                total, carry = cells.add(group)
+                reduced[k].append(total)
+                if k + 1 < len(reduced):
+                    reduced[k + 1].append(carry)
+            reduced[k].extend(bits)
+        columns = reduced
+    return _final_adder(netlist, cells, columns, final_adder)
+
+MULTIPLIER_BUILDERS: Dict[str, Callable[..., Netlist]] = {
+    'array': array_multiplier_netlist,
+    'wallace': wallace_multiplier_netlist,
+    'dadda': dadda_multiplier_netlist,
+}
+
+# Wire names of the cells added by _CellBuilder; a cell's carry always keeps its prefix
+_CELL_WIRE = re.compile(r'(fa|ha)\d+_')
+
+class MultiplierReport(NamedTuple):
+    """Size, speed and simulation throughput of one multiplier design."""
+    design: str
+    final_adder: str
+    width: int
+    gates: int
+    gate_counts: Dict[str, int]
+    full_adders: int
+    half_adders: int
+    depth: int
+    delay: float
+    throughput: float
+
+def multiplier_netlist(design: str, width: int, final_adder: str = 'ripple') -> Netlist:
+    """A width x width 'array', 'wallace' or 'dadda' multiplier; final_adder is 'ripple' or an ADDER_BUILDERS name."""
+    if design not in MULTIPLIER_BUILDERS:
+        raise ValueError(f"Unknown multiplier design: {design} (choose from {', '.join(MULTIPLIER_BUILDERS)})")
+    return MULTIPLIER_BUILDERS[design](width, final_adder=final_adder)
+
+def measure_throughput(netlist: Netlist, words: int = 1 << 10, seed: int = 0) -> float:
+    """Products per second of the compiled netlist on random bit-sliced NumPy words."""
+    import numpy as np
+    from visualization.bitslice import WORD_BITS, evaluate_words
+
+    rng = np.random.default_rng(seed)
+    inputs = [rng.integers(0, 1 << 64, words, dtype=np.uint64) for _ in netlist.inputs]
+    evaluate = netlist.compile()
+    start = time.perf_counter()
+    evaluate_words(evaluate, inputs)
+    return words * WORD_BITS / (time.perf_counter() - start)
+
+def analyze_multiplier(design: str, width: int, final_adder: str = 'ripple', delays: Dict[str, float] = None,
+                       throughput: bool = True) -> MultiplierReport:
+    """Build a width x width multiplier and report its size, depth, delay and throughput."""
+    netlist = multiplier_netlist(design, width, final_adder)
+    delay, _ = netlist.critical_path(delays)
+    counts = netlist.gate_counts()
+    cells = {match.group(0) for match in map(_CELL_WIRE.match, (gate.output for gate in netlist.gates)) if match}
+    full_adders = sum(cell.startswith('fa') for cell in cells)
+    return MultiplierReport(design, final_adder, width, len(netlist.gates), counts, full_adders, len(cells) - full_adders,
+                            netlist.depth, delay, measure_throughput(netlist) if throughput else 0.0)
+
+def multiplier_reference(width: int, numbers):
+    """Integer product for the a0.., b0.. multiplier input order (NumPy uint64 arrays)."""
+    import numpy as np
+
+    mask = np.uint64((1 << width) - 1)
+    return (numbers & mask) * (numbers >> np.uint64(width) & mask)
+
+def verify_multiplier(design: str, width: int, final_adder: str = 'ripple', processes: int = None):
+    """Check a width x width multiplier on every one of its 2**(2*width) input pairs.
+
+    The pairs are checked in bit-sliced chunks, so wide checks can be
+    spread over a process pool with processes > 1.
+    """
+    from visualization.verification import verify_exhaustive
+
+    if 2 * width > 64:
+        raise ValueError("products wider than 64 bits cannot be checked against NumPy")
+    return verify_exhaustive(multiplier_netlist(design, width, final_adder),
+                             functools.partial(multiplier_reference, width), processes=processes)
+
+def render_multiplier_comparison(reports: Sequence[MultiplierReport], out: TextIO = None) -> None:
+    """Write multiplier reports as a table to out (stdout by default)."""
+    lines = ["\n=== Multiplier Comparison ===",
+             f"{'Size':>7}  {'Design':<8} {'Final adder':<15} {'Gates':>7} {'FA':>5} {'HA':>4} {'Depth':>6} {'Delay':>7} {'Products/s':>12}"]
+    previous = None
+    for report in reports:
+        if previous is not None and report.width != previous:
+            lines.append('')
+        previous = report.width
+        size = f"{report.width}x{report.width}"
+        lines.append(f"{size:>7}  {report.design:<8} {report.final_adder:<15} {report.gates:>7} {report.full_adders:>5} {report.half_adders:>4} "
+                     f"{report.depth:>6} {report.delay:>7.2f} {report.throughput:>12,.0f}")
+    lines.append("\nDelay is in nominal gate delays; products/s is bit-sliced NumPy evaluation.")
+    (out or sys.stdout).write('\n'.join(lines) + '\n')
+
+def show_multiplier_comparison(widths: Sequence[int] = (4, 8, 16, 32),
+                               final_adders: Sequence[str] = ('ripple', 'kogge-stone')) -> None:
+    """Display the array, Wallace and Dadda multipliers side by side.
+
+    The array multiplier always ends in a ripple; the trees are shown
+    with each of final_adders, whose carry chain otherwise dominates.
+    """
+    render_multiplier_comparison([analyze_multiplier(design, width, final_adder)
+                                  for width in widths for design in MULTIPLIER_BUILDERS
+                                  for final_adder in (('ripple',) if design == 'array' else final_adders)])
@@ -0,0 +1,351 @@
+# =========================================
+# File: netlist.py
+# Description:
+#   Gate-level netlists: gates and wires as a
+#   DAG, sorted once and compiled into a flat
+#   Python function; bit-sliced batch evaluation
+# =========================================
+
+from collections import deque
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+# Python operator used to join a gate's inputs; NOT/NAND/NOR/XNOR are
+# inverted by XOR with the lane mask so they work on single bits,
+# bit-sliced ints and NumPy arrays alike
+GATE_OPERATORS = {
+    'AND': '&', 'NAND': '&',
+    'OR': '|', 'NOR': '|',
+    'XOR': '^', 'XNOR': '^',
+    'BUF': '', 'NOT': '',
+}
+INVERTING_GATES = {'NAND', 'NOR', 'XNOR', 'NOT'}
+
+# Nominal propagation delays of two-input gates in gate-delay units: inverting
+# gates are single CMOS stages, AND/OR add an inverter, XOR is the slowest
+GATE_DELAYS = {
+    'BUF': 1.0, 'NOT': 1.0,
+    'NAND': 1.0, 'NOR': 1.0,
+    'AND': 1.5, 'OR': 1.5,
+    'XOR': 2.0, 'XNOR': 2.0,
+}
+# Added per input beyond two, so wide lookahead gates are not free
+FANIN_DELAY = 0.25
+
+def gate_delay(gate: 'Gate', delays: Dict[str, float] = None) -> float:
+    """Propagation delay of one gate under the given (default: nominal) delays."""
+    delays = GATE_DELAYS if delays is None else delays
+    return delays[gate.op] + FANIN_DELAY * max(0, len(gate.inputs) - 2)
+
+# exhaustive_lanes builds Python ints with 2**count bits; beyond this use
+# the NumPy word patterns in visualization.bitslice
+MAX_LANE_INPUTS = 24
+
+def lane_mask(lanes: int) -> int:
+    """An int with a 1 in each of the lowest lanes bits."""
+    return (1 << lanes) - 1
+
+def pack_lanes(vectors: Sequence[int], width: int) -> List[int]:
+    """Transpose input vectors into bit-sliced words.
+
+    Bit i of vectors[k] becomes bit k (lane k) of word i, so word i carries
+    circuit input i for every vector at once.
+    """
+    if width == 0:
+        return []
+    if not vectors:
+        return [0] * width
+    # Lane 0 is the least significant bit, so the last vector comes first
+    rows = [format(vector, f'0{width}b')[-width:] for vector in reversed(vectors)]
+    return [int(''.join(column), 2) for column in reversed(list(zip(*rows)))]
+
+def unpack_lanes(words: Sequence[int], lanes: int) -> List[int]:
+    """Inverse of pack_lanes: one int per lane with bit i taken from words[i]."""
+    if not words:
+        return [0] * lanes
+    rows = [format(int(word) & lane_mask(lanes), f'0{lanes}b') for word in reversed(words)]
+    return [int(''.join(bits), 2) for bits in reversed(list(zip(*rows)))]
+
+def exhaustive_lanes(count: int) -> Tuple[List[int], int]:
+    """Bit-sliced patterns enumerating every combination of count inputs.
+
+    Lane k of the returned words holds input combination k (input i is bit
+    i of k). Returns the words and the mask for the 2**count lanes.
+    """
+    if not 0 <= count <= MAX_LANE_INPUTS:
+        raise ValueError(f"count must be between 0 and {MAX_LANE_INPUTS}")
+    lanes = 1 << count
+    words = []
+    for i in range(count):
+        half = 1 << i
+        # Lanes are written most significant first: ones above zeros in each period
+        words.append(int(('1' * half + '0' * half) * (lanes // (2 * half)), 2))
+    return words, lane_mask(lanes)
+
+class Gate(NamedTuple):
+    """One gate driving a single output wire."""
+    op: str
+    inputs: Tuple[str, ...]
+    output: str
+
+class Netlist:
+    """A combinational circuit built gate by gate.
+
+    Wires are named by strings. Every wire is driven either by a circuit
+    input or by exactly one gate, and the gates must form a DAG. compile()
+    sorts the gates once and generates a function that evaluates them in
+    order with plain bitwise operators.
+    """
+
+    def __init__(self, name: str, inputs: Sequence[str]):
+        self.name = name
+        self.inputs = list(inputs)
+        self.outputs: List[str] = []
+        self.gates: List[Gate] = []
+        self._drivers: Dict[str, Gate] = {}
+        self._input_names = set(self.inputs)
+        self._compiled = None
+        if len(self._input_names) != len(self.inputs):
+            raise ValueError("Duplicate circuit input")
+
+    def add(self, op: str, *inputs: str, output: str = None) -> str:
+        """Add a gate and return the name of its output wire."""
+        op = op.upper()
+        if op not in GATE_OPERATORS:
+            raise ValueError(f"Unknown gate type: {op} (choose from {', '.join(GATE_OPERATORS)})")
+        if op in ('NOT', 'BUF'):
+            if len(inputs) != 1:
+                raise ValueError(f"{op} takes exactly one input")
+        elif not inputs:
+            raise ValueError(f"{op} needs at least one input")
+        if output is None:
+            output = f"_n{len(self.gates)}"
+        if output in self._drivers or output in self._input_names:
+            raise ValueError(f"Wire {output!r} already has a driver")
+        gate = Gate(op, tuple(inputs), output)
+        self.gates.append(gate)
+        self._drivers[output] = gate
+        self._compiled = None
+        return output
+
+    def set_outputs(self, *outputs: str) -> 'Netlist':
+        """Choose the wires returned, in order, by the compiled function."""
+        self.outputs = list(outputs)
+        self._compiled = None
+        return self
+
+    def instantiate(self, circuit: 'Netlist', connections: Dict[str, str], prefix: str,
+                    rename: Dict[str, str] = None) -> Dict[str, str]:
+        """Copy another netlist's gates into this one.
+
+        connections maps the sub-circuit's inputs to wires of this netlist.
+        Internal wires are named prefix + their name, or as given in rename.
+        Returns the mapping of every sub-circuit wire to its name here.
+        """
+        missing = set(circuit.inputs) - set(connections)
+        if missing:
+            raise ValueError(f"Unconnected inputs: {', '.join(sorted(missing))}")
+        rename = rename or {}
+        names = dict(connections)
+        for gate in circuit.gates:
+            names[gate.output] = self.add(gate.op, *(names[wire] for wire in gate.inputs),
+                                          output=rename.get(gate.output, f"{prefix}{gate.output}"))
+        return names
+
+    def topological_order(self) -> List[Gate]:
+        """Return the gates in evaluation order (Kahn's algorithm).
+
+        Raises ValueError for wires with no driver and for combinational loops.
+        """
+        known = set(self.inputs) | set(self._drivers)
+        for gate in self.gates:
+            for wire in gate.inputs:
+                if wire not in known:
+                    raise ValueError(f"Wire {wire!r} (input of {gate.op} -> {gate.output}) has no driver")
+        for wire in self.outputs:
+            if wire not in known:
+                raise ValueError(f"Output {wire!r} has no driver")
+
+        pending = {gate.output: sum(wire in self._drivers for wire in gate.inputs) for gate in self.gates}
+        fanout: Dict[str, List[Gate]] = {}
+        for gate in self.gates:
+            for wire in gate.inputs:
+                fanout.setdefault(wire, []).append(gate)
+        ready = deque(gate for gate in self.gates if pending[gate.output] == 0)
+        order = []
+        while ready:
+            gate = ready.popleft()
+            order.append(gate)
+            for consumer in fanout.get(gate.output, ()):
+                # fanout lists a consumer once per use, matching pending
+                pending[consumer.output] -= 1
+                if pending[consumer.output] == 0:
+                    ready.append(consumer)
+        if len(order) != len(self.gates):
+            raise ValueError(f"Netlist {self.name!r} contains a combinational loop")
+        return order
+
+    def levels(self) -> Dict[str, int]:
+        """Logic depth of every wire: inputs are level 0, a gate is one more than its deepest input."""
+        level = {wire: 0 for wire in self.inputs}
+        for gate in self.topological_order():
+            level[gate.output] = 1 + max(level[wire] for wire in gate.inputs)
+        return level
+
+    @property
+    def depth(self) -> int:
+        """Longest input-to-output path, counted in gates."""
+        level = self.levels()
+        return max((level[wire] for wire in self.outputs), default=0)
+
+    def arrival_times(self, delays: Dict[str, float] = None) -> Dict[str, float]:
+        """Latest time each wire settles when all inputs change at time 0 (one linear pass)."""
+        time = {wire: 0.0 for wire in self.inputs}
+        for gate in self.topological_order():
+            time[gate.output] = max(time[wire] for wire in gate.inputs) + gate_delay(gate, delays)
+        return time
+
+    def critical_path(self, delays: Dict[str, float] = None) -> Tuple[float, List[str]]:
+        """Return the slowest input-to-output delay and the wires along that path."""
+        if not self.outputs:
+            return 0.0, []
+        time = self.arrival_times(delays)
+        wire = max(self.outputs, key=time.__getitem__)
+        path = [wire]
+        while wire in self._drivers:
+            wire = max(self._drivers[wire].inputs, key=time.__getitem__)
+            path.append(wire)
+        return time[path[0]], path[::-1]
+
+    def gate_counts(self) -> Dict[str, int]:
+        """Number of gates of each type."""
+        counts: Dict[str, int] = {}
+        for gate in self.gates:
+            counts[gate.op] = counts.get(gate.op, 0) + 1
+        return counts
+
+    def source(self) -> str:
+        """Generate the Python source of the compiled evaluator."""
+        order = self.topological_order()
+        # Wire names need not be identifiers, so every wire gets a local name
+        local = {wire: f"w{i}" for i, wire in enumerate(self.inputs)}
+        for i, gate in enumerate(order):
+            local[gate.output] = f"g{i}"
+        params = ', '.join(local[wire] for wire in self.inputs)
+        lines = [f"def evaluate({params}{', ' if params else ''}mask=1):"]
+        for gate in order:
+            operands = [local[wire] for wire in gate.inputs]
+            expression = f" {GATE_OPERATORS[gate.op]} ".join(operands) if len(operands) > 1 else operands[0]
+            if gate.op in INVERTING_GATES:
+                expression = f"({expression}) ^ mask"
+            lines.append(f"    {local[gate.output]} = {expression}  # {gate.op} -> {gate.output}")
+        outputs = ', '.join(local[wire] for wire in self.outputs)
+        lines.append(f"    return ({outputs}{',' if len(self.outputs) == 1 else ''})")
+        return '\n'.join(lines) + '\n'
+
+    def compile(self) -> Callable:
+        """Return a function evaluate(*inputs, mask=1) -> tuple of outputs.
+
+        Inputs are passed in the order of self.inputs. Each input may be a
+        single bit, or an int / NumPy array whose bits are independent lanes;
+        mask must then have a 1 in every lane so inverting gates stay in
+        range. The function is generated once and cached until the netlist
+        changes.
+        """
+        if self._compiled is None:
+            source = self.source()
+            namespace: Dict[str, object] = {}
+            exec(compile(source, f"<netlist {self.name}>", 'exec'), namespace)
+            evaluate = namespace['evaluate']
+            evaluate.__name__ = evaluate.__qualname__ = self.name.replace(' ', '_')
+            evaluate.source = source
+            evaluate.inputs = tuple(self.inputs)
+            evaluate.outputs = tuple(self.outputs)
+            self._compiled = evaluate
+        return self._compiled
+
+    def __getstate__(self) -> dict:
+        # Generated functions cannot be pickled; they are rebuilt on first use
+        state = self.__dict__.copy()
+        state['_compiled'] = None
+        return state
+
+    def evaluate_batch(self, vectors: Sequence[int]) -> List[int]:
+        """Evaluate many input vectors in one bit-sliced pass.
+
+        Each vector packs the circuit inputs as an int (bit i = self.inputs[i]);
+        each result packs the outputs the same way (bit j = self.outputs[j]).
+        """
+        words = pack_lanes(vectors, len(self.inputs))
+        outputs = self.compile()(*words, mask=lane_mask(len(vectors)))
+        return unpack_lanes(outputs, len(vectors))
+
+def half_adder_netlist() -> Netlist:
+    """Half adder: sum = a XOR b, carry = a AND b."""
+    netlist = Netlist('half_adder', ['a', 'b'])
+    netlist.add('XOR', 'a', 'b', output='sum')
+    netlist.add('AND', 'a', 'b', output='carry')
+    return netlist.set_outputs('sum', 'carry')
+
+def full_adder_netlist() -> Netlist:
+    """Full adder from two half adders and an OR gate, exposing the internal signals."""
+    netlist = Netlist('full_adder', ['a', 'b', 'c_in'])
+    netlist.instantiate(half_adder_netlist(), {'a': 'a', 'b': 'b'}, 'ha1_',
+                        rename={'sum': 'sum1', 'carry': 'carry1'})
+    netlist.instantiate(half_adder_netlist(), {'a': 'sum1', 'b': 'c_in'}, 'ha2_',
+                        rename={'sum': 'sum', 'carry': 'carry2'})
+    netlist.add('OR', 'carry1', 'carry2', output='carry_out')
+    return netlist.set_outputs('sum1', 'carry1', 'carry2', 'sum', 'carry_out')
+
+def ripple_carry_netlist(width: int) -> Netlist:
+    """width-bit ripple carry adder.
+
+    Inputs a0..a{width-1}, b0..b{width-1} (bit 0 is the LSB) and c_in;
+    outputs s0..s{width-1} and c_out.
+    """
+    if width <= 0:
+        raise ValueError("width must be positive")
+    inputs = [f"a{i}" for i in range(width)] + [f"b{i}" for i in range(width)] + ['c_in']
+    netlist = Netlist(f'ripple_carry_adder_{width}', inputs)
+    cell = full_adder_netlist()
+    carry = 'c_in'
+    for i in range(width):
+        stage = netlist.instantiate(cell, {'a': f"a{i}", 'b': f"b{i}", 'c_in': carry}, f"fa{i}_",
+                                    rename={'sum': f"s{i}", 'carry_out': 'c_out' if i == width - 1 else f"c{i + 1}"})
+        carry = stage['carry_out']
+    return netlist.set_outputs(*(f"s{i}" for i in range(width)), 'c_out')
+
+def mux_netlist(select_bits: int = 1) -> Netlist:
+    """2**select_bits-to-1 multiplexer built as a tree of 2:1 muxes.
+
+    Inputs d0..d{n-1} then s0..s{select_bits-1} (s0 is the LSB of the
+    select value); output y.
+    """
+    if select_bits <= 0:
+        raise ValueError("select_bits must be positive")
+    count = 1 << select_bits
+    selects = [f"s{i}" for i in range(select_bits)]
+    netlist = Netlist(f'mux_{count}to1', [f"d{i}" for i in range(count)] + selects)
+    level = [f"d{i}" for i in range(count)]
+    for bit, select in enumerate(selects):
+        inverted = netlist.add('NOT', select)
+        level = [
+            netlist.add('OR', netlist.add('AND', low, inverted), netlist.add('AND', high, select),
+                        output='y' if len(level) == 2 else None)
+            for low, high in zip(level[::2], level[1::2])
+        ]
+    return netlist.set_outputs('y')
+
+def decoder_netlist(select_bits: int = 2) -> Netlist:
+    """select_bits-to-2**select_bits decoder: output y{i} is 1 when the input value is i.
+
+    Inputs s0..s{select_bits-1} with s0 the LSB.
+    """
+    if select_bits <= 0:
+        raise ValueError("select_bits must be positive")
+    selects = [f"s{i}" for i in range(select_bits)]
+    netlist = Netlist(f'decoder_{select_bits}to{1 << select_bits}', selects)
+    inverted = [netlist.add('NOT', select) for select in selects]
+    for value in range(1 << select_bits):
+        literals = [selects[i] if value >> i & 1 else inverted[i] for i in range(select_bits)]
+        netlist.add('AND' if len(literals) > 1 else 'BUF', *literals, output=f"y{value}")
+    return netlist.set_outputs(*(f"y{i}" for i in range(1 << select_bits)))
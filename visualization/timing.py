@@ -0,0 +1,225 @@
+# =========================================
+# File: timing.py
+# Description:
+#   Event-driven gate-level timing simulation:
+#   propagation delays, settle times and
+#   glitches on every output bit
+# =========================================
+
+import heapq
+import random
+import sys
+import time
+from typing import Dict, Iterable, List, NamedTuple, TextIO, Tuple
+from visualization.netlist import GATE_OPERATORS, INVERTING_GATES, Netlist, gate_delay
+
+# Delays are scheduled in integer ticks so that signals arriving "at the same
+# time" along different paths really coincide; reports convert back to gate delays
+TICKS_PER_DELAY = 1000
+
+class OutputTiming(NamedTuple):
+    """Timing of one output wire over every stimulus applied."""
+    wire: str
+    settle_time: float
+    # Averaged over the stimuli that moved this output (0.0 if none did)
+    mean_settle_time: float
+    transitions: int
+    glitches: int
+
+class StimulusResult(NamedTuple):
+    """What one change of the inputs did to the outputs that moved."""
+    settle_time: float
+    events: int
+    settle_times: Dict[str, float]
+    transitions: Dict[str, int]
+    glitches: Dict[str, int]
+
+class TimingReport(NamedTuple):
+    """Summary of a run of stimuli."""
+    circuit: str
+    stimuli: int
+    events: int
+    elapsed: float
+    outputs: Tuple[OutputTiming, ...]
+
+    @property
+    def settle_time(self) -> float:
+        return max((output.settle_time for output in self.outputs), default=0.0)
+
+    @property
+    def glitches(self) -> int:
+        return sum(output.glitches for output in self.outputs)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed if self.elapsed else float('inf')
+
+def _gate_expression(op: str, operands: List[str]) -> str:
+    expression = f" {GATE_OPERATORS[op]} ".join(operands) if len(operands) > 1 else operands[0]
+    return f"({expression}) ^ 1" if op in INVERTING_GATES else expression
+
+class TimingSimulator:
+    """Transport-delay, event-driven simulator for a Netlist.
+
+    Each gate has a fixed propagation delay (gate_delay of the netlist's
+    delay model). Input changes are queued on a heap; all events at the
+    same tick are applied together and only then are the affected gates
+    re-evaluated, so a gate whose inputs change simultaneously produces a
+    single output event. Every transition on an output is counted: one
+    beyond the net change is a glitch (a hazard pulse).
+    """
+
+    def __init__(self, netlist: Netlist, delays: Dict[str, float] = None):
+        self.netlist = netlist
+        order = netlist.topological_order()
+        self.wires = list(netlist.inputs) + [gate.output for gate in order]
+        self.index = {wire: i for i, wire in enumerate(self.wires)}
+        self.outputs = [self.index[wire] for wire in netlist.outputs]
+        # Position of each wire in the output list, or -1
+        self.output_slot = [-1] * len(self.wires)
+        for n, i in enumerate(self.outputs):
+            self.output_slot[i] = n
+        self.delay_ticks = [round(gate_delay(gate, delays) * TICKS_PER_DELAY) for gate in order]
+        self.gate_outputs = [self.index[gate.output] for gate in order]
+        self.fanout: List[List[int]] = [[] for _ in self.wires]
+        for g, gate in enumerate(order):
+            for wire in dict.fromkeys(gate.inputs):
+                self.fanout[self.index[wire]].append(g)
+        # One small generated function per gate reads the current wire values
+        source = ',\n'.join(
+            "lambda v: " + _gate_expression(gate.op, [f"v[{self.index[wire]}]" for wire in gate.inputs])
+            for gate in order)
+        self.evaluators = eval(compile(f"[{source}]", f"<timing {netlist.name}>", 'eval')) if order else []
+        self.now = 0
+        self.values = [0] * len(self.wires)
+        self.reset()
+
+    def reset(self, inputs: Dict[str, int] = None) -> None:
+        """Set the inputs (default all 0) and let the circuit settle without timing it."""
+        values = self.values
+        for i in range(len(self.netlist.inputs)):
+            values[i] = 0
+        for wire, value in (inputs or {}).items():
+            values[self.index[wire]] = value & 1
+        for g, evaluate in enumerate(self.evaluators):
+            values[self.gate_outputs[g]] = evaluate(values)
+        self.now = 0
+
+    def value(self, wire: str) -> int:
+        return self.values[self.index[wire]]
+
+    def apply(self, inputs: Dict[str, int]) -> StimulusResult:
+        """Change some inputs at the current time and simulate until nothing changes."""
+        values = self.values
+        index = self.index
+        fanout = self.fanout
+        evaluators = self.evaluators
+        gate_outputs = self.gate_outputs
+        delay_ticks = self.delay_ticks
+        projected = list(values)
+        start = self.now
+        # Events are bucketed per tick and the heap holds only the distinct
+        # ticks, so events at the same time cost a list append, not a heap push
+        buckets = {start: [(index[wire], value & 1) for wire, value in inputs.items()
+                           if values[index[wire]] != value & 1]}
+        times = [start]
+        pop, push = heapq.heappop, heapq.heappush
+
+        output_slot = self.output_slot
+        initial = [values[i] for i in self.outputs]
+        transitions = [0] * len(self.outputs)
+        last_change = [start] * len(self.outputs)
+        events = 0
+        while times:
+            now = pop(times)
+            touched = {}
+            for wire, value in buckets.pop(now):
+                events += 1
+                if values[wire] == value:
+                    continue
+                values[wire] = value
+                n = output_slot[wire]
+                if n >= 0:
+                    transitions[n] += 1
+                    last_change[n] = now
+                for g in fanout[wire]:
+                    touched[g] = None
+            for g in touched:
+                out = gate_outputs[g]
+                value = evaluators[g](values)
+                # Transport delay: skip events that would not change the projected value
+                if value != projected[out]:
+                    projected[out] = value
+                    when = now + delay_ticks[g]
+                    bucket = buckets.get(when)
+                    if bucket is None:
+                        bucket = buckets[when] = []
+                        push(times, when)
+                    bucket.append((out, value))
+            self.now = now
+        names = self.netlist.outputs
+        moved = [n for n in range(len(names)) if transitions[n]]
+        settle_times = {names[n]: (last_change[n] - start) / TICKS_PER_DELAY for n in moved}
+        counts = {names[n]: transitions[n] for n in moved}
+        glitches = {}
+        for n in moved:
+            extra = transitions[n] - (values[self.outputs[n]] != initial[n])
+            if extra:
+                glitches[names[n]] = extra
+        return StimulusResult(max(settle_times.values(), default=0.0), events, settle_times, counts, glitches)
+
+    def run(self, stimuli: Iterable[Dict[str, int]]) -> TimingReport:
+        """Apply each stimulus after the previous one has settled and summarize every output."""
+        names = self.netlist.outputs
+        settle = dict.fromkeys(names, 0.0)
+        settle_total = dict.fromkeys(names, 0.0)
+        moved = dict.fromkeys(names, 0)
+        transitions = dict.fromkeys(names, 0)
+        glitches = dict.fromkeys(names, 0)
+        count = events = 0
+        start_time = time.perf_counter()
+        for stimulus in stimuli:
+            result = self.apply(stimulus)
+            count += 1
+            events += result.events
+            for wire, changes in result.transitions.items():
+                transitions[wire] += changes
+            for wire, extra in result.glitches.items():
+                glitches[wire] += extra
+            for wire, when in result.settle_times.items():
+                settle[wire] = max(settle[wire], when)
+                settle_total[wire] += when
+                moved[wire] += 1
+        elapsed = time.perf_counter() - start_time
+        outputs = tuple(OutputTiming(wire, settle[wire], settle_total[wire] / moved[wire] if moved[wire] else 0.0,
+                                     transitions[wire], glitches[wire]) for wire in names)
+        return TimingReport(self.netlist.name, count, events, elapsed, outputs)
+
+def random_adder_stimuli(width: int, count: int, seed: int = None) -> Iterable[Dict[str, int]]:
+    """Random operand pairs (and carry-in) for the a0.., b0.., c_in adder inputs."""
+    rng = random.Random(seed)
+    names = [f"a{i}" for i in range(width)] + [f"b{i}" for i in range(width)] + ['c_in']
+    for _ in range(count):
+        vector = rng.getrandbits(2 * width + 1)
+        yield {name: vector >> i & 1 for i, name in enumerate(names)}
+
+def simulate_adder(width: int, design: str = 'ripple', stimuli: int = 1000, seed: int = None,
+                   delays: Dict[str, float] = None) -> TimingReport:
+    """Time an adder design on random input transitions."""
+    from visualization.adder_models import ADDER_BUILDERS
+    if design not in ADDER_BUILDERS:
+        raise ValueError(f"Unknown adder design: {design} (choose from {', '.join(ADDER_BUILDERS)})")
+    simulator = TimingSimulator(ADDER_BUILDERS[design](width), delays)
+    return simulator.run(random_adder_stimuli(width, stimuli, seed))
+
+def render_timing_report(report: TimingReport, out: TextIO = None) -> None:
+    """Write per-output settle times and glitch counts to out (stdout by default)."""
+    lines = [f"\n=== Timing Simulation: {report.circuit} ===",
+             f"Stimuli: {report.stimuli:,}   Events: {report.events:,}   "
+             f"({report.events_per_second:,.0f} events/s)",
+             f"Worst settle time: {report.settle_time:.2f} gate delays   Total glitches: {report.glitches:,}",
+             f"\n{'Output':<8} {'Settle max':>10} {'Settle avg':>10} {'Transitions':>12} {'Glitches':>9}"]
+    for output in report.outputs:
+        lines.append(f"{output.wire:<8} {output.settle_time:>10.2f} {output.mean_settle_time:>10.2f} "
+                     f"{output.transitions:>12,} {output.glitches:>9,}")
+    (out or sys.stdout).write('\n'.join(lines) + '\n')
@@ -0,0 +1,195 @@
+# =========================================
+# File: verification.py
+# Description:
+#   Exhaustive truth-table and equivalence
+#   checking of netlists with NumPy bit-sliced
+#   chunks and an optional process pool
+# =========================================
+
+import functools
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, TextIO, Tuple, Union
+import numpy as np
+from visualization.bitslice import (
+    combination_numbers,
+    evaluate_words,
+    exhaustive_words,
+    pack_values,
+    word_count
+)
+from visualization.netlist import Netlist, ripple_carry_netlist
+
+# Words per chunk: 8192 words hold 524288 test vectors
+DEFAULT_CHUNK_WORDS = 1 << 13
+
+# Exhaustive checks are refused above this many inputs (2**40 vectors)
+MAX_INPUTS = 40
+
+# Maps the combination numbers of one chunk to the expected output values
+Reference = Callable[[np.ndarray], np.ndarray]
+
+class Counterexample(NamedTuple):
+    """An input combination on which the circuit and the reference disagree."""
+    combination: int
+    inputs: Dict[str, int]
+    expected: int
+    actual: int
+
+class VerificationResult(NamedTuple):
+    """Outcome of an exhaustive check."""
+    circuit: str
+    combinations: int
+    checked: int
+    counterexample: Optional[Counterexample]
+    elapsed: float
+
+    @property
+    def passed(self) -> bool:
+        return self.counterexample is None
+
+    @property
+    def rate(self) -> float:
+        """Test vectors checked per second."""
+        return self.checked / self.elapsed if self.elapsed else float('inf')
+
+def _lane_values(outputs) -> np.ndarray:
+    """Output values (bit j = output j) of every lane, shape (words, 64)."""
+    values = np.zeros((len(outputs[0]), 64), dtype=np.uint64)
+    for j, word in enumerate(outputs):
+        bits = np.unpackbits(np.ascontiguousarray(word, dtype='<u8').view(np.uint8).reshape(-1, 8),
+                             axis=1, bitorder='little')
+        values |= bits.astype(np.uint64) << np.uint64(j)
+    return values
+
+def _expected_words(reference: Union[Netlist, Reference], words, start: int, stop: int,
+                    output_count: int) -> Tuple[np.ndarray, ...]:
+    if isinstance(reference, Netlist):
+        return evaluate_words(reference.compile(), words)
+    numbers = combination_numbers(start, stop)
+    if len(words) < 6:
+        # Fewer than six inputs repeat combinations across the lanes
+        numbers &= np.uint64((1 << len(words)) - 1)
+    return tuple(pack_values(reference(numbers), output_count))
+
+def check_chunk(netlist: Netlist, reference: Union[Netlist, Reference], start: int,
+                stop: int) -> Optional[Counterexample]:
+    """Check input combinations start*64 .. stop*64 - 1; return the first mismatch."""
+    count = len(netlist.inputs)
+    words = exhaustive_words(count, start, stop)
+    actual = evaluate_words(netlist.compile(), words)
+    expected = _expected_words(reference, words, start, stop, len(actual))
+    diff = np.zeros(stop - start, dtype=np.uint64)
+    for got, want in zip(actual, expected):
+        diff |= got ^ want
+    bad = np.flatnonzero(diff)
+    if not len(bad):
+        return None
+    # Decode only the first failing word back into per-lane values
+    index = int(bad[0])
+    lanes = int(diff[index])
+    lane = (lanes & -lanes).bit_length() - 1
+    got = int(_lane_values([word[index:index + 1] for word in actual])[0, lane])
+    want = int(_lane_values([word[index:index + 1] for word in expected])[0, lane])
+    combination = (start + index) * 64 + lane
+    if count < 6:
+        combination &= (1 << count) - 1
+    inputs = {name: combination >> i & 1 for i, name in enumerate(netlist.inputs)}
+    return Counterexample(combination, inputs, want, got)
+
+def _chunks(total: int, chunk_words: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, total, chunk_words):
+        yield start, min(total, start + chunk_words)
+
+_worker_state: Tuple = ()
+
+def _init_worker(netlist: Netlist, reference) -> None:
+    global _worker_state
+    _worker_state = (netlist, reference)
+
+def _check_in_worker(bounds: Tuple[int, int]) -> Optional[Counterexample]:
+    netlist, reference = _worker_state
+    return check_chunk(netlist, reference, *bounds)
+
+def verify_exhaustive(netlist: Netlist, reference: Union[Netlist, Reference],
+                      chunk_words: int = DEFAULT_CHUNK_WORDS, processes: int = None) -> VerificationResult:
+    """Compare a netlist with a reference on every input combination.
+
+    reference is either another netlist with the same input and output
+    names in the same order (an equivalence check) or a function taking an array of combination
+    numbers (bit i = netlist.inputs[i]) and returning the expected output
+    values (bit j = netlist.outputs[j]) as uint64. The combinations are
+    checked in chunks of 64 * chunk_words vectors, spread over a process
+    pool when processes > 1 (the reference must then be picklable).
+    Stops at the first counterexample, which is the lowest-numbered one.
+    """
+    count = len(netlist.inputs)
+    if count > MAX_INPUTS:
+        raise ValueError(f"{count} inputs is too many to enumerate (limit {MAX_INPUTS})")
+    if isinstance(reference, Netlist) and (tuple(reference.inputs), tuple(reference.outputs)) != (
+            tuple(netlist.inputs), tuple(netlist.outputs)):
+        raise ValueError("Reference netlist must have the same inputs and outputs, in the same order")
+    if not isinstance(reference, Netlist) and len(netlist.outputs) > 64:
+        raise ValueError("Function references support at most 64 outputs")
+    total = word_count(count)
+    chunks = list(_chunks(total, chunk_words))
+    start_time = time.perf_counter()
+    counterexample = None
+    checked = 0
+    if processes and processes > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(processes, initializer=_init_worker,
+                                 initargs=(netlist, reference)) as pool:
+            futures = [pool.submit(_check_in_worker, bounds) for bounds in chunks]
+            # Results are read in chunk order, so the first mismatch seen is the lowest
+            for bounds, future in zip(chunks, futures):
+                found = future.result()
+                checked += (bounds[1] - bounds[0]) * 64
+                if found is not None:
+                    counterexample = found
+                    # Cancelled by hand: shutdown(cancel_futures=True) needs Python 3.9
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    else:
+        for bounds in chunks:
+            counterexample = check_chunk(netlist, reference, *bounds)
+            checked += (bounds[1] - bounds[0]) * 64
+            if counterexample is not None:
+                break
+    combinations = 1 << count
+    return VerificationResult(netlist.name, combinations, min(checked, combinations),
+                              counterexample, time.perf_counter() - start_time)
+
+def adder_reference(width: int, numbers: np.ndarray) -> np.ndarray:
+    """Integer addition for the ripple_carry_netlist input order: a, then b, then c_in."""
+    mask = np.uint64((1 << width) - 1)
+    shift = np.uint64(width)
+    return (numbers & mask) + (numbers >> shift & mask) + (numbers >> (shift + shift))
+
+def verify_adder(width: int, netlist: Netlist = None, chunk_words: int = DEFAULT_CHUNK_WORDS,
+                 processes: int = None) -> VerificationResult:
+    """Check a width-bit adder on all 2**(2*width + 1) inputs against integer addition.
+
+    netlist defaults to the ripple carry adder built from full adder cells;
+    any netlist with inputs a0.., b0.., c_in and outputs s0.., c_out works.
+    """
+    netlist = ripple_carry_netlist(width) if netlist is None else netlist
+    return verify_exhaustive(netlist, functools.partial(adder_reference, width), chunk_words, processes)
+
+def render_verification(result: VerificationResult, out: TextIO = None) -> None:
+    """Write a verification summary to out (stdout by default)."""
+    lines = [f"\n=== Exhaustive check: {result.circuit} ===",
+             f"Combinations: {result.combinations:,}",
+             f"Checked:      {result.checked:,} in {result.elapsed:.3f}s ({result.rate:,.0f} vectors/s)"]
+    if result.passed:
+        lines.append("Result:       PASS - matches the reference on every input")
+    else:
+        example = result.counterexample
+        inputs = ' '.join(f"{name}={bit}" for name, bit in example.inputs.items())
+        lines += ["Result:       FAIL",
+                  f"First counterexample (combination {example.combination}):",
+                  f"  inputs:   {inputs}",
+                  f"  expected: {example.expected} ({example.expected:b})",
+                  f"  actual:   {example.actual} ({example.actual:b})"]
+    (out or sys.stdout).write('\n'.join(lines) + '\n')